@@ -1,3 +1,4 @@
+from kiali_qe.components.enums import IstioConfigValidation
 from kiali_qe.entities import EntityBase
 from kiali_qe.utils import is_equal
 
@@ -80,6 +81,60 @@ class IstioConfigDetails(EntityBase):
         return True
 
 
+class IstioConfigValidationResult(EntityBase):
+    """
+    Validation of Istio Config parsed from a single rest response.
+
+    Args:
+        validation: IstioConfigValidation severity
+        messages: messages of validation checks
+        references: IstioConfig objects referenced by the validation
+    """
+
+    def __init__(self, validation, messages=None, references=None):
+        self.validation = validation
+        self.messages = messages or []
+        self.references = references or []
+
+    def __str__(self):
+        return 'validation:{}, messages:{}, references:{}'.format(
+            self.validation, self.messages, self.references)
+
+    def __repr__(self):
+        return "{}({}, {}, {})".format(
+            type(self).__name__, repr(self.validation), repr(self.messages),
+            repr(self.references))
+
+    def is_equal(self, other):
+        return isinstance(other, IstioConfigValidationResult)\
+         and self.validation == other.validation\
+         and is_equal(self.messages, other.messages)
+
+    @classmethod
+    def get_from_rest(cls, validation):
+        if not validation:
+            return IstioConfigValidationResult(validation=IstioConfigValidation.NA)
+        _checks = validation['checks'] if validation['checks'] else []
+        if len(_checks) > 0:
+            if 'error' in set(_check['severity'] for _check in _checks):
+                _validation = IstioConfigValidation.NOT_VALID
+            else:
+                _validation = IstioConfigValidation.WARNING
+        else:
+            _validation = IstioConfigValidation.VALID
+        _references = []
+        if 'references' in validation and validation['references']:
+            for _reference in validation['references']:
+                _references.append(IstioConfig(
+                    name=_reference['name'],
+                    namespace=_reference['namespace'],
+                    object_type=_reference['objectType']))
+        return IstioConfigValidationResult(
+            validation=_validation,
+            messages=[_check['message'] for _check in _checks],
+            references=_references)
+
+
 class Action(EntityBase):
 
     def __init__(self, handler, instances):
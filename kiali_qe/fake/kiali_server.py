@@ -0,0 +1,593 @@
+import argparse
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from kiali_qe.fake.mesh import SIDECAR_CONTAINER, SyntheticMesh, match_labels, select
+from kiali_qe.rest.kiali_api import ISTIO_CONFIG_LIST_KEYS
+
+BASE_PATH = '/api'
+
+SWAGGER_PATH = '/swagger.json'
+
+# operationId, http method and path of the served Kiali endpoints, and FakeKialiApi method
+OPERATIONS = [
+    ('getStatus', 'get', '/status', 'get_status'),
+    ('authenticate', 'post', '/authenticate', 'authenticate'),
+    ('namespaceList', 'get', '/namespaces', 'namespace_list'),
+    ('namespaceUpdate', 'patch', '/namespaces/{namespace}', 'namespace_update'),
+    ('namespaceHealth', 'get', '/namespaces/{namespace}/health', 'namespace_health'),
+    ('serviceList', 'get', '/namespaces/{namespace}/services', 'service_list'),
+    ('serviceDetails', 'get', '/namespaces/{namespace}/services/{service}', 'service_details'),
+    ('serviceHealth', 'get', '/namespaces/{namespace}/services/{service}/health',
+     'service_health'),
+    ('workloadList', 'get', '/namespaces/{namespace}/workloads', 'workload_list'),
+    ('workloadDetails', 'get', '/namespaces/{namespace}/workloads/{workload}',
+     'workload_details'),
+    ('workloadUpdate', 'patch', '/namespaces/{namespace}/workloads/{workload}',
+     'workload_update'),
+    ('workloadHealth', 'get', '/namespaces/{namespace}/workloads/{workload}/health',
+     'workload_health'),
+    ('appList', 'get', '/namespaces/{namespace}/apps', 'app_list'),
+    ('appDetails', 'get', '/namespaces/{namespace}/apps/{app}', 'app_details'),
+    ('appHealth', 'get', '/namespaces/{namespace}/apps/{app}/health', 'app_health'),
+    ('istioConfigList', 'get', '/namespaces/{namespace}/istio', 'istio_config_list'),
+    ('istioConfigCreate', 'post', '/namespaces/{namespace}/istio/{object_type}',
+     'istio_config_create'),
+    ('istioConfigDetails', 'get', '/namespaces/{namespace}/istio/{object_type}/{object}',
+     'istio_config_details'),
+    ('istioConfigDelete', 'delete', '/namespaces/{namespace}/istio/{object_type}/{object}',
+     'istio_config_delete'),
+]
+
+
+def _details_key(list_key):
+    """ Returns istioConfigDetails key of istioConfigList key, e.g. serviceEntry """
+    return list_key[:-3] + 'y' if list_key.endswith('ies') else list_key[:-1]
+
+
+# kind -> config type of the url, istioConfigList key and istioConfigDetails key
+ISTIO_KINDS = OrderedDict(
+    (_object_type.text, (_config_type, _list_key, _details_key(_list_key)))
+    for _list_key, _object_type, _config_type in ISTIO_CONFIG_LIST_KEYS)
+
+
+def get_swagger():
+    """ Returns swagger file of the served endpoints, used by kiali-client to build urls """
+    _paths = {}
+    for _operation_id, _http_method, _path, _ in OPERATIONS:
+        _paths.setdefault(_path, {})[_http_method] = {
+            'operationId': _operation_id,
+            'parameters': [{'name': _name, 'in': 'path', 'required': True, 'type': 'string'}
+                           for _name in re.findall('{(\\w+)}', _path)],
+            'responses': {'200': {'description': 'OK'}}}
+    return {'swagger': '2.0',
+            'info': {'title': 'Fake Kiali', 'version': 'fake'},
+            'basePath': BASE_PATH,
+            'paths': _paths}
+
+
+def _not_found(message):
+    return 404, {'error': message}
+
+
+def _merge_patch(target, patch):
+    """ Applies json merge patch to target dictionary, None values remove keys """
+    for _key, _value in patch.items():
+        if _value is None:
+            target.pop(_key, None)
+        elif isinstance(_value, dict) and isinstance(target.get(_key), dict):
+            _merge_patch(target[_key], _value)
+        else:
+            target[_key] = _value
+
+
+def _has_sidecar(pods):
+    return bool(pods) and all(
+        any(_container['name'] == SIDECAR_CONTAINER for _container in _pod['spec']['containers'])
+        for _pod in pods)
+
+
+def _request_codes(error_rate):
+    if error_rate:
+        return {'http': {'200': round(1 - error_rate, 3), '500': error_rate}}
+    return {'http': {'200': 1.0}}
+
+
+class FakeKialiApi(object):
+    """
+    Kiali REST API computed from SyntheticMesh, without HTTP.
+    Methods take path parameters, query parameters and parsed request body,
+    and return tuple of status code and response data.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def _namespace_exists(self, namespace):
+        return self.mesh.get('Namespace', None, namespace) is not None
+
+    def _workloads(self, namespace):
+        """ Returns list of (Deployment, its pods) of namespace """
+        _pods = self.mesh.label_index('Pod', namespace)
+        return [(_deployment, select(_pods, _deployment['spec']['selector']['matchLabels']))
+                for _deployment in self.mesh.list('Deployment', namespace)]
+
+    def _workload(self, namespace, name):
+        _deployment = self.mesh.get('Deployment', namespace, name)
+        if _deployment is None:
+            return None
+        return _deployment, select(self.mesh.label_index('Pod', namespace),
+                                   _deployment['spec']['selector']['matchLabels'])
+
+    def _apps(self, namespace):
+        """ Returns dictionary of app name and list of its (Deployment, pods) """
+        _apps = OrderedDict()
+        for _workload in self._workloads(namespace):
+            _app = _workload[0]['metadata']['labels'].get('app')
+            if _app:
+                _apps.setdefault(_app, []).append(_workload)
+        return _apps
+
+    def _services(self, namespace):
+        """ Returns list of (Service, its pods) of namespace """
+        _pods = self.mesh.label_index('Pod', namespace)
+        return [(_service, select(_pods, _service['spec'].get('selector')))
+                for _service in self.mesh.list('Service', namespace)]
+
+    def _requests(self, namespace, workload_names, sidecar):
+        if not sidecar:
+            return {'inbound': {}, 'outbound': {}}
+        _error_rate = max([self.mesh.error_rates.get((namespace, _name), 0.0)
+                           for _name in workload_names] or [0.0])
+        return {'inbound': _request_codes(_error_rate), 'outbound': _request_codes(_error_rate)}
+
+    def _workload_status(self, deployment):
+        return {'name': deployment['metadata']['name'],
+                'desiredReplicas': deployment['spec']['replicas'],
+                'availableReplicas': deployment['status']['availableReplicas']}
+
+    def _workload_item(self, deployment, pods):
+        _meta = deployment['metadata']
+        return {'name': _meta['name'],
+                'type': deployment['kind'],
+                'istioSidecar': _has_sidecar(pods),
+                'labels': _meta['labels'],
+                'appLabel': 'app' in _meta['labels'],
+                'versionLabel': 'version' in _meta['labels'],
+                'podCount': len(pods),
+                'createdAt': _meta['creationTimestamp'],
+                'resourceVersion': _meta['resourceVersion'],
+                'additionalDetailSample': None}
+
+    def _workload_health(self, namespace, deployment, pods):
+        return {'workloadStatus': self._workload_status(deployment),
+                'requests': self._requests(namespace, [deployment['metadata']['name']],
+                                           _has_sidecar(pods))}
+
+    def _app_item(self, name, workloads):
+        _labels = OrderedDict()
+        for _deployment, _ in workloads:
+            for _label, _value in _deployment['metadata']['labels'].items():
+                _values = _labels.setdefault(_label, [])
+                if _value not in _values:
+                    _values.append(_value)
+        return {'name': name,
+                'istioSidecar': all(_has_sidecar(_pods) for _, _pods in workloads),
+                'labels': {_label: ','.join(_values) for _label, _values in _labels.items()}}
+
+    def _app_health(self, namespace, workloads):
+        return {'workloadStatuses': [self._workload_status(_deployment)
+                                     for _deployment, _ in workloads],
+                'requests': self._requests(
+                    namespace, [_deployment['metadata']['name'] for _deployment, _ in workloads],
+                    all(_has_sidecar(_pods) for _, _pods in workloads))}
+
+    def _service_workloads(self, namespace, service):
+        return select(self.mesh.label_index('Deployment', namespace),
+                      service['spec'].get('selector'))
+
+    def _service_item(self, service, pods):
+        return {'name': service['metadata']['name'],
+                'istioSidecar': _has_sidecar(pods),
+                'labels': service['metadata']['labels'],
+                'ports': service['spec']['ports'],
+                'additionalDetailSample': None}
+
+    def _service_health(self, namespace, service, pods, deployment_index):
+        _workloads = select(deployment_index, service['spec'].get('selector'))
+        return {'requests': self._requests(
+            namespace, [_deployment['metadata']['name'] for _deployment in _workloads],
+            _has_sidecar(pods))}
+
+    def _validation(self, config):
+        _meta = config['metadata']
+        _checks = self.mesh.validations.get((config['kind'], _meta['namespace'], _meta['name']),
+                                            [])
+        return {'name': _meta['name'],
+                'objectType': config['kind'].lower(),
+                'valid': not any(_check['severity'] == 'error' for _check in _checks),
+                'checks': _checks,
+                'references': []}
+
+    def _kind(self, config_type):
+        for _kind, (_config_type, _, _) in ISTIO_KINDS.items():
+            if _config_type == config_type:
+                return _kind
+        return None
+
+    def get_status(self, path, params, body):
+        return 200, {'status': {'Kiali core version': 'fake',
+                                'Kiali console version': 'fake',
+                                'Kiali core commit hash': 'fake',
+                                'Kiali state': 'running'}}
+
+    def authenticate(self, path, params, body):
+        return 200, {'username': 'fake'}
+
+    def namespace_list(self, path, params, body):
+        return 200, [{'name': _namespace['metadata']['name'],
+                      'labels': _namespace['metadata']['labels']}
+                     for _namespace in self.mesh.list('Namespace')]
+
+    def namespace_update(self, path, params, body):
+        _namespace = self.mesh.get('Namespace', None, path['namespace'])
+        if _namespace is None:
+            return _not_found('Namespace {} not found'.format(path['namespace']))
+        _merge_patch(_namespace, body or {})
+        self.mesh.add(_namespace)
+        return 200, {'name': _namespace['metadata']['name'],
+                     'labels': _namespace['metadata']['labels']}
+
+    def namespace_health(self, path, params, body):
+        _namespace = path['namespace']
+        if not self._namespace_exists(_namespace):
+            return _not_found('Namespace {} not found'.format(_namespace))
+        _type = params.get('type', 'app')
+        if _type == 'service':
+            _deployments = self.mesh.label_index('Deployment', _namespace)
+            return 200, {_service['metadata']['name']: self._service_health(
+                _namespace, _service, _pods, _deployments)
+                for _service, _pods in self._services(_namespace)}
+        if _type == 'workload':
+            return 200, {_deployment['metadata']['name']: self._workload_health(
+                _namespace, _deployment, _pods)
+                for _deployment, _pods in self._workloads(_namespace)}
+        return 200, {_app: self._app_health(_namespace, _workloads)
+                     for _app, _workloads in self._apps(_namespace).items()}
+
+    def service_list(self, path, params, body):
+        _namespace = path['namespace']
+        if not self._namespace_exists(_namespace):
+            return _not_found('Namespace {} not found'.format(_namespace))
+        return 200, {'namespace': {'name': _namespace},
+                     'services': [self._service_item(_service, _pods)
+                                  for _service, _pods in self._services(_namespace)]}
+
+    def service_details(self, path, params, body):
+        _namespace = path['namespace']
+        _service = self.mesh.get('Service', _namespace, path['service'])
+        if _service is None:
+            return _not_found('Service {} not found'.format(path['service']))
+        _name = _service['metadata']['name']
+        _pods = select(self.mesh.label_index('Pod', _namespace), _service['spec'].get('selector'))
+        _endpoints = self.mesh.get('Endpoints', _namespace, _name)
+        _meta = _service['metadata']
+        return 200, {
+            'namespace': {'name': _namespace},
+            'service': {'name': _name,
+                        'createdAt': _meta['creationTimestamp'],
+                        'resourceVersion': _meta['resourceVersion'],
+                        'type': _service['spec']['type'],
+                        'ip': _service['spec']['clusterIP'],
+                        'ports': _service['spec']['ports'],
+                        'labels': _meta['labels'],
+                        'selectors': _service['spec'].get('selector')},
+            'istioSidecar': _has_sidecar(_pods),
+            'workloads': [{'name': _deployment['metadata']['name'],
+                           'type': _deployment['kind'],
+                           'labels': _deployment['metadata']['labels'],
+                           'createdAt': _deployment['metadata']['creationTimestamp'],
+                           'resourceVersion': _deployment['metadata']['resourceVersion']}
+                          for _deployment in self._service_workloads(_namespace, _service)],
+            'virtualServices': {'items': [
+                _config for _config in self.mesh.list('VirtualService', _namespace)
+                if _name in _config['spec'].get('hosts', [])]},
+            'destinationRules': {'items': [
+                _config for _config in self.mesh.list('DestinationRule', _namespace)
+                if _config['spec'].get('host') == _name]},
+            'endpoints': _endpoints['subsets'] if _endpoints else [],
+            'validations': {}}
+
+    def service_health(self, path, params, body):
+        _namespace = path['namespace']
+        _service = self.mesh.get('Service', _namespace, path['service'])
+        if _service is None:
+            return _not_found('Service {} not found'.format(path['service']))
+        _pods = select(self.mesh.label_index('Pod', _namespace), _service['spec'].get('selector'))
+        return 200, self._service_health(_namespace, _service, _pods,
+                                         self.mesh.label_index('Deployment', _namespace))
+
+    def workload_list(self, path, params, body):
+        _namespace = path['namespace']
+        if not self._namespace_exists(_namespace):
+            return _not_found('Namespace {} not found'.format(_namespace))
+        return 200, {'namespace': {'name': _namespace},
+                     'workloads': [self._workload_item(_deployment, _pods)
+                                   for _deployment, _pods in self._workloads(_namespace)]}
+
+    def workload_details(self, path, params, body):
+        _namespace = path['namespace']
+        _workload = self._workload(_namespace, path['workload'])
+        if _workload is None:
+            return _not_found('Workload {} not found'.format(path['workload']))
+        _deployment, _pods = _workload
+        _details = self._workload_item(_deployment, _pods)
+        _details['services'] = [
+            {'name': _service['metadata']['name']}
+            for _service in self.mesh.list('Service', _namespace)
+            if _service['spec'].get('selector') and match_labels(
+                _deployment['metadata']['labels'], _service['spec']['selector'])]
+        _details['pods'] = [{'name': _pod['metadata']['name'],
+                             'status': _pod['status']['phase'],
+                             'labels': _pod['metadata']['labels'],
+                             'appLabel': 'app' in _pod['metadata']['labels'],
+                             'versionLabel': 'version' in _pod['metadata']['labels'],
+                             'createdAt': _pod['metadata']['creationTimestamp']}
+                            for _pod in _pods]
+        return 200, _details
+
+    def workload_update(self, path, params, body):
+        _deployment = self.mesh.get('Deployment', path['namespace'], path['workload'])
+        if _deployment is None:
+            return _not_found('Workload {} not found'.format(path['workload']))
+        _merge_patch(_deployment, body or {})
+        self.mesh.add(_deployment)
+        return self.workload_details(path, params, None)
+
+    def workload_health(self, path, params, body):
+        _workload = self._workload(path['namespace'], path['workload'])
+        if _workload is None:
+            return _not_found('Workload {} not found'.format(path['workload']))
+        return 200, self._workload_health(path['namespace'], *_workload)
+
+    def app_list(self, path, params, body):
+        _namespace = path['namespace']
+        if not self._namespace_exists(_namespace):
+            return _not_found('Namespace {} not found'.format(_namespace))
+        return 200, {'namespace': {'name': _namespace},
+                     'applications': [self._app_item(_app, _workloads)
+                                      for _app, _workloads in self._apps(_namespace).items()]}
+
+    def app_details(self, path, params, body):
+        _namespace = path['namespace']
+        _workloads = self._apps(_namespace).get(path['app'])
+        if not _workloads:
+            return _not_found('App {} not found'.format(path['app']))
+        return 200, {
+            'namespace': {'name': _namespace},
+            'name': path['app'],
+            'workloads': [{'workloadName': _deployment['metadata']['name'],
+                           'istioSidecar': _has_sidecar(_pods),
+                           'labels': _deployment['metadata']['labels']}
+                          for _deployment, _pods in _workloads],
+            'serviceNames': [_service['metadata']['name']
+                             for _service in self.mesh.list('Service', _namespace)
+                             if any(match_labels(_deployment['metadata']['labels'],
+                                                 _service['spec'].get('selector'))
+                                    for _deployment, _ in _workloads)]}
+
+    def app_health(self, path, params, body):
+        _workloads = self._apps(path['namespace']).get(path['app'])
+        if not _workloads:
+            return _not_found('App {} not found'.format(path['app']))
+        return 200, self._app_health(path['namespace'], _workloads)
+
+    def istio_config_list(self, path, params, body):
+        _namespace = path['namespace']
+        if not self._namespace_exists(_namespace):
+            return _not_found('Namespace {} not found'.format(_namespace))
+        _selector = None
+        if params.get('workloadSelector'):
+            _selector = dict(_label.split('=', 1)
+                             for _label in params['workloadSelector'].split(',') if _label)
+        _data = {'namespace': {'name': _namespace}}
+        _validations = {}
+        for _kind, (_, _list_key, _) in ISTIO_KINDS.items():
+            _configs = self.mesh.list(_kind, _namespace)
+            if _selector is not None:
+                # only configs with workload selector matching the workload labels
+                _configs = [_config for _config in _configs
+                            if _config['spec'].get('workloadSelector')
+                            and match_labels(_selector,
+                                             _config['spec']['workloadSelector'].get('labels'))]
+            if _list_key in ('destinationRules', 'virtualServices'):
+                # Kiali wraps these two lists in 'items', like it does in service details
+                _data[_list_key] = {'items': _configs}
+            else:
+                _data[_list_key] = _configs
+            for _config in _configs:
+                _validations.setdefault(_kind.lower(), {})[_config['metadata']['name']] = \
+                    self._validation(_config)
+        if params.get('validate') == 'true':
+            _data['validations'] = _validations
+        return 200, _data
+
+    def istio_config_details(self, path, params, body):
+        _kind = self._kind(path['object_type'])
+        _config = self.mesh.get(_kind, path['namespace'], path['object']) if _kind else None
+        if _config is None:
+            return _not_found('{} {} not found'.format(path['object_type'], path['object']))
+        _data = {_details_key: None for _, _, _details_key in ISTIO_KINDS.values()}
+        _data[ISTIO_KINDS[_kind][2]] = _config
+        _data['namespace'] = {'name': path['namespace']}
+        _data['objectType'] = path['object_type']
+        if params.get('validate') == 'true':
+            _data['validation'] = self._validation(_config)
+        return 200, _data
+
+    def istio_config_create(self, path, params, body):
+        _kind = self._kind(path['object_type'])
+        if _kind is None or not body:
+            return 400, {'error': 'Object type {} is not supported'.format(path['object_type'])}
+        _meta = body.setdefault('metadata', {})
+        _meta['namespace'] = path['namespace']
+        _meta.setdefault('labels', {})
+        _meta.setdefault('creationTimestamp', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()))
+        _meta.setdefault('uid', '{}-{}'.format(path['namespace'], _meta['name']))
+        body['kind'] = _kind
+        if self.mesh.get(_kind, path['namespace'], _meta['name']) is not None:
+            return 409, {'error': '{} {} already exists'.format(_kind, _meta['name'])}
+        return 200, self.mesh.add(body)
+
+    def istio_config_delete(self, path, params, body):
+        _kind = self._kind(path['object_type'])
+        if _kind is None or self.mesh.remove(_kind, path['namespace'], path['object']) is None:
+            return _not_found('{} {} not found'.format(path['object_type'], path['object']))
+        return 200, {}
+
+
+class _KialiRequestHandler(BaseHTTPRequestHandler):
+    # keep-alive connections, as used by pooled transport of the REST client
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._handle('get')
+
+    def do_POST(self):
+        self._handle('post')
+
+    def do_PATCH(self):
+        self._handle('patch')
+
+    def do_DELETE(self):
+        self._handle('delete')
+
+    def _handle(self, http_method):
+        _url = urlsplit(self.path)
+        _length = int(self.headers.get('Content-Length') or 0)
+        _body = self.rfile.read(_length) if _length else None
+        _status, _content = self.server.fake.dispatch(http_method, _url.path,
+                                                      dict(parse_qsl(_url.query)), _body)
+        _content = _content.encode('utf-8')
+        self.send_response(_status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(_content)))
+        self.end_headers()
+        self.wfile.write(_content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingHTTPServer(ThreadingHTTPServer):
+    # concurrent clients open many connections at once
+    request_queue_size = 128
+
+
+class FakeKialiServer(object):
+    """
+    Local HTTP server of FakeKialiApi and its swagger file, runs in a daemon thread.
+    Client of the server:
+        KialiExtendedClient(hostname=server.hostname, scheme='http', auth_type='no-auth',
+                            swagger_address=server.swagger_address)
+
+    Args:
+        mesh: SyntheticMesh the responses are computed from
+        host: listening address
+        port: listening port, 0 picks a free port
+        latency: seconds added to every response, to simulate server and network time
+    """
+
+    def __init__(self, mesh, host='127.0.0.1', port=0, latency=0.0):
+        self.api = FakeKialiApi(mesh)
+        self.latency = latency
+        self._swagger = json.dumps(get_swagger())
+        # data of responses are mesh objects, they are serialized under the mesh lock
+        self._routes = [(http_method,
+                         re.compile('^{}{}$'.format(
+                             BASE_PATH, re.sub('{(\\w+)}', '(?P<\\1>[^/]+)', path))),
+                         getattr(self.api, method))
+                        for _, http_method, path, method in OPERATIONS]
+        self._httpd = _ThreadingHTTPServer((host, port), _KialiRequestHandler)
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def hostname(self):
+        """ host:port of the server, the hostname argument of KialiExtendedClient """
+        return '{}:{}'.format(*self._httpd.server_address[:2])
+
+    @property
+    def swagger_address(self):
+        return 'http://{}{}'.format(self.hostname, SWAGGER_PATH)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def dispatch(self, http_method, url_path, params, body):
+        """ Returns tuple of status code and json response body of the request """
+        if self.latency:
+            time.sleep(self.latency)
+        if url_path == SWAGGER_PATH:
+            return 200, self._swagger
+        for _http_method, _pattern, _method in self._routes:
+            _match = _pattern.match(url_path)
+            if _match and _http_method == http_method:
+                _path = {_key: unquote(_value) for _key, _value in _match.groupdict().items()}
+                with self.api.mesh.lock:
+                    try:
+                        _status, _data = _method(_path, params,
+                                                 json.loads(body) if body else None)
+                    except Exception as e:
+                        _status, _data = 500, {'error': str(e)}
+                    return _status, json.dumps(_data)
+        _status, _data = _not_found('{} {} is not supported'.format(
+            http_method.upper(), url_path))
+        return _status, json.dumps(_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serves Kiali REST API of a generated service mesh')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--namespaces', type=int, default=3)
+    parser.add_argument('--workloads', type=int, default=10, help='workloads per namespace')
+    parser.add_argument('--versions', type=int, default=2, help='workloads per application')
+    parser.add_argument('--replicas', type=int, default=1, help='pods per workload')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds added to every response')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    mesh = SyntheticMesh(namespaces=args.namespaces, workloads=args.workloads,
+                         versions=args.versions, replicas=args.replicas, seed=args.seed)
+    server = FakeKialiServer(mesh, host=args.host, port=args.port, latency=args.latency)
+    print('Fake Kiali on http://{}, swagger: {}'.format(server.hostname, server.swagger_address))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
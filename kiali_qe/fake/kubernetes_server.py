@@ -0,0 +1,642 @@
+import argparse
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+import yaml
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from kiali_qe.fake.kiali_server import _ThreadingHTTPServer, _merge_patch
+from kiali_qe.fake.mesh import SyntheticMesh
+
+# group, versions, kind and plural of the served resources, and whether they are namespaced
+RESOURCES = [
+    ('', ['v1'], 'Namespace', 'namespaces', False),
+    ('', ['v1'], 'Service', 'services', True),
+    ('', ['v1'], 'Pod', 'pods', True),
+    ('', ['v1'], 'Endpoints', 'endpoints', True),
+    ('', ['v1'], 'ConfigMap', 'configmaps', True),
+    ('', ['v1'], 'ReplicationController', 'replicationcontrollers', True),
+    ('apps', ['v1'], 'Deployment', 'deployments', True),
+    ('apps', ['v1'], 'ReplicaSet', 'replicasets', True),
+    ('apps', ['v1'], 'StatefulSet', 'statefulsets', True),
+    ('apps', ['v1'], 'DaemonSet', 'daemonsets', True),
+    ('apps.openshift.io', ['v1'], 'DeploymentConfig', 'deploymentconfigs', True),
+    ('batch', ['v1'], 'Job', 'jobs', True),
+    ('batch', ['v1beta1'], 'CronJob', 'cronjobs', True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'Gateway', 'gateways', True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'VirtualService', 'virtualservices',
+     True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'DestinationRule', 'destinationrules',
+     True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'ServiceEntry', 'serviceentries', True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'WorkloadEntry', 'workloadentries', True),
+    ('networking.istio.io', ['v1alpha3', 'v1beta1'], 'Sidecar', 'sidecars', True),
+    ('networking.istio.io', ['v1alpha3'], 'EnvoyFilter', 'envoyfilters', True),
+    ('security.istio.io', ['v1beta1'], 'PeerAuthentication', 'peerauthentications', True),
+    ('security.istio.io', ['v1beta1'], 'RequestAuthentication', 'requestauthentications',
+     True),
+    ('security.istio.io', ['v1beta1'], 'AuthorizationPolicy', 'authorizationpolicies', True),
+]
+
+# workloads which status is set as rolled out when they are written, there is no controller
+WORKLOAD_KINDS = ['Deployment', 'DeploymentConfig', 'ReplicaSet', 'ReplicationController',
+                  'StatefulSet', 'DaemonSet']
+
+VERBS = ['create', 'delete', 'get', 'list', 'patch', 'update', 'watch']
+
+VERSION = {'major': '1', 'minor': '18', 'gitVersion': 'v1.18.0-fake', 'platform': 'fake'}
+
+RESOURCE_PATH = re.compile(
+    '^/(?:api|apis/(?P<group>[^/]+))/(?P<version>[^/]+)'
+    '(?:/namespaces/(?P<namespace>[^/]+))?/(?P<plural>[^/]+)(?:/(?P<name>[^/]+))?$')
+
+SELECTOR_TERM = re.compile('^(?P<not>!)?(?P<key>[^=!]+?)\\s*(?:(?P<op>==|!=|=)\\s*(?P<value>.*))?$')
+
+# fields of field selectors
+FIELDS = {
+    'metadata.name': lambda obj: obj['metadata']['name'],
+    'metadata.namespace': lambda obj: obj['metadata'].get('namespace'),
+}
+
+METADATA_API_VERSION = 'meta.k8s.io/v1'
+
+# number of paged lists kept for their continue requests
+LIST_SNAPSHOTS = 64
+
+
+def _group_version(group, version):
+    return '{}/{}'.format(group, version) if group else version
+
+
+def _status(code, reason, message):
+    """ Returns status code and Status object of the response """
+    return code, {'kind': 'Status',
+                  'apiVersion': 'v1',
+                  'metadata': {},
+                  'status': 'Success' if code < 400 else 'Failure',
+                  'message': message,
+                  'reason': reason,
+                  'code': code}
+
+
+def _not_found(kind, name):
+    return _status(404, 'NotFound', '{} "{}" not found'.format(kind, name))
+
+
+def _parse_selector(selector):
+    """Returns list of (key, operator, value) terms of equality based label or field selector,
+    operator is one of '=', '!=', 'exists' and '!exists'. Raises ValueError on other selectors.
+    """
+    _terms = []
+    for _term in (selector or '').split(','):
+        _term = _term.strip()
+        if not _term:
+            continue
+        _match = SELECTOR_TERM.match(_term)
+        if _match is None or ' in ' in _term or ' notin ' in _term:
+            raise ValueError('unable to parse requirement: {}'.format(_term))
+        if _match.group('op') is None:
+            _terms.append((_match.group('key'),
+                           '!exists' if _match.group('not') else 'exists', None))
+        elif _match.group('not'):
+            raise ValueError('unable to parse requirement: {}'.format(_term))
+        else:
+            _terms.append((_match.group('key').strip(),
+                           '!=' if _match.group('op') == '!=' else '=',
+                           _match.group('value').strip()))
+    return _terms
+
+
+def _match_terms(values, terms):
+    for _key, _operator, _value in terms:
+        if _operator == 'exists' and _key not in values:
+            return False
+        if _operator == '!exists' and _key in values:
+            return False
+        if _operator == '=' and values.get(_key) != _value:
+            return False
+        if _operator == '!=' and values.get(_key) == _value:
+            return False
+    return True
+
+
+def _rolled_out_status(obj):
+    """ Status of workload as if its controller completed the rollout at once """
+    _replicas = obj.get('spec', {}).get('replicas', 1)
+    _generation = obj['metadata']['generation']
+    if obj['kind'] == 'DaemonSet':
+        return {'observedGeneration': _generation,
+                'desiredNumberScheduled': 1,
+                'currentNumberScheduled': 1,
+                'updatedNumberScheduled': 1,
+                'numberReady': 1,
+                'numberAvailable': 1}
+    return {'observedGeneration': _generation,
+            'replicas': _replicas,
+            'updatedReplicas': _replicas,
+            'readyReplicas': _replicas,
+            'availableReplicas': _replicas}
+
+
+class FakeKubernetesApi(object):
+    """
+    Kubernetes API of the objects of SyntheticMesh, without HTTP.
+    Serves discovery, and list, watch, get, create, replace, patch and delete of RESOURCES.
+    Label and field selectors are equality based, lists are paged by limit and continue
+    from a snapshot of the first page, and are metadata only when PartialObjectMetadataList
+    is accepted.
+    Server side apply is approximated with json merge patch, and there are no controllers:
+    written workloads are rolled out at once, and deleted namespaces take their objects along.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        # (group, version, plural) -> (kind, namespaced)
+        self._resources = OrderedDict(
+            ((_group, _version, _plural), (_kind, _namespaced))
+            for _group, _versions, _kind, _plural, _namespaced in RESOURCES
+            for _version in _versions)
+        # the objects are kept per kind, for any of its versions
+        self._kinds = list(OrderedDict.fromkeys(_kind for _, _, _kind, _, _ in RESOURCES))
+        # (kind, namespace, label selector, field selector, resourceVersion) -> objects
+        self._snapshots = OrderedDict()
+        self._stopped = threading.Event()
+
+    def stop(self):
+        """ Ends open watch streams """
+        self._stopped.set()
+
+    def discovery(self, url_path):
+        """ Returns status code and response of discovery url, None when it is not one """
+        if url_path == '/version':
+            return 200, VERSION
+        if url_path == '/api':
+            return 200, {'kind': 'APIVersions', 'versions': ['v1'],
+                         'serverAddressByClientCIDRs': []}
+        if url_path == '/apis':
+            _groups = OrderedDict()
+            for _group, _versions, _, _, _ in RESOURCES:
+                if _group:
+                    for _version in _versions:
+                        _groups.setdefault(_group, OrderedDict())[_version] = None
+            _groups_response = []
+            for _group, _versions in _groups.items():
+                _versions = [{'groupVersion': _group_version(_group, _version),
+                              'version': _version} for _version in _versions]
+                _groups_response.append({'name': _group,
+                                         'versions': _versions,
+                                         'preferredVersion': _versions[0]})
+            return 200, {'kind': 'APIGroupList', 'apiVersion': 'v1', 'groups': _groups_response}
+        _match = re.match('^/(?:api|apis/(?P<group>[^/]+))/(?P<version>[^/]+)$', url_path)
+        if _match is None:
+            return None
+        _group, _version = _match.group('group') or '', _match.group('version')
+        _resources = [{'name': _plural,
+                       'singularName': _kind.lower(),
+                       'namespaced': _namespaced,
+                       'kind': _kind,
+                       'verbs': VERBS,
+                       'shortNames': []}
+                      for (_resource_group, _resource_version, _plural), (_kind, _namespaced)
+                      in self._resources.items()
+                      if (_resource_group, _resource_version) == (_group, _version)]
+        if not _resources:
+            return _status(404, 'NotFound', 'the server could not find the requested resource')
+        return 200, {'kind': 'APIResourceList',
+                     'apiVersion': 'v1',
+                     'groupVersion': _group_version(_group, _version),
+                     'resources': _resources}
+
+    def resolve(self, url_path):
+        """Returns (kind, api version, namespaced, namespace, name) of resource url,
+        None when the resource is not served.
+        """
+        _match = RESOURCE_PATH.match(url_path)
+        if _match is None:
+            return None
+        _group = _match.group('group') or ''
+        _resource = self._resources.get((_group, _match.group('version'), _match.group('plural')))
+        if _resource is None:
+            return None
+        _kind, _namespaced = _resource
+        _namespace = unquote(_match.group('namespace')) if _match.group('namespace') else None
+        if not _namespaced and _namespace is not None:
+            return None
+        _name = unquote(_match.group('name')) if _match.group('name') else None
+        return (_kind, _group_version(_group, _match.group('version')), _namespaced, _namespace,
+                _name)
+
+    def _filter(self, kind, namespace, params):
+        """ Returns objects of kind in namespace, or all namespaces, matching the selectors """
+        _labels = _parse_selector(params.get('labelSelector'))
+        _fields = _parse_selector(params.get('fieldSelector'))
+        for _field, _, _ in _fields:
+            if _field not in FIELDS:
+                raise ValueError('field label not supported: {}'.format(_field))
+        _objects = self.mesh.list(kind, namespace)
+        if _labels:
+            _objects = [_obj for _obj in _objects
+                        if _match_terms(_obj['metadata'].get('labels') or {}, _labels)]
+        if _fields:
+            _objects = [_obj for _obj in _objects
+                        if _match_terms({_field: FIELDS[_field](_obj)
+                                         for _field, _, _ in _fields}, _fields)]
+        return _objects
+
+    def _matches(self, obj, kind, namespace, params):
+        if obj['kind'] != kind or (namespace is not None
+                                   and obj['metadata'].get('namespace') != namespace):
+            return False
+        return _match_terms(obj['metadata'].get('labels') or {},
+                            _parse_selector(params.get('labelSelector'))) and \
+            _match_terms({_field: _get(obj) for _field, _get in FIELDS.items()},
+                         _parse_selector(params.get('fieldSelector')))
+
+    def _item(self, obj, api_version, metadata_only):
+        if metadata_only:
+            return {'kind': 'PartialObjectMetadata',
+                    'apiVersion': METADATA_API_VERSION,
+                    'metadata': obj['metadata']}
+        if obj.get('apiVersion') != api_version:
+            # objects of kinds with more versions are the same in all of them
+            return dict(obj, apiVersion=api_version)
+        return obj
+
+    def _snapshot(self, kind, namespace, params, resource_version):
+        """ Returns objects of the list at resource_version, None when it is not kept """
+        _key = (kind, namespace, params.get('labelSelector'), params.get('fieldSelector'),
+                resource_version)
+        _objects = self._snapshots.pop(_key, None)
+        if _objects is None:
+            if resource_version != self.mesh.resource_version:
+                return None
+            _objects = self._filter(kind, namespace, params)
+        self._snapshots[_key] = _objects
+        while len(self._snapshots) > LIST_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
+        return _objects
+
+    def list(self, kind, api_version, namespace, params, metadata_only):
+        _resource_version = self.mesh.resource_version
+        try:
+            if params.get('limit'):
+                # continue token is resourceVersion of the first page and offset
+                _resource_version, _offset = (params.get('continue') or '{}:0'.format(
+                    _resource_version)).split(':')
+                _objects = self._snapshot(kind, namespace, params, _resource_version)
+                if _objects is None:
+                    return _status(410, 'Expired',
+                                   'The provided continue parameter is too old')
+            else:
+                _objects = self._filter(kind, namespace, params)
+        except ValueError as e:
+            return _status(400, 'BadRequest', str(e))
+        _metadata = {'resourceVersion': _resource_version}
+        if params.get('limit'):
+            _offset = int(_offset)
+            _end = _offset + int(params['limit'])
+            if _end < len(_objects):
+                _metadata['continue'] = '{}:{}'.format(_resource_version, _end)
+                _metadata['remainingItemCount'] = len(_objects) - _end
+            _objects = _objects[_offset:_end]
+        return 200, {'kind': 'PartialObjectMetadataList' if metadata_only
+                     else '{}List'.format(kind),
+                     'apiVersion': METADATA_API_VERSION if metadata_only else api_version,
+                     'metadata': _metadata,
+                     'items': [self._item(_obj, api_version, metadata_only)
+                               for _obj in _objects]}
+
+    def get(self, kind, api_version, namespace, name, metadata_only):
+        _obj = self.mesh.get(kind, namespace, name)
+        if _obj is None:
+            return _not_found(kind, name)
+        return 200, self._item(_obj, api_version, metadata_only)
+
+    def _namespace_missing(self, namespace):
+        if namespace is not None and self.mesh.get('Namespace', None, namespace) is None:
+            return _not_found('Namespace', namespace)
+        return None
+
+    def _write(self, obj, kind, api_version, namespace, previous=None):
+        """ Sets the fields the server owns and stores the object """
+        _meta = obj.setdefault('metadata', {})
+        if not _meta.get('name') and _meta.get('generateName'):
+            _meta['name'] = '{}{}'.format(_meta['generateName'], uuid.uuid4().hex[:5])
+        if not _meta.get('name'):
+            return _status(422, 'Invalid', '{} is invalid: metadata.name: Required value'.format(
+                kind))
+        if namespace is not None:
+            _meta['namespace'] = namespace
+        obj['kind'] = kind
+        obj['apiVersion'] = api_version
+        _meta.setdefault('labels', {})
+        _meta.setdefault('annotations', {})
+        if previous is None:
+            _meta['uid'] = str(uuid.uuid4())
+            _meta['creationTimestamp'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            _meta['generation'] = 1
+        else:
+            _meta['uid'] = previous['metadata']['uid']
+            _meta['creationTimestamp'] = previous['metadata']['creationTimestamp']
+            _meta['generation'] = previous['metadata'].get('generation', 1) + 1
+        if kind in WORKLOAD_KINDS:
+            obj['status'] = _rolled_out_status(obj)
+        return (201 if previous is None else 200), self.mesh.add(obj)
+
+    def create(self, kind, api_version, namespace, body):
+        _missing = self._namespace_missing(namespace)
+        if _missing is not None:
+            return _missing
+        _name = body.get('metadata', {}).get('name')
+        if _name and self.mesh.get(kind, namespace, _name) is not None:
+            return _status(409, 'AlreadyExists', '{} "{}" already exists'.format(kind, _name))
+        return self._write(body, kind, api_version, namespace)
+
+    def replace(self, kind, api_version, namespace, name, body):
+        _previous = self.mesh.get(kind, namespace, name)
+        if _previous is None:
+            return _not_found(kind, name)
+        body.setdefault('metadata', {})['name'] = name
+        return self._write(body, kind, api_version, namespace, _previous)
+
+    def patch(self, kind, api_version, namespace, name, body, content_type):
+        _previous = self.mesh.get(kind, namespace, name)
+        if 'json-patch' in content_type:
+            return _status(415, 'UnsupportedMediaType',
+                           'json patch is not supported, use merge patch')
+        if _previous is None:
+            if 'apply-patch' not in content_type:
+                return _not_found(kind, name)
+            # server side apply creates missing objects
+            _missing = self._namespace_missing(namespace)
+            if _missing is not None:
+                return _missing
+            body.setdefault('metadata', {})['name'] = name
+            return self._write(body, kind, api_version, namespace)
+        # objects of the mesh are replaced, not changed, watch events keep their copies
+        _obj = copy.deepcopy(_previous)
+        _merge_patch(_obj, body)
+        _obj['metadata']['name'] = name
+        return self._write(_obj, kind, api_version, namespace, _previous)
+
+    def delete(self, kind, namespace, name):
+        _obj = self.mesh.remove(kind, namespace, name)
+        if _obj is None:
+            return _not_found(kind, name)
+        if kind == 'Namespace':
+            for _kind in self._kinds:
+                for _child in self.mesh.list(_kind, name):
+                    self.mesh.remove(_kind, name, _child['metadata']['name'])
+        return 200, _obj
+
+    def watch(self, kind, api_version, namespace, params):
+        """Returns iterator of json lines of watch events of objects matching params,
+        until timeoutSeconds passes. Without resourceVersion it starts with ADDED events
+        of the current objects.
+        """
+        try:
+            _parse_selector(params.get('labelSelector'))
+            _parse_selector(params.get('fieldSelector'))
+        except ValueError as e:
+            return _status(400, 'BadRequest', str(e))
+        _deadline = time.time() + float(params.get('timeoutSeconds') or 1800)
+        _resource_version = params.get('resourceVersion')
+        _initial = []
+        if not _resource_version or _resource_version == '0':
+            with self.mesh.lock:
+                _resource_version = self.mesh.resource_version
+                _initial = [json.dumps({'type': 'ADDED',
+                                        'object': self._item(_obj, api_version, False)})
+                            for _obj in self._filter(kind, namespace, params)]
+        return 200, self._watch_lines(kind, api_version, namespace, params,
+                                      int(_resource_version), _deadline, _initial)
+
+    def _watch_lines(self, kind, api_version, namespace, params, resource_version, deadline,
+                     initial):
+        if initial:
+            yield '\n'.join(initial) + '\n'
+        while not self._stopped.is_set() and time.time() < deadline:
+            # wake up now and then to notice stop of the server
+            if not self.mesh.wait_for_change(resource_version,
+                                             min(deadline - time.time(), 1.0)):
+                continue
+            _changes = self.mesh.changes(resource_version)
+            if _changes is None:
+                _, _error = _status(410, 'Expired', 'too old resource version: {}'.format(
+                    resource_version))
+                yield json.dumps({'type': 'ERROR', 'object': _error}) + '\n'
+                return
+            _lines = []
+            for _resource_version, _event_type, _obj in _changes:
+                resource_version = _resource_version
+                if self._matches(_obj, kind, namespace, params):
+                    _lines.append(json.dumps({'type': _event_type,
+                                              'object': self._item(_obj, api_version, False)}))
+            if _lines:
+                yield '\n'.join(_lines) + '\n'
+
+
+class _KubernetesRequestHandler(BaseHTTPRequestHandler):
+    # keep-alive connections, as used by pooled transport of the kubernetes client
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately, do not wait for ack of the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._handle('get')
+
+    def do_POST(self):
+        self._handle('post')
+
+    def do_PUT(self):
+        self._handle('put')
+
+    def do_PATCH(self):
+        self._handle('patch')
+
+    def do_DELETE(self):
+        self._handle('delete')
+
+    def _handle(self, http_method):
+        _url = urlsplit(self.path)
+        _length = int(self.headers.get('Content-Length') or 0)
+        _body = self.rfile.read(_length) if _length else None
+        _status, _content = self.server.fake.dispatch(
+            http_method, _url.path, dict(parse_qsl(_url.query)), self.headers, _body)
+        self.send_response(_status)
+        self.send_header('Content-Type', 'application/json')
+        if isinstance(_content, str):
+            _content = _content.encode('utf-8')
+            self.send_header('Content-Length', str(len(_content)))
+            self.end_headers()
+            self.wfile.write(_content)
+            return
+        # watch events are streamed as chunks
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for _chunk in _content:
+                _chunk = _chunk.encode('utf-8')
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(_chunk), _chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # watch stopped by the client
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeKubernetesServer(object):
+    """
+    Local HTTP server of FakeKubernetesApi, runs in a daemon thread.
+    Client of the server, after write_kubeconfig(path):
+        OpenshiftExtendedClient(kubeconfig=path)
+    or OpenshiftExtendedClient() with KUBECONFIG=path, which has to be set before
+    'kubernetes' is imported, its default kubeconfig location is read at import time.
+
+    Args:
+        mesh: SyntheticMesh the responses are computed from
+        host: listening address
+        port: listening port, 0 picks a free port
+        latency: seconds added to every response, to simulate server and network time
+    """
+
+    def __init__(self, mesh, host='127.0.0.1', port=0, latency=0.0):
+        self.api = FakeKubernetesApi(mesh)
+        self.latency = latency
+        self._httpd = _ThreadingHTTPServer((host, port), _KubernetesRequestHandler)
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def host(self):
+        """ url of the server, the server of the kubeconfig cluster """
+        return 'http://{}:{}'.format(*self._httpd.server_address[:2])
+
+    def write_kubeconfig(self, path):
+        """ Writes kubeconfig file with the server as its current cluster """
+        with open(path, 'w') as _file:
+            yaml.safe_dump({
+                'apiVersion': 'v1',
+                'kind': 'Config',
+                'clusters': [{'name': 'fake', 'cluster': {'server': self.host}}],
+                'users': [{'name': 'fake', 'user': {'token': 'fake'}}],
+                'contexts': [{'name': 'fake', 'context': {'cluster': 'fake', 'user': 'fake'}}],
+                'current-context': 'fake'}, _file, default_flow_style=False)
+        return path
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self.api.stop()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def dispatch(self, http_method, url_path, params, headers, body):
+        """Returns tuple of status code and json response body of the request,
+        the body of watch requests is an iterator of chunks of json lines.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        _discovery = self.api.discovery(url_path) if http_method == 'get' else None
+        if _discovery is not None:
+            return _discovery[0], json.dumps(_discovery[1])
+        _resource = self.api.resolve(url_path)
+        if _resource is None:
+            return self._response(_status(
+                404, 'NotFound', 'the server could not find the requested resource'))
+        _kind, _api_version, _namespaced, _namespace, _name = _resource
+        if _namespaced and _namespace is None and http_method != 'get':
+            # namespaced objects are written only by their namespace url
+            return self._response(_status(405, 'MethodNotAllowed', '{} {} is not supported'.format(
+                http_method.upper(), url_path)))
+        _metadata_only = 'as=PartialObjectMetadata' in (headers.get('Accept') or '')
+        if http_method == 'get' and _name is None and \
+                params.get('watch', '').lower() in ('true', '1'):
+            return self._response(self.api.watch(_kind, _api_version, _namespace, params))
+        with self.api.mesh.lock:
+            try:
+                if http_method in ('post', 'put', 'patch'):
+                    body = _load_body(body)
+                    if not isinstance(body, dict):
+                        return self._response(_status(400, 'BadRequest', 'body is not an object'))
+                if http_method == 'get' and _name is None:
+                    _response = self.api.list(_kind, _api_version, _namespace, params,
+                                              _metadata_only)
+                elif http_method == 'get':
+                    _response = self.api.get(_kind, _api_version, _namespace, _name,
+                                             _metadata_only)
+                elif http_method == 'post' and _name is None:
+                    _response = self.api.create(_kind, _api_version, _namespace, body)
+                elif http_method == 'put' and _name is not None:
+                    _response = self.api.replace(_kind, _api_version, _namespace, _name, body)
+                elif http_method == 'patch' and _name is not None:
+                    _response = self.api.patch(_kind, _api_version, _namespace, _name, body,
+                                               headers.get('Content-Type') or '')
+                elif http_method == 'delete' and _name is not None:
+                    _response = self.api.delete(_kind, _namespace, _name)
+                else:
+                    _response = _status(405, 'MethodNotAllowed', '{} {} is not supported'.format(
+                        http_method.upper(), url_path))
+            except Exception as e:
+                _response = _status(500, 'InternalError', str(e))
+            return self._response(_response)
+
+    def _response(self, response):
+        _status, _data = response
+        if isinstance(_data, dict):
+            return _status, json.dumps(_data)
+        return _status, _data
+
+
+def _load_body(body):
+    # server side apply sends yaml, json is yaml too
+    return yaml.safe_load(body) if body else None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serves Kubernetes API of a generated service mesh')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--namespaces', type=int, default=3)
+    parser.add_argument('--workloads', type=int, default=10, help='workloads per namespace')
+    parser.add_argument('--versions', type=int, default=2, help='workloads per application')
+    parser.add_argument('--replicas', type=int, default=1, help='pods per workload')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds added to every response')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--kubeconfig', help='kubeconfig file to write for the server')
+    args = parser.parse_args()
+    mesh = SyntheticMesh(namespaces=args.namespaces, workloads=args.workloads,
+                         versions=args.versions, replicas=args.replicas, seed=args.seed)
+    server = FakeKubernetesServer(mesh, host=args.host, port=args.port, latency=args.latency)
+    print('Fake Kubernetes API on {}'.format(server.host))
+    if args.kubeconfig:
+        print('Kubeconfig: {}'.format(server.write_kubeconfig(args.kubeconfig)))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
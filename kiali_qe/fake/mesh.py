@@ -0,0 +1,336 @@
+import copy
+import random
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+
+CREATION_TIMESTAMP = '2020-01-01T00:00:00Z'
+
+ISTIO_API_VERSION = 'networking.istio.io/v1alpha3'
+
+SIDECAR_CONTAINER = 'istio-proxy'
+
+ISTIO_SYSTEM = 'istio-system'
+
+MESH_CONFIG = 'enableAutoMtls: true\nrootNamespace: istio-system\n'
+
+
+class SyntheticMesh(object):
+    """
+    Generated service mesh kept as Kubernetes objects, the data source of fake API servers.
+    Workloads of every namespace are Deployments with their ReplicaSets and Pods, grouped
+    into applications of 'versions' workloads. Each application has one Service with
+    Endpoints, one DestinationRule with a subset per version and one VirtualService
+    splitting traffic between the subsets. The istio-system namespace holds the istio
+    ConfigMap with the mesh config.
+
+    The mesh is generated from the seed, the same arguments give the same mesh.
+    Changes after the generation are kept in a bounded history, the source of watch events.
+
+    Args:
+        namespaces: number of namespaces, besides istio-system
+        workloads: number of workloads per namespace
+        versions: number of workloads per application
+        replicas: pods per workload
+        sidecar_ratio: part of namespaces with sidecar injection enabled
+        unhealthy_ratio: part of workloads with unavailable pods and request errors
+        invalid_ratio: part of istio configs with failed validation
+        seed: random seed
+        history: number of changes kept in the history
+    """
+
+    def __init__(self, namespaces=3, workloads=10, versions=2, replicas=1, sidecar_ratio=1.0,
+                 unhealthy_ratio=0.1, invalid_ratio=0.1, seed=0, history=10000):
+        self.namespace_count = namespaces
+        self.workloads_per_namespace = workloads
+        self.versions = max(versions, 1)
+        self.replicas = replicas
+        self.sidecar_ratio = sidecar_ratio
+        self.unhealthy_ratio = unhealthy_ratio
+        self.invalid_ratio = invalid_ratio
+        self.seed = seed
+        # (kind, namespace) -> objects keyed by name, namespace of cluster wide objects is None
+        self._objects = OrderedDict()
+        # (namespace, workload) -> part of failed requests
+        self.error_rates = {}
+        # (kind, namespace, name) -> list of validation checks
+        self.validations = {}
+        self.lock = threading.RLock()
+        # notified on every change recorded in the history
+        self.changed = threading.Condition(self.lock)
+        self._resource_version = 0
+        # (resourceVersion, event type, copy of object) of changes after the generation
+        self._history = None
+        # changes after this resourceVersion are in the history
+        self._history_start = 0
+        self._generate()
+        self._history = deque(maxlen=history)
+        self._history_start = self._resource_version
+
+    @property
+    def resource_version(self):
+        """ resourceVersion of the last change """
+        return str(self._resource_version)
+
+    def _next_resource_version(self):
+        self._resource_version += 1
+        return str(self._resource_version)
+
+    def _record(self, event_type, obj):
+        if self._history is None:
+            return
+        if len(self._history) == self._history.maxlen:
+            self._history_start = self._history[0][0]
+        self._history.append((self._resource_version, event_type, copy.deepcopy(obj)))
+        self.changed.notify_all()
+
+    def changes(self, resource_version):
+        """Returns list of (resourceVersion, event type, object) of changes after
+        resource_version, None when some of them are no longer in the history.
+        Event types are ADDED, MODIFIED and DELETED.
+        """
+        resource_version = int(resource_version)
+        with self.lock:
+            if resource_version < self._history_start:
+                return None
+            if not self._history:
+                return []
+            # resourceVersions of the history are consecutive
+            return list(islice(self._history,
+                               max(resource_version + 1 - self._history[0][0], 0), None))
+
+    def wait_for_change(self, resource_version, timeout):
+        """ Waits for a change after resource_version, returns False on timeout """
+        with self.changed:
+            return self.changed.wait_for(
+                lambda: self._resource_version > int(resource_version), timeout)
+
+    def _generate(self):
+        _random = random.Random(self.seed)
+        self.add(_namespace_object(ISTIO_SYSTEM, {}))
+        self.add(_config_map_object(ISTIO_SYSTEM, 'istio', {'mesh': MESH_CONFIG}))
+        for _ns_index in range(self.namespace_count):
+            _namespace = 'mesh-{}'.format(_ns_index)
+            _sidecar = _random.random() < self.sidecar_ratio
+            self.add(_namespace_object(
+                _namespace, {'istio-injection': 'enabled'} if _sidecar else {}))
+            for _first in range(0, self.workloads_per_namespace, self.versions):
+                _app_index = _first // self.versions
+                self._generate_app(
+                    _random, _namespace, _ns_index, 'app-{}'.format(_app_index), _app_index,
+                    min(self.versions, self.workloads_per_namespace - _first), _sidecar)
+
+    def _generate_app(self, rand, namespace, ns_index, app, app_index, versions, sidecar):
+        _versions = ['v{}'.format(_index + 1) for _index in range(versions)]
+        _ips = []
+        for _version in _versions:
+            _name = '{}-{}'.format(app, _version)
+            _labels = {'app': app, 'version': _version}
+            _unhealthy = rand.random() < self.unhealthy_ratio
+            _available = self.replicas - 1 if _unhealthy and self.replicas > 0 else self.replicas
+            self.error_rates[(namespace, _name)] = 0.5 if _unhealthy else 0.0
+            _deployment = self.add(_workload_object(
+                'Deployment', 'apps/v1', namespace, _name, _labels, self.replicas, _available))
+            _hash = '{:x}'.format(rand.getrandbits(36))[:9]
+            _replicaset = self.add(_workload_object(
+                'ReplicaSet', 'apps/v1', namespace, '{}-{}'.format(_name, _hash),
+                dict(_labels, **{'pod-template-hash': _hash}), self.replicas, _available,
+                owner=_deployment))
+            for _pod_index in range(self.replicas):
+                _ip = '10.{}.{}.{}'.format(ns_index % 256, app_index % 256,
+                                           len(_ips) % 256)
+                _ips.append(_ip)
+                self.add(_pod_object(
+                    namespace, '{}-{}-{:05x}'.format(_name, _hash, rand.getrandbits(20)),
+                    _replicaset['metadata']['labels'], _ip, sidecar,
+                    ready=_pod_index < _available, owner=_replicaset))
+        _service = self.add(_service_object(namespace, app, '172.30.{}.{}'.format(
+            ns_index % 256, app_index % 256)))
+        self.add(_endpoints_object(_service, _ips))
+        _destination_rule = self.add(_config_object('DestinationRule', namespace, app, {
+            'host': app,
+            'subsets': [{'name': _version, 'labels': {'version': _version}}
+                        for _version in _versions]}))
+        _virtual_service = self.add(_config_object('VirtualService', namespace, app, {
+            'hosts': [app],
+            'http': [{'route': [{'destination': {'host': app, 'subset': _version},
+                                 'weight': _weight}
+                                for _version, _weight in zip(_versions,
+                                                             _weights(len(_versions)))]}]}))
+        for _config in (_destination_rule, _virtual_service):
+            if rand.random() < self.invalid_ratio:
+                self.validations[_key(_config)] = [{
+                    'message': 'Generated validation error',
+                    'severity': 'error',
+                    'path': 'spec'}]
+
+    def add(self, obj):
+        """ Adds or replaces the object, sets its resourceVersion and returns it """
+        _kind, _namespace, _name = _key(obj)
+        with self.lock:
+            _objects = self._objects.setdefault((_kind, _namespace), OrderedDict())
+            _event_type = 'MODIFIED' if _name in _objects else 'ADDED'
+            obj['metadata']['resourceVersion'] = self._next_resource_version()
+            _objects[_name] = obj
+            self._record(_event_type, obj)
+        return obj
+
+    def remove(self, kind, namespace, name):
+        """ Removes and returns the object, None if it does not exist """
+        with self.lock:
+            self.validations.pop((kind, namespace, name), None)
+            _obj = self._objects.get((kind, namespace), {}).pop(name, None)
+            if _obj is not None:
+                _obj['metadata']['resourceVersion'] = self._next_resource_version()
+                self._record('DELETED', _obj)
+            return _obj
+
+    def get(self, kind, namespace, name):
+        with self.lock:
+            return self._objects.get((kind, namespace), {}).get(name)
+
+    def list(self, kind, namespace=None, labels=None):
+        """Returns objects of kind in namespace, or in all namespaces when it is None.
+        Args:
+            labels: dictionary of labels the objects have to match
+        """
+        with self.lock:
+            if namespace is None:
+                _groups = [_objects for (_kind, _), _objects in self._objects.items()
+                           if _kind == kind]
+            else:
+                _groups = [self._objects.get((kind, namespace), {})]
+            return [_obj for _objects in _groups for _obj in _objects.values()
+                    if match_labels(_obj['metadata'].get('labels'), labels)]
+
+    def namespaces(self):
+        return [_obj['metadata']['name'] for _obj in self.list('Namespace')]
+
+    def label_index(self, kind, namespace=None):
+        """ Returns objects of kind keyed by their (label name, label value) pairs """
+        _index = {}
+        for _obj in self.list(kind, namespace):
+            for _label in (_obj['metadata'].get('labels') or {}).items():
+                _index.setdefault(_label, []).append(_obj)
+        return _index
+
+    def owned_by(self, kind, owner):
+        """ Returns objects of kind which ownerReferences contain owner """
+        _uid = owner['metadata']['uid']
+        return [_obj for _obj in self.list(kind, owner['metadata'].get('namespace'))
+                if any(_ref['uid'] == _uid
+                       for _ref in _obj['metadata'].get('ownerReferences', []))]
+
+
+def _key(obj):
+    return obj['kind'], obj['metadata'].get('namespace'), obj['metadata']['name']
+
+
+def match_labels(labels, selector):
+    if not selector:
+        return True
+    labels = labels or {}
+    return all(labels.get(_name) == _value for _name, _value in selector.items())
+
+
+def select(label_index, selector):
+    """ Returns objects of label_index which match all labels of selector """
+    if not selector:
+        return []
+    _first = next(iter(selector.items()))
+    return [_obj for _obj in label_index.get(_first, [])
+            if match_labels(_obj['metadata'].get('labels'), selector)]
+
+
+def _weights(count):
+    """ Returns integer traffic weights of count routes which sum to 100 """
+    _weights = [100 // count] * count
+    _weights[0] += 100 - sum(_weights)
+    return _weights
+
+
+def _metadata(name, namespace=None, labels=None, owner=None):
+    _meta = {'name': name,
+             'uid': '{}-{}'.format(namespace or 'cluster', name),
+             'labels': dict(labels or {}),
+             'annotations': {},
+             'creationTimestamp': CREATION_TIMESTAMP}
+    if namespace is not None:
+        _meta['namespace'] = namespace
+    if owner is not None:
+        _meta['ownerReferences'] = [{'apiVersion': owner['apiVersion'],
+                                     'kind': owner['kind'],
+                                     'name': owner['metadata']['name'],
+                                     'uid': owner['metadata']['uid'],
+                                     'controller': True}]
+    return _meta
+
+
+def _namespace_object(name, labels):
+    return {'apiVersion': 'v1',
+            'kind': 'Namespace',
+            'metadata': _metadata(name, labels=labels),
+            'status': {'phase': 'Active'}}
+
+
+def _workload_object(kind, api_version, namespace, name, labels, replicas, available,
+                     owner=None):
+    return {'apiVersion': api_version,
+            'kind': kind,
+            'metadata': _metadata(name, namespace, labels, owner),
+            'spec': {'replicas': replicas,
+                     'selector': {'matchLabels': dict(labels)},
+                     'template': {'metadata': {'labels': dict(labels), 'annotations': {}}}},
+            'status': {'replicas': replicas,
+                       'updatedReplicas': replicas,
+                       'readyReplicas': available,
+                       'availableReplicas': available,
+                       'unavailableReplicas': replicas - available}}
+
+
+def _pod_object(namespace, name, labels, ip, sidecar, ready, owner):
+    _containers = [{'name': labels['app'], 'image': 'synthetic/{}'.format(labels['app'])}]
+    if sidecar:
+        _containers.append({'name': SIDECAR_CONTAINER, 'image': 'istio/proxyv2'})
+    return {'apiVersion': 'v1',
+            'kind': 'Pod',
+            'metadata': _metadata(name, namespace, labels, owner),
+            'spec': {'containers': _containers},
+            'status': {'phase': 'Running' if ready else 'Pending',
+                       'podIP': ip,
+                       'containerStatuses': [{'name': _container['name'], 'ready': ready}
+                                             for _container in _containers]}}
+
+
+def _service_object(namespace, app, ip):
+    return {'apiVersion': 'v1',
+            'kind': 'Service',
+            'metadata': _metadata(app, namespace, {'app': app, 'service': app}),
+            'spec': {'type': 'ClusterIP',
+                     'clusterIP': ip,
+                     'selector': {'app': app},
+                     'ports': [{'name': 'http', 'port': 9080, 'protocol': 'TCP'}]}}
+
+
+def _endpoints_object(service, ips):
+    return {'apiVersion': 'v1',
+            'kind': 'Endpoints',
+            'metadata': _metadata(service['metadata']['name'],
+                                  service['metadata']['namespace'],
+                                  service['metadata']['labels']),
+            'subsets': [{'addresses': [{'ip': _ip} for _ip in ips],
+                         'ports': [{'name': 'http', 'port': 9080, 'protocol': 'TCP'}]}]}
+
+
+def _config_map_object(namespace, name, data):
+    return {'apiVersion': 'v1',
+            'kind': 'ConfigMap',
+            'metadata': _metadata(name, namespace),
+            'data': data}
+
+
+def _config_object(kind, namespace, name, spec):
+    return {'apiVersion': ISTIO_API_VERSION,
+            'kind': kind,
+            'metadata': _metadata(name, namespace),
+            'spec': spec}
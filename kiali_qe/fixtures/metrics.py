@@ -0,0 +1,16 @@
+import os
+
+from kiali_qe.rest.metrics import metrics
+from kiali_qe.utils.conf import env as cfg
+from kiali_qe.utils.log import logger
+from kiali_qe.utils.path import log_path
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not cfg.logging.metrics.enabled:
+        return
+    if not log_path.exists():
+        os.makedirs(log_path.strpath)
+    filename = os.path.join(log_path.strpath, cfg.logging.metrics.filename)
+    metrics.dump(filename)
+    logger.info('REST metrics saved to {}'.format(filename))
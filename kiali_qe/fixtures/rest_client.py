@@ -1,22 +1,48 @@
 import json
+import os
 import pytest
 
+from kiali_qe.rest.cassette import Cassette
 from kiali_qe.rest.kiali_api import KialiExtendedClient
 from kiali_qe.rest.openshift_api import OpenshiftExtendedClient
 from kiali_qe.utils.conf import env as cfg
 from kiali_qe.utils.log import logger
+from kiali_qe.utils.path import data_path
 
 
 @pytest.fixture(scope='session')
-def kiali_client():
+def cassette():
+    if not cfg.cassette.mode:
+        yield None
+        return
+    _filename = os.path.join(data_path.join('cassettes').strpath, cfg.cassette.filename)
+    logger.info('Using cassette in {} mode: {}'.format(cfg.cassette.mode, _filename))
+    _cassette = Cassette(_filename, cfg.cassette.mode)
+    yield _cassette
+    if _cassette.recording:
+        _cassette.save()
+        logger.info('Cassette saved to {}'.format(_filename))
+
+
+@pytest.fixture(scope='session')
+def kiali_client(cassette):
     logger.debug('Creating kiali rest client')
     logger.debug('Kiali hostname: {}'.format(cfg.kiali.hostname))
     _client = KialiExtendedClient(hostname=cfg.kiali.hostname,
+                                  scheme=cfg.kiali.scheme,
                                   username=cfg.kiali.username,
                                   password=cfg.kiali.password,
                                   auth_type=cfg.kiali.auth_type,
                                   token=cfg.kiali.token,
-                                  swagger_address=cfg.kiali.swagger_address)
+                                  swagger_address=cfg.kiali.swagger_address,
+                                  workers=cfg.kiali.workers,
+                                  cache_ttl=cfg.kiali.cache.ttl if cfg.kiali.cache.enabled
+                                  else None,
+                                  cache_size=cfg.kiali.cache.size,
+                                  pool_size=cfg.kiali.transport.pool_size,
+                                  connect_timeout=cfg.kiali.transport.connect_timeout,
+                                  read_timeout=cfg.kiali.transport.read_timeout,
+                                  cassette=cassette)
     # update kiali version details
     _response = _client.get_response('getStatus')
     _status = _response['status']
@@ -35,13 +61,24 @@ def kiali_client():
 
 
 @pytest.fixture(scope='session')
-def openshift_client():
+def openshift_client(cassette):
     if cfg.kiali.skip_oc:
         logger.debug('Skipping Openshift rest client because of cfg.kiali.skip_oc')
         # TODO Temporary solution as OC client does not support OCP4
-        return kiali_client()
+        yield kiali_client(cassette)
     else:
         logger.debug('Creating Openshift rest client')
-        _client = OpenshiftExtendedClient()
+        _client = OpenshiftExtendedClient(
+            cassette=cassette,
+            discovery_cache_ttl=cfg.openshift.discovery_cache.ttl,
+            discovery_cache_file=cfg.openshift.discovery_cache.filename,
+            workers=cfg.openshift.workers,
+            cluster_wide_threshold=cfg.openshift.cluster_wide_threshold,
+            informers=cfg.openshift.informers,
+            page_size=cfg.openshift.page_size,
+            metadata_only=cfg.openshift.metadata_only,
+            wait_timeout=cfg.openshift.wait_timeout)
         logger.info('Openshift versions:\n{}'.format(json.dumps(_client.version, indent=2)))
-        return _client
+        yield _client
+        # informers and the mesh config watch run in background threads
+        _client.stop_informers()
@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache(object):
+    """
+    Thread safe cache of REST responses with TTL and LRU size eviction.
+
+    Args:
+        ttl: seconds an entry is valid
+        size: maximum number of entries, least recently used entries are evicted first
+    """
+
+    def __init__(self, ttl, size=1000):
+        self.ttl = ttl
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_key(cls, method_name, path=None, params=None):
+        return (method_name,
+                tuple(sorted((path or {}).items())),
+                tuple(sorted((params or {}).items())))
+
+    def get(self, key):
+        """ Returns cached value of the key or None if it is missing or expired """
+        with self._lock:
+            _entry = self._entries.get(key)
+            if _entry is None:
+                self.misses += 1
+                return None
+            _expires_at, _namespace, _content = _entry
+            if _expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # a new object for every hit, callers may modify the response
+        return json.loads(_content)
+
+    def put(self, key, content, namespace=None):
+        """Stores raw response content.
+        Args:
+            key: result of get_key
+            content: response body
+            namespace: namespace the response belongs to, used by invalidate
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, namespace, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, namespace=None):
+        """Removes the entries of namespace and all cluster wide entries.
+        Removes all entries when namespace is None.
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for _key in [_key for _key, _entry in self._entries.items()
+                         if _entry[1] is None or _entry[1] == namespace]:
+                del self._entries[_key]
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._entries)}
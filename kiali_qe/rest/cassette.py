@@ -0,0 +1,165 @@
+import gzip
+import json
+import os
+import threading
+
+from kubernetes.client.rest import ApiException
+try:
+    # dynamic client of openshift >= 0.12 returns resource instances of kubernetes
+    from kubernetes.dynamic.resource import ResourceInstance
+except ImportError:
+    from openshift.dynamic import ResourceInstance
+from openshift.dynamic.exceptions import DynamicApiError, api_exception
+
+
+class CassetteError(Exception):
+    """ Raised when a replayed request is missing in the cassette """
+
+
+class Cassette(object):
+    """
+    Recorded Kiali REST and OpenShift API traffic, saved as gzip compressed json.
+    Interactions are kept per request key in call order. In replay mode each key returns
+    its interactions in the recorded order, the last one is repeated when they are exhausted.
+
+    Args:
+        filename: cassette file
+        mode: 'record' or 'replay'
+    """
+
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    def __init__(self, filename, mode):
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError('Unknown cassette mode: {}'.format(mode))
+        self.filename = filename
+        self.mode = mode
+        self._interactions = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        if self.replaying:
+            self.load()
+
+    @property
+    def recording(self):
+        return self.mode == self.RECORD
+
+    @property
+    def replaying(self):
+        return self.mode == self.REPLAY
+
+    @classmethod
+    def get_key(cls, *parts):
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def record(self, key, interaction):
+        with self._lock:
+            self._interactions.setdefault(key, []).append(interaction)
+
+    def replay(self, key):
+        with self._lock:
+            _interactions = self._interactions.get(key)
+            if not _interactions:
+                raise CassetteError('Request is not recorded in {}: {}'.format(
+                    self.filename, key))
+            _position = self._positions.get(key, 0)
+            self._positions[key] = _position + 1
+            return _interactions[min(_position, len(_interactions) - 1)]
+
+    def load(self):
+        with gzip.open(self.filename, 'rt') as _file:
+            _interactions = json.load(_file)
+        with self._lock:
+            self._interactions = _interactions
+            self._positions = {}
+
+    def save(self):
+        _directory = os.path.dirname(self.filename)
+        if _directory and not os.path.exists(_directory):
+            os.makedirs(_directory)
+        with self._lock:
+            with gzip.open(self.filename, 'wt') as _file:
+                json.dump(self._interactions, _file, sort_keys=True)
+
+
+class CassetteResponse(object):
+    """Replayed or asyncio HTTP response, with the parts of requests.Response used by
+    REST clients.
+    """
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content.encode('utf-8')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class CassetteResource(object):
+    """
+    Proxy of openshift dynamic client resource which records its API calls in cassette,
+    or replays them without a cluster connection.
+
+    Args:
+        resource: dynamic client resource, None in replay mode
+        cassette: Cassette
+        kind: resource kind
+        api_version: resource api version
+    """
+
+    VERBS = ('get', 'create', 'delete', 'patch', 'replace', 'apply', 'server_side_apply')
+
+    def __init__(self, resource, cassette, kind, api_version):
+        self._resource = resource
+        self._cassette = cassette
+        self.kind = kind
+        self.api_version = api_version
+
+    def __getattr__(self, name):
+        if name not in self.VERBS:
+            if self._resource is None:
+                raise CassetteError('{} of {} is not available in replay mode'.format(
+                    name, self.kind))
+            return getattr(self._resource, name)
+
+        def _call(*args, **kwargs):
+            _key = Cassette.get_key('openshift', self.kind, self.api_version, name,
+                                    args, kwargs)
+            if self._cassette.replaying:
+                return _from_interaction(self._cassette.replay(_key))
+            try:
+                _result = getattr(self._resource, name)(*args, **kwargs)
+            except DynamicApiError as e:
+                self._cassette.record(_key, {'error': {
+                    'status': e.status,
+                    'reason': e.reason,
+                    'body': e.body.decode('utf-8') if isinstance(e.body, bytes) else e.body}})
+                raise
+            self._cassette.record(_key, _to_interaction(_result))
+            return _result
+        return _call
+
+
+def _to_interaction(result):
+    if hasattr(result, 'to_dict'):
+        return {'instance': result.to_dict()}
+    return {'value': result}
+
+
+def _from_interaction(interaction):
+    if 'error' in interaction:
+        _error = interaction['error']
+        raise api_exception(ApiException(status=_error['status'], reason=_error['reason'],
+                                         body=_error['body']))
+    if 'instance' in interaction:
+        return ResourceInstance(None, interaction['instance'])
+    return interaction['value']
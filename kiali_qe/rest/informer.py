@@ -0,0 +1,144 @@
+import threading
+
+from kubernetes import watch
+
+from kiali_qe.utils.log import logger
+
+
+class Informer(object):
+    """
+    In-memory copy of one API resource kept current with a watch stream.
+    Items are listed once, then ADDED, MODIFIED and DELETED events from the last seen
+    resourceVersion update the store. When the watch fails or its resourceVersion is
+    too old, all items are listed again.
+    Items are indexed by namespace.
+
+    Args:
+        resource: openshift dynamic client resource
+        timeout: seconds of one watch request, the watch is restarted after it
+        retry_seconds: seconds to wait after failed list or watch
+        namespace: watch only items of namespace, optional
+        field_selector: watch only items matching field selector, optional
+    """
+
+    def __init__(self, resource, timeout=300, retry_seconds=1, namespace=None,
+                 field_selector=None):
+        self.resource = resource
+        self.namespace = namespace
+        self.field_selector = field_selector
+        self.timeout = timeout
+        self.retry_seconds = retry_seconds
+        self.resource_version = None
+        # (namespace, name) -> item
+        self._items = {}
+        self._by_namespace = {}
+        self._condition = threading.Condition()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher = None
+        self._thread = None
+
+    def start(self):
+        """ Starts list and watch in a daemon thread, does nothing when already started """
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def wait_for_sync(self, timeout=None):
+        """ Waits for the first list, returns False on timeout """
+        return self._synced.wait(timeout)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watcher = watch.Watch()
+                for _event in self.resource.watch(namespace=self.namespace,
+                                                  field_selector=self.field_selector,
+                                                  resource_version=self.resource_version,
+                                                  timeout=self.timeout,
+                                                  watcher=self._watcher,
+                                                  allow_watch_bookmarks=True):
+                    if self._stopped.is_set():
+                        return
+                    if _event['type'] == 'ERROR':
+                        # resourceVersion is too old, list again
+                        self.resource_version = None
+                        break
+                    self._handle(_event['type'], _event['object'])
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                logger.debug('Watch of {} failed, listing again: {}'.format(
+                    self.resource.kind, e))
+                self.resource_version = None
+                self._stopped.wait(self.retry_seconds)
+
+    def _relist(self):
+        _response = self.resource.get(namespace=self.namespace,
+                                      field_selector=self.field_selector)
+        with self._condition:
+            self._items = {}
+            self._by_namespace = {}
+            for _item in _response.items:
+                self._put(_item)
+            self.resource_version = _response.metadata.resourceVersion
+            self._condition.notify_all()
+        self._synced.set()
+
+    def _handle(self, event_type, item):
+        with self._condition:
+            if event_type in ('ADDED', 'MODIFIED'):
+                self._put(item)
+            elif event_type == 'DELETED':
+                self._remove(item)
+            self.resource_version = item.metadata.resourceVersion
+            self._condition.notify_all()
+
+    def _put(self, item):
+        _key = (item.metadata.namespace, item.metadata.name)
+        self._items[_key] = item
+        self._by_namespace.setdefault(_key[0], {})[_key[1]] = item
+
+    def _remove(self, item):
+        _key = (item.metadata.namespace, item.metadata.name)
+        if self._items.pop(_key, None) is not None:
+            self._by_namespace.get(_key[0], {}).pop(_key[1], None)
+
+    def list(self, namespaces=[]):
+        """Returns items ordered by namespace and name, as in list response.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        with self._condition:
+            if len(namespaces) > 0:
+                _keys = [(_namespace, _name) for _namespace in set(namespaces)
+                         for _name in self._by_namespace.get(_namespace, {})]
+            else:
+                _keys = list(self._items.keys())
+            return [self._items[_key] for _key in sorted(_keys, key=_sort_key)]
+
+    def get(self, namespace, name):
+        with self._condition:
+            return self._items.get((namespace, name))
+
+    def wait_for(self, namespace, name, exists=True, timeout=30):
+        """Waits until the item exists, or does not exist, in the store.
+        Returns False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: ((namespace, name) in self._items) == exists, timeout)
+
+
+def _sort_key(key):
+    # cluster wide items have no namespace
+    return key[0] or '', key[1]
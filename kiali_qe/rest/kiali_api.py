@@ -1,4 +1,7 @@
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium.common.exceptions import NoSuchElementException
 from kiali.client import KialiClient
@@ -12,7 +15,11 @@ from kiali_qe.components.enums import (
     HealthType
 )
 from kiali_qe.entities import Requests
-from kiali_qe.entities.istio_config import IstioConfig, IstioConfigDetails
+from kiali_qe.entities.istio_config import (
+    IstioConfig,
+    IstioConfigDetails,
+    IstioConfigValidationResult
+)
 from kiali_qe.entities.service import (
     ServiceHealth,
     Service,
@@ -37,6 +44,10 @@ from kiali_qe.entities.applications import (
     ApplicationHealth
 )
 from kiali_qe.entities.overview import Overview
+from kiali_qe.rest.cache import ResponseCache
+from kiali_qe.rest.cassette import Cassette, CassetteResponse
+from kiali_qe.rest.metrics import metrics
+from kiali_qe.rest.transport import PooledTransport
 from kiali_qe.utils import to_linear_string, dict_to_params
 from kiali_qe.utils.date import from_rest_to_ui
 from kiali_qe.utils.log import logger
@@ -62,31 +73,128 @@ ISTIO_CONFIG_TYPES = {'DestinationRule': 'destinationrules',
                       'ServiceRole': 'serviceroles',
                       'ServiceRoleBinding': 'servicerolebindings'}
 
+# istioConfigList response key, object type and config type, in the listing order
+ISTIO_CONFIG_LIST_KEYS = [
+    ('destinationRules', OBJECT_TYPE.DESTINATION_RULE, 'destinationrules'),
+    ('virtualServices', OBJECT_TYPE.VIRTUAL_SERVICE, 'virtualservices'),
+    ('peerAuthentications', OBJECT_TYPE.PEER_AUTHENTICATION, 'peerauthentications'),
+    ('requestAuthentications', OBJECT_TYPE.REQUEST_AUTHENTICATION, 'requestauthentications'),
+    ('gateways', OBJECT_TYPE.GATEWAY, 'gateways'),
+    ('envoyFilters', OBJECT_TYPE.ENVOY_FILTER, 'envoyfilters'),
+    ('serviceEntries', OBJECT_TYPE.SERVICE_ENTRY, 'serviceentries'),
+    ('workloadEntries', OBJECT_TYPE.WORKLOAD_ENTRY, 'workloadentries'),
+    ('sidecars', OBJECT_TYPE.SIDECAR, 'sidecars'),
+    ('authorizationPolicies', OBJECT_TYPE.AUTHORIZATION_POLICY, 'authorizationpolicies')]
+
+# health type -> health request of one item, its path parameter and Health entity
+ITEM_HEALTH = {
+    'service': ('serviceHealth', 'service', ServiceHealth),
+    'workload': ('workloadHealth', 'workload', WorkloadHealth),
+    'app': ('appHealth', 'app', ApplicationHealth)}
+
 
 class KialiExtendedClient(KialiClient):
 
-    def namespace_list(self):
-        """ Returns list of namespaces """
-        entities = []
-        entities_j = self.get_response('namespaceList')
+    def __init__(self, workers=1, cache_ttl=None, cache_size=1000, pool_size=None,
+                 connect_timeout=None, read_timeout=None, cassette=None, **kwargs):
+        """
+        Args:
+            workers: number of concurrent REST requests in list methods, 1 means serial
+            cache_ttl: seconds GET responses are cached, None disables the cache
+            cache_size: maximum number of cached GET responses
+            pool_size: kept alive connections of pooled transport,
+                None uses a new kiali-client session per request
+            connect_timeout: seconds to wait for connection in pooled transport
+            read_timeout: seconds to wait for response in pooled transport
+            cassette: Cassette which records responses, or replays them without connection
+        """
+        self.cassette = cassette
+        if cassette is not None and cassette.replaying:
+            # replay needs neither swagger file nor authentication
+            self.swagger_parser = None
+            self.api_connector = None
+        else:
+            super(KialiExtendedClient, self).__init__(**kwargs)
+        self.workers = max(int(workers), 1)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.transport = PooledTransport(
+            connector=self.api_connector,
+            # each worker thread needs its own connection
+            pool_size=max(int(pool_size), self.workers),
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_retries=kwargs.get('max_retries', 0)) \
+            if pool_size and self.api_connector is not None else None
+        self.cache = ResponseCache(ttl=float(cache_ttl), size=int(cache_size)) \
+            if cache_ttl else None
+        self._worker_local = threading.local()
+        # disabled for Kiali versions without namespace health in their swagger file
+        self._namespace_health_supported = True
+
+    def namespace_index(self):
+        """Returns dictionary of namespace rest data keyed by namespace name, built from
+        one namespaceList request. Lookups of more namespaces within one call share it,
+        it is not kept between calls, namespaces and their labels change in between.
+        """
+        return self._get_namespace_index(self.get_response('namespaceList'))
+
+    def _get_namespace_index(self, entities_j):
+        """ Returns namespace index of namespaceList response """
+        _index = OrderedDict()
         if entities_j:
             for entity_j in entities_j:
-                entities.append(entity_j['name'])
-        return entities
+                _index[entity_j['name']] = entity_j
+        return _index
 
-    def namespace_labels(self, namespace):
+    def namespace_list(self):
         """ Returns list of namespaces """
-        labels = []
-        entities_j = self.get_response('namespaceList')
-        if entities_j:
-            for entity_j in entities_j:
-                if entity_j['name'] == namespace:
-                    labels = self.get_labels(entity_j)
-        return labels
+        return list(self.namespace_index().keys())
+
+    def namespace_labels(self, namespace, namespace_index=None):
+        """Returns labels of namespace
+        Args:
+            namespace_index: result of namespace_index, fetched when None
+        """
+        if namespace_index is None:
+            namespace_index = self.namespace_index()
+        if namespace in namespace_index:
+            return self.get_labels(namespace_index[namespace])
+        return []
 
     def namespace_exists(self, namespace):
         """ Returns True if given namespace exists. False otherwise. """
-        return namespace in self.namespace_list()
+        return namespace in self.namespace_index()
+
+    def _get_namespaces(self, namespaces, namespace_index=None):
+        """Returns given namespaces or all namespaces when none given
+        Args:
+            namespace_index: result of namespace_index, fetched when None and needed
+        """
+        if len(namespaces) > 0:
+            return list(namespaces)
+        if namespace_index is None:
+            namespace_index = self.namespace_index()
+        return list(namespace_index.keys())
+
+    def _map(self, function, items):
+        """Applies function to every item and returns the results in the items order.
+        Uses a bounded pool of 'workers' threads, runs serially when workers is 1
+        or when called from a pool thread, so nested calls do not multiply threads.
+        """
+        items = list(items)
+        if self.workers < 2 or len(items) < 2 or getattr(self._worker_local, 'active', False):
+            return [function(_item) for _item in items]
+
+        def _run(_item):
+            self._worker_local.active = True
+            try:
+                return function(_item)
+            finally:
+                self._worker_local.active = False
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as executor:
+            return list(executor.map(_run, items))
 
     def service_list(self, namespaces=[]):
         """Returns list of services.
@@ -94,80 +202,92 @@ class KialiExtendedClient(KialiClient):
             namespaces: can be zero or any number of namespaces
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('serviceList', path={'namespace': _namespace})
-            _services = _data['services']
-            # update all the services to our custom entity
-            for _service_rest in _services:
-                _service_health = self.get_service_health(
-                    namespace=_namespace,
-                    service_name=_service_rest['name'],
-                    istioSidecar=_service_rest['istioSidecar'])
-                _service = Service(
-                    namespace=_namespace,
-                    name=_service_rest['name'],
-                    istio_sidecar=_service_rest['istioSidecar'],
-                    health=_service_health.is_healthy() if _service_health else None,
-                    service_status=_service_health,
-                    icon=self.get_icon_type(_service_rest),
-                    labels=self.get_labels(_service_rest))
-                items.append(_service)
+        namespace_list = self._get_namespaces(namespaces)
+        _data_list = self._map(
+            lambda _namespace: (
+                self.get_response('serviceList', path={'namespace': _namespace}),
+                self.get_namespace_health(_namespace, 'service')),
+            namespace_list)
+        _services_rest = [(_namespace, _service_rest, _health_dict)
+                          for _namespace, (_data, _health_dict) in zip(namespace_list, _data_list)
+                          for _service_rest in _data['services']]
+        _healths = self._map(
+            lambda _item: self.get_service_health(
+                namespace=_item[0],
+                service_name=_item[1]['name'],
+                istioSidecar=_item[1]['istioSidecar'],
+                namespace_health=_item[2]),
+            _services_rest)
+        # update all the services to our custom entity
+        for (_namespace, _service_rest, _), _service_health in zip(_services_rest, _healths):
+            items.append(self._get_service(_namespace, _service_rest, _service_health))
         return items
 
+    def _get_service(self, namespace, service_rest, service_health):
+        """ Returns Service entity from serviceList item and its health """
+        return Service(
+            namespace=namespace,
+            name=service_rest['name'],
+            istio_sidecar=service_rest['istioSidecar'],
+            health=service_health.is_healthy() if service_health else None,
+            service_status=service_health,
+            icon=self.get_icon_type(service_rest),
+            labels=self.get_labels(service_rest))
+
     def overview_list(self, namespaces=[], overview_type=OverviewPageType.APPS):
         """Returns list of overviews.
         Args:
             namespaces: can be zero or any number of namespaces
         """
-        overviews = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
+        # one namespaceList per call, for the namespaces and their labels
+        _namespace_index = self.namespace_index()
+        namespace_list = self._get_namespaces(namespaces, _namespace_index)
+        # fetch the items of all namespaces at once, then split them per namespace
+        if overview_type == OverviewPageType.SERVICES:
+            _all_items = self.service_list(namespace_list)
+        elif overview_type == OverviewPageType.WORKLOADS:
+            _all_items = self.workload_list(namespace_list)
         else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
-            if overview_type == OverviewPageType.SERVICES:
-                _items = self.service_list([_namespace])
-            elif overview_type == OverviewPageType.WORKLOADS:
-                _items = self.workload_list([_namespace])
-            else:
-                _items = self.application_list([_namespace])
-
-            _healthy = 0
-            _unhealthy = 0
-            _degraded = 0
-            _na = 0
-            _idle = 0
-            for _item in _items:
-                if _item.health == HEALTH_TYPE.HEALTHY:
-                    _healthy += 1
-                if _item.health == HEALTH_TYPE.DEGRADED:
-                    _degraded += 1
-                if _item.health == HEALTH_TYPE.FAILURE:
-                    _unhealthy += 1
-                if _item.health == HEALTH_TYPE.NA:
-                    _na += 1
-                if _item.health == HEALTH_TYPE.IDLE:
-                    _idle += 1
-            _overview = Overview(
-                overview_type=overview_type.text,
-                namespace=_namespace,
-                items=len(_items),
-                healthy=_healthy,
-                unhealthy=_unhealthy,
-                degraded=_degraded,
-                na=_na,
-                idle=_idle,
-                labels=self.namespace_labels(_namespace))
-            overviews.append(_overview)
-        return overviews
+            _all_items = self.application_list(namespace_list)
+        return self._get_overviews(namespace_list, _all_items, overview_type, _namespace_index)
+
+    def _get_overviews(self, namespace_list, all_items, overview_type, namespace_index):
+        """ Returns Overview entities of namespaces from the items of all of them """
+        _items_dict = {}
+        for _item in all_items:
+            _items_dict.setdefault(_item.namespace, []).append(_item)
+        return [self._get_overview(_namespace, _items_dict.get(_namespace, []), overview_type,
+                                   self.namespace_labels(_namespace, namespace_index))
+                for _namespace in namespace_list]
+
+    def _get_overview(self, namespace, items, overview_type, labels):
+        """ Returns Overview entity of namespace from its items """
+        _healthy = 0
+        _unhealthy = 0
+        _degraded = 0
+        _na = 0
+        _idle = 0
+        for _item in items:
+            if _item.health == HEALTH_TYPE.HEALTHY:
+                _healthy += 1
+            if _item.health == HEALTH_TYPE.DEGRADED:
+                _degraded += 1
+            if _item.health == HEALTH_TYPE.FAILURE:
+                _unhealthy += 1
+            if _item.health == HEALTH_TYPE.NA:
+                _na += 1
+            if _item.health == HEALTH_TYPE.IDLE:
+                _idle += 1
+        return Overview(
+            overview_type=overview_type.text,
+            namespace=namespace,
+            items=len(items),
+            healthy=_healthy,
+            unhealthy=_unhealthy,
+            degraded=_degraded,
+            na=_na,
+            idle=_idle,
+            labels=labels)
 
     def application_list(self, namespaces=[]):
         """Returns list of applications.
@@ -176,189 +296,121 @@ class KialiExtendedClient(KialiClient):
             application_names: can be zero or any number of applications
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('appList', path={'namespace': _namespace})
-            _applications = _data['applications']
-            if _applications:
-                for _application_rest in _applications:
-                    _app_health = self.get_app_health(
-                            namespace=_namespace,
-                            app_name=_application_rest['name'])
-                    _application = Application(
-                        namespace=_namespace,
-                        name=_application_rest['name'],
-                        istio_sidecar=_application_rest['istioSidecar'],
-                        health=_app_health.is_healthy() if _app_health else None,
-                        application_status=_app_health,
-                        labels=self.get_labels(_application_rest))
-                    items.append(_application)
+        namespace_list = self._get_namespaces(namespaces)
+        _data_list = self._map(
+            lambda _namespace: (
+                self.get_response('appList', path={'namespace': _namespace}),
+                self.get_namespace_health(_namespace, 'app')),
+            namespace_list)
+        _applications_rest = [(_namespace, _application_rest, _health_dict)
+                              for _namespace, (_data, _health_dict) in zip(namespace_list,
+                                                                           _data_list)
+                              if _data['applications']
+                              for _application_rest in _data['applications']]
+        _healths = self._map(
+            lambda _item: self.get_app_health(
+                namespace=_item[0],
+                app_name=_item[1]['name'],
+                namespace_health=_item[2]),
+            _applications_rest)
+        for (_namespace, _application_rest, _), _app_health in zip(_applications_rest,
+                                                                   _healths):
+            items.append(self._get_application(_namespace, _application_rest, _app_health))
         return items
 
+    def _get_application(self, namespace, application_rest, app_health):
+        """ Returns Application entity from appList item and its health """
+        return Application(
+            namespace=namespace,
+            name=application_rest['name'],
+            istio_sidecar=application_rest['istioSidecar'],
+            health=app_health.is_healthy() if app_health else None,
+            application_status=app_health,
+            labels=self.get_labels(application_rest))
+
     def workload_list(self, namespaces=[]):
         """Returns list of workloads.
         Args:
             namespaces: can be zero or any number of namespaces
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('workloadList', path={'namespace': _namespace})
-            _workloads = _data['workloads']
-            if _workloads:
-                for _workload_rest in _workloads:
-                    _workload_health = self.get_workload_health(
-                        namespace=_namespace,
-                        workload_name=_workload_rest['name'])
-                    _workload = Workload(
-                        namespace=_namespace,
-                        name=_workload_rest['name'],
-                        workload_type=_workload_rest['type'],
-                        istio_sidecar=_workload_rest['istioSidecar'],
-                        labels=self.get_labels(_workload_rest),
-                        health=_workload_health.is_healthy() if _workload_health else None,
-                        icon=self.get_icon_type(_workload_rest),
-                        workload_status=_workload_health)
-                    items.append(_workload)
+        namespace_list = self._get_namespaces(namespaces)
+        _data_list = self._map(
+            lambda _namespace: (
+                self.get_response('workloadList', path={'namespace': _namespace}),
+                self.get_namespace_health(_namespace, 'workload')),
+            namespace_list)
+        _workloads_rest = [(_namespace, _workload_rest, _health_dict)
+                           for _namespace, (_data, _health_dict) in zip(namespace_list, _data_list)
+                           if _data['workloads']
+                           for _workload_rest in _data['workloads']]
+        _healths = self._map(
+            lambda _item: self.get_workload_health(
+                namespace=_item[0],
+                workload_name=_item[1]['name'],
+                namespace_health=_item[2]),
+            _workloads_rest)
+        for (_namespace, _workload_rest, _), _workload_health in zip(_workloads_rest,
+                                                                     _healths):
+            items.append(self._get_workload(_namespace, _workload_rest, _workload_health))
         return items
 
+    def _get_workload(self, namespace, workload_rest, workload_health):
+        """ Returns Workload entity from workloadList item and its health """
+        return Workload(
+            namespace=namespace,
+            name=workload_rest['name'],
+            workload_type=workload_rest['type'],
+            istio_sidecar=workload_rest['istioSidecar'],
+            labels=self.get_labels(workload_rest),
+            health=workload_health.is_healthy() if workload_health else None,
+            icon=self.get_icon_type(workload_rest),
+            workload_status=workload_health)
+
     def istio_config_list(self, namespaces=[], config_names=[], params=None):
         """Returns list of istio config.
         Args:
             namespaces: can be zero or any number of namespaces
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
-            _data = self.get_response(
-                'istioConfigList', path={'namespace': _namespace}, params=params)
-
-            # update DestinationRule
-            if len(_data['destinationRules']) > 0 and len(_data['destinationRules']['items']) > 0:
-                for _policy in _data['destinationRules']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.DESTINATION_RULE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'destinationrules',
-                                                                    _policy['metadata']['name'])))
-
-            # update VirtualService
-            if len(_data['virtualServices']) > 0 and len(_data['virtualServices']['items']) > 0:
-                for _policy in _data['virtualServices']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.VIRTUAL_SERVICE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'virtualservices',
-                                                                    _policy['metadata']['name'])))
-
-            # update Policy
-            if len(_data['peerAuthentications']) > 0:
-                for _policy in _data['peerAuthentications']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.PEER_AUTHENTICATION.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'peerauthentications',
-                                                                    _policy['metadata']['name'])))
-
-            # update RequestAuthentication
-            if len(_data['requestAuthentications']) > 0:
-                for _policy in _data['requestAuthentications']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.REQUEST_AUTHENTICATION.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'requestauthentications',
-                                                                    _policy['metadata']['name'])))
-
-            # update Gateway
-            if len(_data['gateways']) > 0:
-                for _policy in _data['gateways']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.GATEWAY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'gateways',
-                                                                    _policy['metadata']['name'])))
-
-            # update EnvoyFilter
-            if len(_data['envoyFilters']) > 0 and len(_data['envoyFilters']) > 0:
-                for _policy in _data['envoyFilters']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.ENVOY_FILTER.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'envoyfilters',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceEntries
-            if len(_data['serviceEntries']) > 0:
-                for _policy in _data['serviceEntries']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ENTRY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'serviceentries',
-                                                                    _policy['metadata']['name'])))
-
-            # update WorkloadEntries
-            if len(_data['workloadEntries']) > 0:
-                for _policy in _data['workloadEntries']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.WORKLOAD_ENTRY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'workloadentries',
-                                                                    _policy['metadata']['name'])))
-
-            # update sidecars
-            if len(_data['sidecars']) > 0:
-                for _policy in _data['sidecars']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SIDECAR.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'sidecars',
-                                                                    _policy['metadata']['name'])))
-
-            # update authorizationPolicies
-            if len(_data['authorizationPolicies']) > 0:
-                for _policy in _data['authorizationPolicies']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.AUTHORIZATION_POLICY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'authorizationpolicies',
-                                                                    _policy['metadata']['name'])))
-
-        # apply filters
+        namespace_list = self._get_namespaces(namespaces)
+        _params = dict(params) if params else {}
+        _params['validate'] = 'true'
+        _data_list = self._map(
+            lambda _namespace: self.get_response(
+                'istioConfigList', path={'namespace': _namespace}, params=_params),
+            namespace_list)
+        _configs_rest = self._get_configs_rest(namespace_list, _data_list)
+        # validations are taken from the list response, older Kiali needs a call per config
+        _validations = self._map(
+            lambda _item: self.get_istio_config_validation(_item[0], _item[2], _item[3])
+            if _item[4] is None
+            else _item[4].get((_item[1].text.lower(), _item[3]), IstioConfigValidation.NA),
+            _configs_rest)
+        for (_namespace, _object_type, _config_type, _name, _), _validation in zip(
+                _configs_rest, _validations):
+            items.append(IstioConfig(
+                name=_name,
+                namespace=_namespace,
+                object_type=_object_type.text,
+                validation=_validation))
+        return self._filter_configs(items, config_names)
+
+    def _get_configs_rest(self, namespace_list, data_list):
+        """Returns list of (namespace, object_type, config_type, name, validations_dict)
+        of all configs in istioConfigList responses of namespaces.
+        """
+        _configs_rest = []
+        for _namespace, _data in zip(namespace_list, data_list):
+            _validations_dict = self._get_validations_dict(_data)
+            for _key, _object_type, _config_type in ISTIO_CONFIG_LIST_KEYS:
+                for _policy in self._get_config_items(_data[_key]):
+                    _configs_rest.append((_namespace, _object_type, _config_type,
+                                          _policy['metadata']['name'], _validations_dict))
+        return _configs_rest
+
+    def _filter_configs(self, items, config_names):
+        """ Returns set of configs which names contain any of config_names, or all items """
         if len(config_names) > 0:
             name_filtered_list = []
             for _name in config_names:
@@ -366,6 +418,47 @@ class KialiExtendedClient(KialiClient):
             return set(name_filtered_list)
         return items
 
+    def get_istio_config_validations(self, namespaces=[]):
+        """Returns Validations of all Istio Configs with one request per namespace.
+        Result is dictionary keyed by namespace of dictionaries keyed by (object_type, name),
+        where object_type is the lower case kind, e.g. 'destinationrule'.
+        Namespaces without validations in the response are mapped to None.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        namespace_list = self._get_namespaces(namespaces)
+        _data_list = self._map(
+            lambda _namespace: self.get_response(
+                'istioConfigList', path={'namespace': _namespace},
+                params={'validate': 'true'}),
+            namespace_list)
+        return {_namespace: self._get_validations_dict(_data)
+                for _namespace, _data in zip(namespace_list, _data_list)}
+
+    def _get_validations_dict(self, config_list_rest):
+        """Returns dictionary of IstioConfigValidation keyed by (object_type, name)
+        from istioConfigList response, None if response does not contain validations.
+        """
+        if 'validations' not in config_list_rest:
+            return None
+        _validations = {}
+        if config_list_rest['validations']:
+            for _object_type, _objects in config_list_rest['validations'].items():
+                for _name, _validation_data in _objects.items():
+                    _validations[(_object_type, _name)] = self._get_validation_status(
+                        _validation_data)
+        return _validations
+
+    def _get_config_items(self, config_rest):
+        """Returns the list of configs from istioConfigList response value.
+        DestinationRules and VirtualServices are wrapped in 'items', others are plain lists.
+        """
+        if not config_rest:
+            return []
+        if isinstance(config_rest, dict):
+            return config_rest['items'] if 'items' in config_rest else []
+        return config_rest
+
     def istio_config_details(self, namespace, object_type, object_name):
         """Returns details of istio config or None if does not exist.
         Args:
@@ -376,63 +469,67 @@ class KialiExtendedClient(KialiClient):
         config_type = ISTIO_CONFIG_TYPES[object_type]
         _data = self.get_response('istioConfigDetails',
                                   path={'namespace': namespace, 'object_type': config_type,
-                                        'object': object_name})
+                                        'object': object_name},
+                                  params={'validate': 'true'})
+        return self._get_istio_config_details(_data)
+
+    def _get_istio_config_details(self, config_rest):
+        """ Returns IstioConfigDetails from istioConfigDetails response or None """
         config = None
         config_data = None
-        if 'error' in _data:
-            raise NoSuchElementException(_data['error'])
+        if 'error' in config_rest:
+            raise NoSuchElementException(config_rest['error'])
         else:
             # get DestinationRule
-            if _data['destinationRule']:
-                config_data = _data['destinationRule']
+            if config_rest['destinationRule']:
+                config_data = config_rest['destinationRule']
 
             # get VirtualService
-            if _data['virtualService']:
-                config_data = _data['virtualService']
+            if config_rest['virtualService']:
+                config_data = config_rest['virtualService']
 
             # get EnvoyFilter
-            if _data['envoyFilter']:
-                config_data = _data['envoyFilter']
+            if config_rest['envoyFilter']:
+                config_data = config_rest['envoyFilter']
 
             # get Gateway
-            if _data['gateway']:
-                config_data = _data['gateway']
+            if config_rest['gateway']:
+                config_data = config_rest['gateway']
 
             # get serviceEntry
-            if _data['serviceEntry']:
-                config_data = _data['serviceEntry']
+            if config_rest['serviceEntry']:
+                config_data = config_rest['serviceEntry']
 
             # get workloadEntry
-            if _data['workloadEntry']:
-                config_data = _data['workloadEntry']
+            if config_rest['workloadEntry']:
+                config_data = config_rest['workloadEntry']
 
             # get PeerAuthentication
-            if _data['peerAuthentication']:
-                config_data = _data['peerAuthentication']
+            if config_rest['peerAuthentication']:
+                config_data = config_rest['peerAuthentication']
 
             # get RequestAuthentication
-            if _data['requestAuthentication']:
-                config_data = _data['requestAuthentication']
+            if config_rest['requestAuthentication']:
+                config_data = config_rest['requestAuthentication']
 
             # get sidecar
-            if _data['sidecar']:
-                config_data = _data['sidecar']
+            if config_rest['sidecar']:
+                config_data = config_rest['sidecar']
 
             # get authorizationPolicy
-            if _data['authorizationPolicy']:
-                config_data = _data['authorizationPolicy']
+            if config_rest['authorizationPolicy']:
+                config_data = config_rest['authorizationPolicy']
 
             if config_data:
+                # validation is part of the same response
+                _validation = IstioConfigValidationResult.get_from_rest(
+                    config_rest['validation'] if 'validation' in config_rest else None)
                 config = IstioConfigDetails(
                     name=config_data['metadata']['name'],
-                    _type=_data['objectType'],
+                    _type=config_rest['objectType'],
                     text=json.dumps(config_data),
-                    validation=self.get_istio_config_validation(namespace,
-                                                                config_type,
-                                                                object_name),
-                    error_messages=self.get_istio_config_messages(namespace,
-                                                                  config_type,
-                                                                  object_name))
+                    validation=_validation.validation,
+                    error_messages=_validation.messages)
         return config
 
     def service_details(self, namespace, service_name):
@@ -447,9 +544,8 @@ class KialiExtendedClient(KialiClient):
                                           params={'validate': 'true'})
         _service = None
         if _service_data:
-            _services_rest = self.service_list(namespaces=[namespace])
-            _service_rest = set([_s for _s in _services_rest
-                                if _s.name == service_name]).pop()
+            _istio_sidecar = self._get_istio_sidecar(_service_data, 'serviceList', 'services',
+                                                     namespace, service_name)
             workloads = []
             if _service_data['workloads']:
                 for _wl_data in _service_data['workloads']:
@@ -570,10 +666,10 @@ class KialiExtendedClient(KialiClient):
             _service_health = self.get_service_health(
                 namespace=namespace,
                 service_name=service_name,
-                istioSidecar=_service_rest.istio_sidecar)
+                istioSidecar=_istio_sidecar)
             _service = ServiceDetails(
                     name=_service_data['service']['name'],
-                    istio_sidecar=_service_rest.istio_sidecar,
+                    istio_sidecar=_istio_sidecar,
                     created_at=from_rest_to_ui(
                         _service_data['service']['createdAt']),
                     resource_version=_service_data['service']['resourceVersion'],
@@ -606,9 +702,8 @@ class KialiExtendedClient(KialiClient):
                                            path={'namespace': namespace, 'workload': workload_name})
         _workload = None
         if _workload_data:
-            _workloads_rest = self.workload_list(namespaces=[namespace])
-            _workload_rest = set([_w for _w in _workloads_rest
-                                  if _w.name == workload_name]).pop()
+            _istio_sidecar = self._get_istio_sidecar(_workload_data, 'workloadList', 'workloads',
+                                                     namespace, workload_name)
             _services = []
             if _workload_data['services']:
                 for _ws_data in _workload_data['services']:
@@ -649,7 +744,7 @@ class KialiExtendedClient(KialiClient):
 
             _workload = WorkloadDetails(
                 name=_workload_data['name'],
-                istio_sidecar=_workload_rest.istio_sidecar,
+                istio_sidecar=_istio_sidecar,
                 workload_type=_workload_data['type'],
                 created_at=from_rest_to_ui(_workload_data['createdAt']),
                 resource_version=_workload_data['resourceVersion'],
@@ -675,15 +770,19 @@ class KialiExtendedClient(KialiClient):
                                                     'app': application_name})
         _application = None
         if _application_data:
-            _applications_rest = self.application_list(namespaces=[namespace])
-            _application_rest = set([_a for _a in _applications_rest
-                                     if _a.name == application_name]).pop()
             _workloads = []
             if _application_data['workloads']:
                 for _wl_data in _application_data['workloads']:
                     _workloads.append(AppWorkload(
                         name=_wl_data['workloadName'],
                         istio_sidecar=_wl_data['istioSidecar']))
+            if 'istioSidecar' not in _application_data and _application_data['workloads']:
+                # same as in appList, application has sidecar when all its workloads have
+                _istio_sidecar = all([_wl.istio_sidecar for _wl in _workloads])
+            else:
+                _istio_sidecar = self._get_istio_sidecar(_application_data, 'appList',
+                                                         'applications', namespace,
+                                                         application_name)
             _services = []
             if 'serviceNames' in _application_data:
                 for _service in _application_data['serviceNames']:
@@ -693,66 +792,153 @@ class KialiExtendedClient(KialiClient):
                             app_name=_application_data['name'])
             _application = ApplicationDetails(
                 name=_application_data['name'],
-                istio_sidecar=_application_rest.istio_sidecar,
+                istio_sidecar=_istio_sidecar,
                 health=_app_health.is_healthy() if _app_health else None,
                 application_status=_app_health,
                 workloads=_workloads,
                 services=_services)
         return _application
 
+    def get_namespace_health(self, namespace, health_type,
+                             time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+        """Returns dictionary of Health data of all items in namespace keyed by item name,
+        or None if Kiali does not provide namespace health.
+        Args:
+            namespace: namespace of the items
+            health_type: type of the items, 'app', 'service' or 'workload'
+            time_interval: The rate interval used for fetching error rate
+        """
+
+        _request = self._namespace_health_request(namespace, health_type, time_interval)
+        if _request is None:
+            return None
+        try:
+            _health_data = self.get_response(**_request)
+        except Exception as ex:
+            return self._namespace_health_failed(namespace, ex)
+        return self._get_namespace_health(namespace, _health_data)
+
+    def _namespace_health_request(self, namespace, health_type, time_interval):
+        """Returns get_response arguments of namespaceHealth request, None when Kiali does
+        not provide namespace health.
+        """
+        if not self._namespace_health_supported:
+            return None
+        if not self._has_operation('namespaceHealth'):
+            logger.warning('Namespace health is not available in Kiali, falling back to '
+                           'per item health')
+            self._namespace_health_supported = False
+            return None
+        return {'method_name': 'namespaceHealth',
+                'path': {'namespace': namespace},
+                'params': {'type': health_type, 'rateInterval': time_interval}}
+
+    def _namespace_health_failed(self, namespace, ex):
+        # transient failure, next calls try namespace health again
+        logger.warning('Namespace health of {} failed, falling back to per item health. '
+                       'Exception: {}'.format(namespace, ex))
+        return None
+
+    def _get_namespace_health(self, namespace, health_data):
+        """ Returns namespaceHealth response, None when it is an error """
+        if not isinstance(health_data, dict) or 'error' in health_data:
+            logger.debug('Namespace health of {} is not available: {}'.format(
+                namespace, health_data))
+            return None
+        return health_data
+
+    def _get_istio_sidecar(self, details_rest, method_name, items_key, namespace, name):
+        """Returns istioSidecar of the details response, or of the matching item of
+        the namespace list response when details do not contain it.
+        Args:
+            details_rest: details response
+            method_name: list method, e.g. 'serviceList'
+            items_key: key of the items in the list response, e.g. 'services'
+            namespace: namespace of the item
+            name: name of the item
+        """
+        if 'istioSidecar' in details_rest:
+            return details_rest['istioSidecar']
+        _data = self.get_response(method_name, path={'namespace': namespace})
+        for _item in _data[items_key] or []:
+            if _item['name'] == name:
+                return _item['istioSidecar']
+        return None
+
     def get_service_health(self, namespace, service_name, istioSidecar,
-                           time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                           time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                           namespace_health=None):
         """Returns Health of Service.
         Args:
             namespaces: namespace where Service is located
             service_name: name of Service
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, fetched per Service if None
         """
 
         if not istioSidecar:  # without sidecar no health is available
-            return ServiceHealth(requests=Requests(errorRatio=-0.01))
-
-        _health_data = self.get_response(method_name='serviceHealth',
-                                         path={'namespace': namespace, 'service': service_name},
-                                         params={'rateInterval': time_interval})
-        if _health_data:
-            return ServiceHealth.get_from_rest(_health_data)
-        else:
-            return None
+            return self._get_service_health_without_sidecar()
+        _request = self._item_health_request('service', namespace, service_name, time_interval,
+                                             namespace_health)
+        return self._get_item_health('service', service_name, namespace_health,
+                                     self.get_response(**_request) if _request else None)
 
     def get_workload_health(self, namespace, workload_name,
-                            time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                            time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                            namespace_health=None):
         """Returns Health of Workload.
         Args:
             namespaces: namespace where Workload is located
             workload_name: name of Workload
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, fetched per Workload if None
         """
 
-        _health_data = self.get_response(method_name='workloadHealth',
-                                         path={'namespace': namespace, 'workload': workload_name},
-                                         params={'rateInterval': time_interval})
-        if _health_data:
-            return WorkloadHealth.get_from_rest(_health_data)
-        else:
-            return None
+        _request = self._item_health_request('workload', namespace, workload_name,
+                                             time_interval, namespace_health)
+        return self._get_item_health('workload', workload_name, namespace_health,
+                                     self.get_response(**_request) if _request else None)
 
     def get_app_health(self, namespace, app_name,
-                       time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                       time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                       namespace_health=None):
         """Returns Health of Application.
         Args:
             namespaces: namespace where Application is located
             workload_name: name of Application
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, fetched per Application if None
         """
 
-        _health_data = self.get_response(method_name='appHealth',
-                                         path={'namespace': namespace, 'app': app_name},
-                                         params={'rateInterval': time_interval})
-        if _health_data:
-            return ApplicationHealth.get_from_rest(_health_data)
-        else:
+        _request = self._item_health_request('app', namespace, app_name, time_interval,
+                                             namespace_health)
+        return self._get_item_health('app', app_name, namespace_health,
+                                     self.get_response(**_request) if _request else None)
+
+    def _get_service_health_without_sidecar(self):
+        return ServiceHealth(requests=Requests(errorRatio=-0.01))
+
+    def _item_health_request(self, health_type, namespace, name, time_interval,
+                             namespace_health):
+        """Returns get_response arguments of health request of one item, None when its
+        health is taken from namespace_health, the result of get_namespace_health.
+        """
+        if namespace_health is not None:
             return None
+        _method_name, _path_name, _ = ITEM_HEALTH[health_type]
+        return {'method_name': _method_name,
+                'path': {'namespace': namespace, _path_name: name},
+                'params': {'rateInterval': time_interval}}
+
+    def _get_item_health(self, health_type, name, namespace_health, health_data=None):
+        """Returns Health entity of item from namespace_health, or from health_data of its
+        own request when namespace_health is None. None when there is no health data.
+        """
+        if namespace_health is not None:
+            health_data = namespace_health.get(name)
+        if health_data:
+            return ITEM_HEALTH[health_type][2].get_from_rest(health_data)
+        return None
 
     def get_istio_config_validation(self, namespace, object_type, object_name):
         """Returns Validation of Istio Config.
@@ -762,20 +948,27 @@ class KialiExtendedClient(KialiClient):
             object: name of Config
         """
 
+        return self.get_istio_config_validation_result(namespace,
+                                                       object_type,
+                                                       object_name).validation
+
+    def get_istio_config_validation_result(self, namespace, object_type, object_name):
+        """Returns Validation of Istio Config with severity, messages and references.
+        Args:
+            namespaces: namespace where Config is located
+            object_type: type of the Config
+            object: name of Config
+        """
+
         _health_data = self.get_validation('istioConfigDetails',
                                            namespace=namespace,
                                            object_type=object_type,
                                            object=object_name)
-        if _health_data:
-            if len(_health_data['checks']) > 0:
-                if 'error' in set(check['severity'] for check in _health_data['checks']):
-                    return IstioConfigValidation.NOT_VALID
-                else:
-                    return IstioConfigValidation.WARNING
-            else:
-                return IstioConfigValidation.VALID
-        else:
-            return IstioConfigValidation.NA
+        return IstioConfigValidationResult.get_from_rest(_health_data)
+
+    def _get_validation_status(self, validation_data):
+        """Returns IstioConfigValidation of Validation from rest response"""
+        return IstioConfigValidationResult.get_from_rest(validation_data).validation
 
     def get_istio_config_messages(self, namespace, object_type, object_name):
         """Returns Validation Messages of Istio Config.
@@ -784,17 +977,9 @@ class KialiExtendedClient(KialiClient):
             object_type: type of the Config
             object: name of Config
         """
-        _error_messages = []
-
-        _health_data = self.get_validation('istioConfigDetails',
-                                           namespace=namespace,
-                                           object_type=object_type,
-                                           object=object_name)
-        if _health_data:
-            if len(_health_data['checks']) > 0:
-                for _check in _health_data['checks']:
-                    _error_messages.append(_check['message'])
-        return _error_messages
+        return self.get_istio_config_validation_result(namespace,
+                                                       object_type,
+                                                       object_name).messages
 
     def create_istio_config(self, body, namespace, kind, api_version):
         """Creates Istio Config.
@@ -873,35 +1058,113 @@ class KialiExtendedClient(KialiClient):
             _selectors = object_rest['selectors']
         return _selectors
 
+    def request(self, method_name=None, path=None, params=None, plain_url=None,
+                http_method='GET', data=None):
+        with metrics.measure('kiali.{}'.format(method_name or plain_url)) as _measure:
+            _response = self._request(method_name=method_name, path=path, params=params,
+                                      plain_url=plain_url, http_method=http_method, data=data)
+            _measure['response_bytes'] = len(_response.content)
+            _measure['error'] = _response.status_code >= 400
+        return _response
+
+    def _request(self, method_name=None, path=None, params=None, plain_url=None,
+                 http_method='GET', data=None):
+        if self.cassette is None:
+            return self._send(method_name=method_name, path=path, params=params,
+                              plain_url=plain_url, http_method=http_method, data=data)
+        _key = Cassette.get_key('kiali', http_method, method_name or plain_url, path, params,
+                                data)
+        if self.cassette.replaying:
+            return CassetteResponse(**self.cassette.replay(_key))
+        _response = self._send(method_name=method_name, path=path, params=params,
+                               plain_url=plain_url, http_method=http_method, data=data)
+        self.cassette.record(_key, {'status_code': _response.status_code,
+                                    'content': _response.content.decode('utf-8')})
+        return _response
+
+    def _send(self, method_name=None, path=None, params=None, plain_url=None,
+              http_method='GET', data=None):
+        if self.transport is None:
+            return super(KialiExtendedClient, self).request(
+                method_name=method_name, path=path, params=params, plain_url=plain_url,
+                http_method=http_method, data=data)
+        # same url handling as in KialiClient.request
+        if plain_url is None:
+            return self.transport.request(
+                url=self.swagger_parser.construct_url(method_name, path, params),
+                http_method=http_method, data=data)
+        else:
+            return self.transport.request(
+                url=plain_url, params=params, http_method=http_method, data=data)
+
+    def _has_operation(self, method_name):
+        """ Returns False when the swagger file has no operation method_name """
+        if self.swagger_parser is None:
+            # replayed responses need no swagger file
+            return True
+        return self.swagger_parser.swagger.operation.get(method_name) is not None
+
+    def connection_stats(self):
+        """ Returns connection statistics of pooled transport, None if it is not used """
+        return self.transport.stats.to_dict() if self.transport else None
+
     def get_response(self, method_name, path=None, params=None):
-        return super(KialiExtendedClient, self).request(method_name=method_name, path=path,
-                                                        params=params).json()
+        if self.cache is None:
+            return self.request(method_name=method_name, path=path, params=params).json()
+        _key = ResponseCache.get_key(method_name, path, params)
+        _cached = self.cache.get(_key)
+        if _cached is not None:
+            return _cached
+        _response = self.request(method_name=method_name, path=path, params=params)
+        _result = _response.json()
+        if _response.ok:
+            self.cache.put(_key, _response.content,
+                           namespace=path.get('namespace') if path else None)
+        return _result
 
     def post_response(self, method_name, data, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        self._invalidate_cache(kwargs)
+        _response = self.request(
             method_name=method_name,
             path=kwargs,
             http_method="POST",
             data=json.dumps(data))
+        self._invalidate_cache(kwargs)
+        return _response
 
     def patch_response(self, method_name, data, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        self._invalidate_cache(kwargs)
+        _response = self.request(
             method_name=method_name,
             path=kwargs,
             http_method="PATCH",
             data=json.dumps(data))
+        self._invalidate_cache(kwargs)
+        return _response
 
     def delete_response(self, method_name, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        self._invalidate_cache(kwargs)
+        _response = self.request(
             method_name=method_name,
             path=kwargs,
             http_method="DELETE")
+        self._invalidate_cache(kwargs)
+        return _response
+
+    def _invalidate_cache(self, path):
+        """Drops cached responses affected by a write to the namespace in path.
+        Called before and after the write, responses cached by list workers while the write
+        is in flight are dropped too. Writes made through OpenshiftExtendedClient or oc do not
+        invalidate the cache, their changes are seen after cache_ttl.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(namespace=path.get('namespace'))
 
     def get_validation(self, method_name, **kwargs):
-        response = super(KialiExtendedClient, self).request(
+        response = self.get_response(
             method_name=method_name,
             path=kwargs,
-            params={'validate': 'true'}).json()
+            params={'validate': 'true'})
         return response['validation'] if 'validation' in response else None
 
     def get_pod_status(self, istioSidecar, pod_data):
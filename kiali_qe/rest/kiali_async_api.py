@@ -0,0 +1,414 @@
+import asyncio
+import json
+import ssl
+from functools import partial
+
+import aiohttp
+from requests.auth import HTTPBasicAuth
+from requests.utils import dict_from_cookiejar
+
+from kiali_qe.components.enums import (
+    IstioConfigValidation,
+    OverviewPageType,
+    TimeIntervalRestParam
+)
+from kiali_qe.entities.istio_config import IstioConfig, IstioConfigValidationResult
+from kiali_qe.rest.cache import ResponseCache
+from kiali_qe.rest.cassette import Cassette, CassetteResponse
+from kiali_qe.rest.kiali_api import ISTIO_CONFIG_TYPES, KialiExtendedClient
+from kiali_qe.rest.metrics import metrics
+from kiali_qe.utils.log import logger
+
+
+class AsyncKialiExtendedClient(object):
+    """
+    asyncio variant of KialiExtendedClient. Public methods are coroutines with the same
+    arguments and results. All requests share one aiohttp session and at most
+    'concurrency' of them are in flight, so thousands of health and validation calls
+    can be gathered without a thread per request.
+
+    Swagger url building, authentication, timeouts, response cache and parsing of
+    responses are shared with the wrapped synchronous client, this class does the I/O only.
+    Details methods make a few dependent requests only, they run the synchronous client
+    in the default executor.
+
+    Args:
+        concurrency: maximum number of requests in flight
+        kwargs: arguments of KialiExtendedClient
+    """
+
+    def __init__(self, concurrency=100, **kwargs):
+        self.client = KialiExtendedClient(**kwargs)
+        self.concurrency = concurrency
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        # created lazily, aiohttp session has to be created in a running event loop
+        if self._session is None:
+            _connector = self.client.api_connector
+            _auth = None
+            _timeout = aiohttp.ClientTimeout(
+                sock_connect=self._get_timeout(self.client.connect_timeout),
+                sock_read=self._get_timeout(self.client.read_timeout))
+            if isinstance(_connector.auth, HTTPBasicAuth):
+                _auth = aiohttp.BasicAuth(_connector.auth.username, _connector.auth.password)
+            self._session = aiohttp.ClientSession(
+                auth=_auth,
+                cookies=dict_from_cookiejar(_connector.cookies)
+                if _connector.cookies is not None else None,
+                headers={'Content-Type': 'application/json'},
+                timeout=_timeout,
+                connector=aiohttp.TCPConnector(limit=self.concurrency,
+                                               ssl=self._get_ssl(_connector.verify)))
+        return self._session
+
+    def _get_ssl(self, verify):
+        # verify of requests session is a boolean or a CA bundle path
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return bool(verify)
+
+    def _get_timeout(self, timeout):
+        return float(timeout) if timeout is not None else None
+
+    async def request(self, method_name, path=None, params=None, http_method='GET', data=None):
+        """ Returns response with status_code, ok, text, content and json() """
+        _cassette = self.client.cassette
+        if _cassette is not None:
+            # same key as in KialiExtendedClient, cassettes are shared by both clients
+            _key = Cassette.get_key('kiali', http_method, method_name, path, params, data)
+            if _cassette.replaying:
+                return CassetteResponse(**_cassette.replay(_key))
+        _url = self.client.api_connector.retrieve_url(
+            self.client.swagger_parser.construct_url(method_name, path, params))
+        with metrics.measure('kiali.{}'.format(method_name)) as _measure:
+            async with self._get_session().request(http_method, _url, data=data) as _response:
+                _body = await _response.read()
+            _measure['response_bytes'] = len(_body)
+            _measure['error'] = _response.status >= 400
+        _response = CassetteResponse(_response.status, _body.decode('utf-8'))
+        if _cassette is not None:
+            _cassette.record(_key, {'status_code': _response.status_code,
+                                    'content': _response.text})
+        return _response
+
+    async def get_response(self, method_name, path=None, params=None):
+        _cache = self.client.cache
+        if _cache is not None:
+            _key = ResponseCache.get_key(method_name, path, params)
+            _cached = _cache.get(_key)
+            if _cached is not None:
+                return _cached
+        _response = await self.request(method_name, path=path, params=params)
+        _result = _response.json()
+        if _cache is not None and _response.ok:
+            _cache.put(_key, _response.content,
+                       namespace=path.get('namespace') if path else None)
+        return _result
+
+    async def post_response(self, method_name, data, **kwargs):
+        self.client._invalidate_cache(kwargs)
+        _response = await self.request(method_name, path=kwargs, http_method='POST',
+                                       data=json.dumps(data))
+        self.client._invalidate_cache(kwargs)
+        return _response
+
+    async def patch_response(self, method_name, data, **kwargs):
+        self.client._invalidate_cache(kwargs)
+        _response = await self.request(method_name, path=kwargs, http_method='PATCH',
+                                       data=json.dumps(data))
+        self.client._invalidate_cache(kwargs)
+        return _response
+
+    async def delete_response(self, method_name, **kwargs):
+        self.client._invalidate_cache(kwargs)
+        _response = await self.request(method_name, path=kwargs, http_method='DELETE')
+        self.client._invalidate_cache(kwargs)
+        return _response
+
+    async def get_validation(self, method_name, **kwargs):
+        response = await self.get_response(method_name, path=kwargs,
+                                           params={'validate': 'true'})
+        return response['validation'] if 'validation' in response else None
+
+    async def _run_sync(self, function, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(function, *args, **kwargs))
+
+    async def namespace_index(self):
+        """ Returns dictionary of namespace rest data keyed by namespace name """
+        return self.client._get_namespace_index(await self.get_response('namespaceList'))
+
+    async def namespace_list(self):
+        """ Returns list of namespaces """
+        return list((await self.namespace_index()).keys())
+
+    async def namespace_labels(self, namespace, namespace_index=None):
+        """ Returns labels of namespace """
+        if namespace_index is None:
+            namespace_index = await self.namespace_index()
+        return self.client.namespace_labels(namespace, namespace_index)
+
+    async def namespace_exists(self, namespace):
+        """ Returns True if given namespace exists. False otherwise. """
+        return namespace in await self.namespace_index()
+
+    async def _get_namespaces(self, namespaces, namespace_index=None):
+        if len(namespaces) > 0:
+            return list(namespaces)
+        if namespace_index is None:
+            namespace_index = await self.namespace_index()
+        return list(namespace_index.keys())
+
+    async def _get_list_with_health(self, method_name, namespace, health_type):
+        return await asyncio.gather(
+            self.get_response(method_name, path={'namespace': namespace}),
+            self.get_namespace_health(namespace, health_type))
+
+    async def service_list(self, namespaces=[]):
+        """Returns list of services.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        namespace_list = await self._get_namespaces(namespaces)
+        _data_list = await asyncio.gather(*[
+            self._get_list_with_health('serviceList', _namespace, 'service')
+            for _namespace in namespace_list])
+        _services_rest = [(_namespace, _service_rest, _health_dict)
+                          for _namespace, (_data, _health_dict) in zip(namespace_list, _data_list)
+                          for _service_rest in _data['services']]
+        _healths = await asyncio.gather(*[
+            self.get_service_health(namespace=_namespace,
+                                    service_name=_service_rest['name'],
+                                    istioSidecar=_service_rest['istioSidecar'],
+                                    namespace_health=_health_dict)
+            for _namespace, _service_rest, _health_dict in _services_rest])
+        return [self.client._get_service(_namespace, _service_rest, _service_health)
+                for (_namespace, _service_rest, _), _service_health in zip(_services_rest,
+                                                                           _healths)]
+
+    async def workload_list(self, namespaces=[]):
+        """Returns list of workloads.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        namespace_list = await self._get_namespaces(namespaces)
+        _data_list = await asyncio.gather(*[
+            self._get_list_with_health('workloadList', _namespace, 'workload')
+            for _namespace in namespace_list])
+        _workloads_rest = [(_namespace, _workload_rest, _health_dict)
+                           for _namespace, (_data, _health_dict) in zip(namespace_list, _data_list)
+                           if _data['workloads']
+                           for _workload_rest in _data['workloads']]
+        _healths = await asyncio.gather(*[
+            self.get_workload_health(namespace=_namespace,
+                                     workload_name=_workload_rest['name'],
+                                     namespace_health=_health_dict)
+            for _namespace, _workload_rest, _health_dict in _workloads_rest])
+        return [self.client._get_workload(_namespace, _workload_rest, _workload_health)
+                for (_namespace, _workload_rest, _), _workload_health in zip(_workloads_rest,
+                                                                             _healths)]
+
+    async def application_list(self, namespaces=[]):
+        """Returns list of applications.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        namespace_list = await self._get_namespaces(namespaces)
+        _data_list = await asyncio.gather(*[
+            self._get_list_with_health('appList', _namespace, 'app')
+            for _namespace in namespace_list])
+        _applications_rest = [(_namespace, _application_rest, _health_dict)
+                              for _namespace, (_data, _health_dict) in zip(namespace_list,
+                                                                           _data_list)
+                              if _data['applications']
+                              for _application_rest in _data['applications']]
+        _healths = await asyncio.gather(*[
+            self.get_app_health(namespace=_namespace,
+                                app_name=_application_rest['name'],
+                                namespace_health=_health_dict)
+            for _namespace, _application_rest, _health_dict in _applications_rest])
+        return [self.client._get_application(_namespace, _application_rest, _app_health)
+                for (_namespace, _application_rest, _), _app_health in zip(_applications_rest,
+                                                                           _healths)]
+
+    async def overview_list(self, namespaces=[], overview_type=OverviewPageType.APPS):
+        """Returns list of overviews.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        _namespace_index = await self.namespace_index()
+        namespace_list = await self._get_namespaces(namespaces, _namespace_index)
+        if overview_type == OverviewPageType.SERVICES:
+            _all_items = await self.service_list(namespace_list)
+        elif overview_type == OverviewPageType.WORKLOADS:
+            _all_items = await self.workload_list(namespace_list)
+        else:
+            _all_items = await self.application_list(namespace_list)
+        return self.client._get_overviews(namespace_list, _all_items, overview_type,
+                                          _namespace_index)
+
+    async def istio_config_list(self, namespaces=[], config_names=[], params=None):
+        """Returns list of istio config.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        namespace_list = await self._get_namespaces(namespaces)
+        _params = dict(params) if params else {}
+        _params['validate'] = 'true'
+        _data_list = await asyncio.gather(*[
+            self.get_response('istioConfigList', path={'namespace': _namespace},
+                              params=_params)
+            for _namespace in namespace_list])
+        _configs_rest = self.client._get_configs_rest(namespace_list, _data_list)
+        _validations = await asyncio.gather(*[
+            self._get_config_validation(_namespace, _object_type, _config_type, _name,
+                                        _validations_dict)
+            for _namespace, _object_type, _config_type, _name, _validations_dict
+            in _configs_rest])
+        items = [IstioConfig(name=_name,
+                             namespace=_namespace,
+                             object_type=_object_type.text,
+                             validation=_validation)
+                 for (_namespace, _object_type, _, _name, _), _validation in zip(_configs_rest,
+                                                                                 _validations)]
+        return self.client._filter_configs(items, config_names)
+
+    async def _get_config_validation(self, namespace, object_type, config_type, name,
+                                     validations_dict):
+        # older Kiali does not return validations in the list, needs a call per config
+        if validations_dict is None:
+            return await self.get_istio_config_validation(namespace, config_type, name)
+        return validations_dict.get((object_type.text.lower(), name), IstioConfigValidation.NA)
+
+    async def istio_config_details(self, namespace, object_type, object_name):
+        """Returns details of istio config or None if does not exist.
+        Args:
+            namespaces: namespace where istio config is located
+            object_type: type of istio config
+            object_name: name of istio config
+        """
+        _data = await self.get_response(
+            'istioConfigDetails',
+            path={'namespace': namespace, 'object_type': ISTIO_CONFIG_TYPES[object_type],
+                  'object': object_name},
+            params={'validate': 'true'})
+        return self.client._get_istio_config_details(_data)
+
+    async def service_details(self, namespace, service_name):
+        return await self._run_sync(self.client.service_details, namespace, service_name)
+
+    async def workload_details(self, namespace, workload_name, workload_type):
+        return await self._run_sync(self.client.workload_details, namespace, workload_name,
+                                    workload_type)
+
+    async def application_details(self, namespace, application_name):
+        return await self._run_sync(self.client.application_details, namespace,
+                                    application_name)
+
+    async def get_namespace_health(self, namespace, health_type,
+                                   time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+        """Returns dictionary of Health data of all items in namespace keyed by item name,
+        or None if Kiali does not provide namespace health.
+        """
+        _request = self.client._namespace_health_request(namespace, health_type, time_interval)
+        if _request is None:
+            return None
+        try:
+            _health_data = await self.get_response(**_request)
+        except Exception as ex:
+            return self.client._namespace_health_failed(namespace, ex)
+        return self.client._get_namespace_health(namespace, _health_data)
+
+    async def get_service_health(self, namespace, service_name, istioSidecar,
+                                 time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                                 namespace_health=None):
+        """ Returns Health of Service """
+        if not istioSidecar:  # without sidecar no health is available
+            return self.client._get_service_health_without_sidecar()
+        return await self._get_item_health('service', namespace, service_name, time_interval,
+                                           namespace_health)
+
+    async def get_workload_health(self, namespace, workload_name,
+                                  time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                                  namespace_health=None):
+        """ Returns Health of Workload """
+        return await self._get_item_health('workload', namespace, workload_name, time_interval,
+                                           namespace_health)
+
+    async def get_app_health(self, namespace, app_name,
+                             time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                             namespace_health=None):
+        """ Returns Health of Application """
+        return await self._get_item_health('app', namespace, app_name, time_interval,
+                                           namespace_health)
+
+    async def _get_item_health(self, health_type, namespace, name, time_interval,
+                               namespace_health):
+        _request = self.client._item_health_request(health_type, namespace, name,
+                                                    time_interval, namespace_health)
+        _health_data = await self.get_response(**_request) if _request else None
+        return self.client._get_item_health(health_type, name, namespace_health, _health_data)
+
+    async def get_istio_config_validation_result(self, namespace, object_type, object_name):
+        """ Returns Validation of Istio Config with severity, messages and references """
+        _health_data = await self.get_validation('istioConfigDetails',
+                                                 namespace=namespace,
+                                                 object_type=object_type,
+                                                 object=object_name)
+        return IstioConfigValidationResult.get_from_rest(_health_data)
+
+    async def get_istio_config_validation(self, namespace, object_type, object_name):
+        """ Returns Validation of Istio Config """
+        return (await self.get_istio_config_validation_result(
+            namespace, object_type, object_name)).validation
+
+    async def get_istio_config_messages(self, namespace, object_type, object_name):
+        """ Returns Validation Messages of Istio Config """
+        return (await self.get_istio_config_validation_result(
+            namespace, object_type, object_name)).messages
+
+    async def create_istio_config(self, body, namespace, kind, api_version):
+        """ Creates Istio Config, returns response of the request """
+        logger.debug('Creating istio config: {}, from namespace: {}'.
+                     format(body['metadata']['name'], namespace))
+        return await self.post_response('istioConfigCreate',
+                                        namespace=namespace,
+                                        object_type=ISTIO_CONFIG_TYPES[kind],
+                                        data=body)
+
+    async def delete_istio_config(self, name, namespace, kind, api_version):
+        """ Deletes Istio Config, returns response of the request """
+        logger.debug('Deleting istio config: {}, from namespace: {}'.format(name, namespace))
+        return await self.delete_response('istioConfigDelete',
+                                          namespace=namespace,
+                                          object_type=ISTIO_CONFIG_TYPES[kind],
+                                          object=name)
+
+    async def update_namespace_auto_injection(self, namespace, auto_injection=None):
+        """ Update auto injection of given namespace """
+        date_dict = {'metadata': {'labels': {'istio-injection': auto_injection}}}
+        return await self.patch_response('namespaceUpdate',
+                                         namespace=namespace,
+                                         data=date_dict)
+
+    async def update_workload_auto_injection(self, workload_name, namespace,
+                                             auto_injection=None):
+        """ Update auto injection of given workload """
+        date_dict = {'spec': {'template': {'metadata': {'annotations': {
+            'sidecar.istio.io/inject': auto_injection}}}}}
+        return await self.patch_response('workloadUpdate',
+                                         namespace=namespace,
+                                         workload=workload_name,
+                                         data=date_dict)
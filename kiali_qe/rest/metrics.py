@@ -0,0 +1,127 @@
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+# upper bounds in seconds of latency histogram buckets, the last bucket is unbounded
+LATENCY_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class EndpointMetrics(object):
+    """ Calls, errors, latencies and response bytes of one endpoint """
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.response_bytes = 0
+        self.latencies = []
+
+    def add(self, seconds, response_bytes=None, error=False):
+        self.calls += 1
+        self.latencies.append(seconds)
+        if response_bytes:
+            self.response_bytes += response_bytes
+        if error:
+            self.errors += 1
+
+    def to_dict(self):
+        _sorted = sorted(self.latencies)
+        _buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        for _latency in _sorted:
+            _index = 0
+            while _index < len(LATENCY_BUCKETS) and _latency > LATENCY_BUCKETS[_index]:
+                _index += 1
+            _buckets[_index] += 1
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'response_bytes': self.response_bytes,
+            'latency': {
+                'total': round(sum(_sorted), 6),
+                'min': round(_sorted[0], 6) if _sorted else None,
+                'max': round(_sorted[-1], 6) if _sorted else None,
+                'p50': _percentile(_sorted, 50),
+                'p95': _percentile(_sorted, 95),
+                'p99': _percentile(_sorted, 99),
+                'histogram': dict(zip(['<={}'.format(_b) for _b in LATENCY_BUCKETS] + ['inf'],
+                                      _buckets))}}
+
+
+def _percentile(sorted_values, percent):
+    """ Returns nearest-rank percentile of sorted values """
+    if not sorted_values:
+        return None
+    _rank = int(math.ceil(percent / 100.0 * len(sorted_values)))
+    return round(sorted_values[max(_rank, 1) - 1], 6)
+
+
+class RequestMetrics(object):
+    """ Thread safe registry of EndpointMetrics keyed by endpoint name """
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, response_bytes=None, error=False):
+        with self._lock:
+            if name not in self._endpoints:
+                self._endpoints[name] = EndpointMetrics()
+            self._endpoints[name].add(seconds, response_bytes=response_bytes, error=error)
+
+    @contextmanager
+    def measure(self, name):
+        """Records latency of the block, and an error when it raises.
+        Response bytes can be set on the yielded dictionary under 'response_bytes'.
+        """
+        _result = {'response_bytes': None, 'error': False}
+        _start = time.monotonic()
+        try:
+            yield _result
+        except Exception:
+            _result['error'] = True
+            raise
+        finally:
+            self.record(name, time.monotonic() - _start,
+                        response_bytes=_result['response_bytes'], error=_result['error'])
+
+    def to_dict(self):
+        with self._lock:
+            return {_name: _metrics.to_dict()
+                    for _name, _metrics in sorted(self._endpoints.items())}
+
+    def dump(self, filename):
+        with open(filename, 'w') as _file:
+            json.dump(self.to_dict(), _file, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+
+class InstrumentedResource(object):
+    """
+    Proxy of openshift dynamic client resource which records its API calls in metrics.
+    Dynamic client does not expose raw responses, response bytes are not recorded.
+    """
+
+    VERBS = ('get', 'create', 'delete', 'patch', 'replace', 'apply', 'server_side_apply')
+
+    def __init__(self, resource, metrics):
+        self._resource = resource
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        _attribute = getattr(self._resource, name)
+        if name not in self.VERBS:
+            return _attribute
+        _name = 'openshift.{}.{}'.format(self._resource.kind, name)
+
+        def _call(*args, **kwargs):
+            with self._metrics.measure(_name):
+                return _attribute(*args, **kwargs)
+        return _call
+
+
+#: metrics of all REST and OpenShift API calls of the session
+metrics = RequestMetrics()
@@ -1,7 +1,18 @@
+import hashlib
+import os
 import re
+import tempfile
+import threading
+import time
+import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from kubernetes import config
+from kubernetes.client import Configuration
+from kubernetes.client.rest import ApiException
 from openshift.dynamic import DynamicClient
-from openshift.dynamic.exceptions import NotFoundError
+from openshift.dynamic.exceptions import DynamicApiError, NotFoundError, ResourceNotFoundError
 
 from kiali_qe.components.enums import (
     WorkloadType,
@@ -22,7 +33,10 @@ from kiali_qe.entities.applications import (
     AppWorkload,
     ApplicationHealth
 )
-from kiali_qe.utils import dict_contains, to_linear_string
+from kiali_qe.rest.cassette import Cassette, CassetteResource
+from kiali_qe.rest.informer import Informer
+from kiali_qe.rest.metrics import InstrumentedResource, metrics
+from kiali_qe.utils import dict_contains, get_yaml_objects, to_linear_string
 from kiali_qe.utils.date import from_rest_to_ui
 from kiali_qe.utils.log import logger
 
@@ -58,19 +72,175 @@ WORKLOAD_NAME_REGEX = re.compile('(-(\\w{1,8}\\d+\\w{1,8}))?(-(\\w{0,4}\\d?\\w{0
 
 ISTIO_SYSTEM = "istio-system"
 
+# workloads which are waited for until their rollout completes
+ROLLOUT_TYPES = ['Deployment', 'DeploymentConfig', 'StatefulSet', 'DaemonSet']
+
+# list items as PartialObjectMetadata, servers without it respond with full objects
+METADATA_ACCEPT = 'application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,' \
+    'application/json'
+
+
+@lru_cache(maxsize=65536)
+def _strip_name(regex, name):
+    return re.sub(regex, '', name)
+
+
+class ObjectResult(object):
+    """ Result of apply or delete of one object, error is None when it succeeded """
+
+    def __init__(self, kind, name, namespace, action, error=None, api_version=None):
+        self.kind = kind
+        self.api_version = api_version
+        self.name = name
+        self.namespace = namespace
+        self.action = action
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __str__(self):
+        return '{} {}/{} in {}: {}'.format(self.action, self.kind, self.name, self.namespace,
+                                           self.error or 'ok')
+
+    def __repr__(self):
+        return "{}({}, {}, {}, {}, {})".format(
+            type(self).__name__, repr(self.kind), repr(self.name), repr(self.namespace),
+            repr(self.action), repr(self.error))
+
+
+class MeshConfig(object):
+    """
+    Parsed mesh config of the istio ConfigMap in istio-system.
+
+    Args:
+        mesh: dictionary of mesh config
+        resource_version: resourceVersion of the ConfigMap it is parsed from
+    """
+
+    def __init__(self, mesh, resource_version=None):
+        self.mesh = mesh
+        self.resource_version = resource_version
+        # the previous raw text check did not match when the field was missing
+        self.enable_auto_mtls = bool(mesh.get('enableAutoMtls', False))
+        # mesh wide mTLS of istio versions before PeerAuthentication, NONE or MUTUAL_TLS
+        self.mtls_mode = mesh.get('authPolicy', 'NONE')
+        self.trust_domain = mesh.get('trustDomain', 'cluster.local')
+        self.root_namespace = mesh.get('rootNamespace', ISTIO_SYSTEM)
+        self.outbound_traffic_policy = (mesh.get('outboundTrafficPolicy') or {}).get(
+            'mode', 'ALLOW_ANY')
+
+    def __str__(self):
+        return 'enable_auto_mtls:{}, mtls_mode:{}, trust_domain:{}, root_namespace:{}'.format(
+            self.enable_auto_mtls, self.mtls_mode, self.trust_domain, self.root_namespace)
+
+    def __repr__(self):
+        return "{}({}, {})".format(
+            type(self).__name__, repr(self.mesh), repr(self.resource_version))
+
 
 class OpenshiftExtendedClient(object):
 
-    def __init__(self):
-        self._k8s_client = config.new_client_from_config()
-        self._dyn_client = DynamicClient(self._k8s_client)
+    def __init__(self, cassette=None, discovery_cache_ttl=None, discovery_cache_file=None,
+                 workers=1, cluster_wide_threshold=None, informers=False,
+                 informer_sync_timeout=60, page_size=None, metadata_only=False,
+                 wait_timeout=120, kubeconfig=None):
+        """
+        Args:
+            cassette: Cassette which records API calls, or replays them without cluster
+            discovery_cache_ttl: seconds the API discovery cache file is reused, None keeps
+                the default cache file of the openshift library, one per cluster host in
+                temporary directory, without expiry
+            discovery_cache_file: API discovery cache file used with discovery_cache_ttl,
+                default is a file per cluster host and user in temporary directory
+            workers: number of concurrent API requests in list methods, 1 means serial
+            cluster_wide_threshold: lists of more namespaces are fetched with one cluster wide
+                request per kind and filtered, None always requests each namespace
+            informers: serve lists from watched in-memory copies of the resources,
+                not used with cassette, watch streams are not recorded
+            informer_sync_timeout: seconds to wait for the first list of an informer
+                and for creates and deletes to appear in the informer
+            page_size: number of items of one list request, continued until all items are
+                listed, None lists all items with one request
+            metadata_only: list only metadata of resources which entities need nothing else,
+                services, pods and istio configs in lists
+            wait_timeout: default seconds of waits for cluster changes
+            kubeconfig: kubeconfig file of the cluster, default is KUBECONFIG or ~/.kube/config
+        """
+        self.cassette = cassette
+        self.workers = max(int(workers), 1)
+        self.cluster_wide_threshold = cluster_wide_threshold
+        self._worker_local = threading.local()
+        self.informers = informers and cassette is None
+        self.informer_sync_timeout = informer_sync_timeout
+        self.page_size = int(page_size) if page_size else None
+        self.metadata_only = metadata_only
+        self.wait_timeout = wait_timeout
+        self._mesh_config = None
+        self._mesh_config_informer = None
+        # informers keyed by resource handle, resource handles are resolved once
+        self._informers = {}
+        # resolved resources keyed by (kind, api_version)
+        self._resources = {}
+        self._resources_lock = threading.Lock()
+        if cassette is not None and cassette.replaying:
+            self._k8s_client = None
+            self._dyn_client = None
+        else:
+            _configuration = Configuration()
+            # each worker thread needs its own connection
+            _configuration.connection_pool_maxsize = max(
+                _configuration.connection_pool_maxsize, self.workers)
+            self._k8s_client = config.new_client_from_config(
+                config_file=kubeconfig, client_configuration=_configuration)
+            _cache_file = None
+            if discovery_cache_ttl:
+                _cache_file = discovery_cache_file or self._get_discovery_cache_file()
+                self._remove_stale_file(_cache_file, float(discovery_cache_ttl))
+            self._dyn_client = DynamicClient(self._k8s_client, cache_file=_cache_file)
+
+    def _get_discovery_cache_file(self):
+        """ Returns discovery cache file of the cluster host and user in temporary directory """
+        _configuration = self._k8s_client.configuration
+        _cache_id = '{}|{}'.format(_configuration.host, _configuration.api_key.get(
+            'authorization', _configuration.username)).encode('utf-8')
+        return os.path.join(tempfile.gettempdir(), 'kiali-qe-discovery-{}.json'.format(
+            hashlib.md5(_cache_id).hexdigest()))
+
+    def _remove_stale_file(self, filename, ttl):
+        if os.path.exists(filename) and time.time() - os.path.getmtime(filename) > ttl:
+            logger.debug('Removing stale API discovery cache {}'.format(filename))
+            os.remove(filename)
 
     @property
     def version(self):
-        return self._dyn_client.version
+        if self.cassette is None:
+            return self._dyn_client.version
+        _key = Cassette.get_key('openshift', 'version')
+        if self.cassette.replaying:
+            return self.cassette.replay(_key)
+        _version = self._dyn_client.version
+        self.cassette.record(_key, _version)
+        return _version
 
     def _resource(self, kind, api_version='v1'):
-        return self._dyn_client.resources.get(kind=kind, api_version=api_version)
+        """ Returns API resource of kind, resolved once per (kind, api_version) """
+        _resource = self._resources.get((kind, api_version))
+        if _resource is None:
+            with self._resources_lock:
+                _resource = self._resources.get((kind, api_version))
+                if _resource is None:
+                    _resource = self._get_resource(kind, api_version)
+                    self._resources[(kind, api_version)] = _resource
+        return _resource
+
+    def _get_resource(self, kind, api_version):
+        _resource = self._dyn_client.resources.get(kind=kind, api_version=api_version) \
+            if self._dyn_client is not None else None
+        if self.cassette is not None:
+            _resource = CassetteResource(_resource, self.cassette, kind, api_version)
+        return InstrumentedResource(_resource, metrics)
 
     @property
     def _namespace(self):
@@ -104,6 +274,10 @@ class OpenshiftExtendedClient(object):
     def _pod(self):
         return self._resource(kind='Pod')
 
+    @property
+    def _endpoints(self):
+        return self._resource(kind='Endpoints')
+
     @property
     def _replicaset(self):
         return self._resource(kind='ReplicaSet')
@@ -199,6 +373,8 @@ class OpenshiftExtendedClient(object):
         application_status_dict = {}
         workloads = []
         workloads.extend(self.workload_list(namespaces=namespaces))
+        # services are listed once and joined to workloads by app name
+        _service_labels = self._get_service_labels(namespaces=namespaces)
 
         for workload in workloads:
             # TODO: health needs to be added
@@ -209,13 +385,10 @@ class OpenshiftExtendedClient(object):
             else:
                 _labels = workload.labels
 
-            try:
+            if (workload.namespace, _name) in _service_labels:
                 _labels = self._concat_labels(
-                    self.service_details(workload.namespace,
-                                         self._get_app_name(workload)).labels,
+                    _service_labels[(workload.namespace, _name)],
                     _labels)
-            except NotFoundError:
-                pass
             if workload.workload_status:
                 if _name+workload.namespace in application_status_dict:
                     application_status_dict[_name+workload.namespace].append(
@@ -235,78 +408,258 @@ class OpenshiftExtendedClient(object):
                     requests=None))
         return result_dict.values()
 
+    def _get_service_labels(self, namespaces=[]):
+        """ Returns labels of services keyed by (namespace, service name)
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        return {(_item.metadata.namespace, _item.metadata.name):
+                dict(_item.metadata.labels if _item.metadata.labels else {})
+                for _item in self._get_raw_items(['_service'], namespaces=namespaces,
+                                                 metadata_names=['_service'])['_service']}
+
     def service_list(self, namespaces=[]):
         """ Returns list of services
         Args:
             namespace: Namespace of the service, optional
         """
-        items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = self._service.get(namespace=_namespace)
-                _raw_items.extend(_response.items)
-        else:
-            _response = self._service.get()
-            _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        return list(self.service_iter(namespaces=namespaces))
+
+    def service_iter(self, namespaces=[]):
+        """ Yields services as list pages arrive
+        Args:
+            namespace: Namespace of the service, optional
+        """
+        for _item in self._iter_raw_items('_service', namespaces=namespaces, metadata=True):
             # update all the services to our custom entity
             # TODO: heath needs to be added
-            _service = Service(
+            yield Service(
                 namespace=_item.metadata.namespace,
                 name=_item.metadata.name,
                 istio_sidecar=self._contains_sidecar(_item),
                 labels=self._get_labels(_item),
                 health=None)
-            items.append(_service)
-        return items
+
+    def _map(self, function, items):
+        """Applies function to every item and returns the results in the items order.
+        Uses a bounded pool of 'workers' threads, runs serially when workers is 1
+        or when called from a pool thread, so nested calls do not multiply threads.
+        """
+        items = list(items)
+        if self.workers < 2 or len(items) < 2 or getattr(self._worker_local, 'active', False):
+            return [function(_item) for _item in items]
+
+        def _run(_item):
+            self._worker_local.active = True
+            try:
+                return function(_item)
+            finally:
+                self._worker_local.active = False
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as executor:
+            return list(executor.map(_run, items))
+
+    def _get_informer(self, resource, create=True):
+        """Returns synced Informer of resource, None if informers are disabled,
+        or if it does not exist and create is False.
+        """
+        if not self.informers:
+            return None
+        with self._resources_lock:
+            _informer = self._informers.get(resource)
+            if _informer is None and create:
+                _informer = Informer(resource)
+                self._informers[resource] = _informer
+        if _informer is not None:
+            _informer.start()
+            if not _informer.wait_for_sync(self.informer_sync_timeout):
+                raise TimeoutError('Informer of {} is not synced in {}s'.format(
+                    resource.kind, self.informer_sync_timeout))
+        return _informer
+
+    def stop_informers(self):
+        with self._resources_lock:
+            for _informer in self._informers.values():
+                _informer.stop()
+            self._informers = {}
+            if self._mesh_config_informer is not None:
+                self._mesh_config_informer.stop()
+                self._mesh_config_informer = None
+
+    def _get_items(self, attribute_name, namespace=None, metadata=False):
+        """ Returns items of resource, of all namespaces when None """
+        return list(self._iter_pages(attribute_name, namespace=namespace, metadata=metadata))
+
+    def _get_page(self, attribute_name, namespace=None, continue_token=None, metadata=False):
+        """Returns one list response of resource, of page_size items when it is set.
+        Items are PartialObjectMetadata when metadata is True and metadata_only is enabled,
+        their kind is not the kind of resource.
+        """
+        _params = {}
+        if metadata and self.metadata_only:
+            _params['header_params'] = {'Accept': METADATA_ACCEPT}
+        if namespace is not None:
+            _params['namespace'] = namespace
+        if self.page_size:
+            _params['limit'] = self.page_size
+        if continue_token:
+            _params['_continue'] = continue_token
+        return getattr(self, attribute_name).get(**_params)
+
+    def _iter_pages(self, attribute_name, namespace=None, first_page=None, metadata=False):
+        """ Yields items of resource page by page, following continue tokens
+        Args:
+            attribute_name: the attribute of class for getting resource
+            namespace: Namespace of the resource, all namespaces when None
+            first_page: already fetched first list response, optional
+            metadata: only metadata of items is needed
+        """
+        _response = first_page if first_page is not None else \
+            self._get_page(attribute_name, namespace=namespace, metadata=metadata)
+        while True:
+            for _item in (_response.items if hasattr(_response, 'items') else None) or []:
+                yield _item
+            _metadata = _response.metadata if hasattr(_response, 'metadata') else None
+            _continue_token = getattr(_metadata, 'continue', None) if _metadata else None
+            if not _continue_token:
+                return
+            _response = self._get_page(attribute_name, namespace=namespace,
+                                       continue_token=_continue_token, metadata=metadata)
+
+    def _iter_raw_items(self, attribute_name, namespaces=[], metadata=False):
+        """Yields raw items of resource as list pages arrive.
+        First pages of all namespaces are requested concurrently, further pages on demand,
+        so at most a page per namespace is held besides consumed items.
+        Without page_size, items are listed as in _get_raw_items.
+        Args:
+            attribute_name: the attribute of class for getting resource
+            namespaces: can be zero or any number of namespaces
+            metadata: only metadata of items is needed
+        """
+        if self.informers or not self.page_size:
+            for _item in self._get_raw_items(
+                    [attribute_name], namespaces=namespaces,
+                    metadata_names=[attribute_name] if metadata else [])[attribute_name]:
+                yield _item
+            return
+        _namespaces = set(namespaces)
+        if self._is_cluster_wide(namespaces):
+            _requests = [None]
+        else:
+            _requests = list(namespaces)
+        _first_pages = self._map(
+            lambda _namespace: self._get_page(attribute_name, namespace=_namespace,
+                                              metadata=metadata),
+            _requests)
+        for _namespace, _first_page in zip(_requests, _first_pages):
+            for _item in self._iter_pages(attribute_name, namespace=_namespace,
+                                          first_page=_first_page, metadata=metadata):
+                if not _namespaces or _item.metadata.namespace in _namespaces:
+                    yield _item
+
+    def _is_cluster_wide(self, namespaces):
+        """ Returns True when namespaces are listed with one cluster wide request """
+        return len(namespaces) == 0 or (
+            self.cluster_wide_threshold is not None
+            and len(namespaces) > self.cluster_wide_threshold)
+
+    def _get_raw_items(self, attribute_names, namespaces=[], metadata_names=[]):
+        """Returns dictionary of raw items of resources keyed by attribute name.
+        Requests of all resources and namespaces run concurrently. Namespaces more than
+        cluster_wide_threshold are fetched with one cluster wide request per resource.
+        Args:
+            attribute_names: the attributes of class for getting resources
+            namespaces: can be zero or any number of namespaces
+            metadata_names: attributes of attribute_names which only metadata is needed of
+        """
+        if self.informers:
+            _informers = self._map(
+                lambda _attribute_name: self._get_informer(getattr(self, _attribute_name)),
+                attribute_names)
+            return OrderedDict(
+                (_attribute_name, _informer.list(namespaces))
+                for _attribute_name, _informer in zip(attribute_names, _informers))
+        if self._is_cluster_wide(namespaces):
+            _requests = [(_attribute_name, None) for _attribute_name in attribute_names]
+        else:
+            _requests = [(_attribute_name, _namespace) for _attribute_name in attribute_names
+                         for _namespace in namespaces]
+        _responses = self._map(
+            lambda _request: self._get_items(*_request,
+                                             metadata=_request[0] in metadata_names),
+            _requests)
+        _namespaces = set(namespaces)
+        _raw_items = OrderedDict((_attribute_name, []) for _attribute_name in attribute_names)
+        for (_attribute_name, _), _items in zip(_requests, _responses):
+            _raw_items[_attribute_name].extend(
+                [_item for _item in _items
+                 if not _namespaces or _item.metadata.namespace in _namespaces])
+        return _raw_items
 
     def workload_list(self, namespaces=[]):
         """ Returns list of workloads
-            Order of showing/hiding priority is: Deployments, ReplicaSets, Pods
+            Workloads controlled by another listed workload, as ReplicaSets of Deployments
+            and their Pods, are hidden using ownerReferences.
+            Workloads controlled by a kind which is not listed, as operator resources or
+            Argo Rollouts, are grouped as one workload named and typed after the controller.
+            ReplicaSets, Pods and Jobs without ownerReferences fall back to names without
+            generated suffix, Deployments hide ReplicaSets, both hide Pods and Jobs.
         """
-        full_list = []
         filtered_list = []
+        # pod entities need no spec or status, other workloads need status
+        _raw_items = self._get_raw_items(list(WORKLOAD_TYPES.values()), namespaces=namespaces,
+                                         metadata_names=[WORKLOAD_TYPES['Pod']])
+        # uids of all listed workloads, the nodes of the owner graph
+        _uids = set([_item.metadata.uid for _items in _raw_items.values() for _item in _items])
+        deployment_names = set([
+            (_item.metadata.name, _item.metadata.namespace)
+            for _item in _raw_items[WORKLOAD_TYPES[WorkloadType.DEPLOYMENT.text]]])
+        replicaset_names = set([
+            (_item.metadata.name, _item.metadata.namespace)
+            for _item in _raw_items[WORKLOAD_TYPES[WorkloadType.REPLICA_SET.text]]])
+
+        # (name, namespace) of listed controllers of other kinds
+        controller_names = set()
+
         for _key, _value in WORKLOAD_TYPES.items():
-            full_list.extend(self._workload_list(_value, _key,
-                                                 namespaces=namespaces))
-
-        deployment_names = [_item.name + _item.namespace for _item in full_list if
-                            _item.workload_type == WorkloadType.DEPLOYMENT.text]
-
-        replicaset_names = [_item.name + _item.namespace for _item in full_list if
-                            _item.workload_type == WorkloadType.REPLICA_SET.text]
-
-        for _item in full_list:
-            _workload_name = self._get_workload_name(_item)
-            if _item.workload_type == WorkloadType.REPLICA_SET.text:
-                if _workload_name + _item.namespace not in deployment_names:
-                    filtered_list.append(Workload(
-                                            name=_workload_name,
-                                            namespace=_item.namespace,
-                                            workload_type=_item.workload_type,
-                                            istio_sidecar=_item.istio_sidecar,
-                                            labels=_item.labels,
-                                            health=_item.health,
-                                            workload_status=_item.workload_status))
-            elif _item.workload_type in [WorkloadType.POD.text,
-                                         WorkloadType.JOB.text]:
-                if _workload_name + _item.namespace not in replicaset_names and\
-                        _workload_name + _item.namespace not in deployment_names:
-                    filtered_list.append(Workload(
-                                            name=_workload_name,
-                                            namespace=_item.namespace,
-                                            workload_type=_item.workload_type,
-                                            istio_sidecar=_item.istio_sidecar,
-                                            labels=_item.labels,
-                                            health=_item.health,
-                                            workload_status=_item.workload_status))
-            else:
-                filtered_list.append(_item)
+            for _raw_item in _raw_items[_value]:
+                _controller = self._get_controller(_raw_item.metadata)
+                if _controller is not None:
+                    _workload_name = (_controller.name, _raw_item.metadata.namespace)
+                    if _controller.uid not in _uids and _workload_name not in controller_names:
+                        controller_names.add(_workload_name)
+                        filtered_list.append(self._get_renamed_workload(
+                            self._get_workload(_raw_item, _key), _controller.name,
+                            _controller.kind))
+                    continue
+                _item = self._get_workload(_raw_item, _key)
+                _workload_name = (self._get_ownerless_workload_name(_key, _item.name),
+                                  _item.namespace)
+                if _item.workload_type == WorkloadType.REPLICA_SET.text:
+                    if _workload_name not in deployment_names:
+                        filtered_list.append(self._get_renamed_workload(_item,
+                                                                        _workload_name[0]))
+                elif _item.workload_type in [WorkloadType.POD.text,
+                                             WorkloadType.JOB.text]:
+                    if _workload_name not in replicaset_names and\
+                            _workload_name not in deployment_names:
+                        filtered_list.append(self._get_renamed_workload(_item,
+                                                                        _workload_name[0]))
+                else:
+                    filtered_list.append(_item)
 
         return filtered_list
 
+    def _get_renamed_workload(self, workload, name, workload_type=None):
+        return Workload(
+            name=name,
+            namespace=workload.namespace,
+            workload_type=workload_type or workload.workload_type,
+            istio_sidecar=workload.istio_sidecar,
+            labels=workload.labels,
+            health=workload.health,
+            workload_status=workload.workload_status)
+
     def _workload_list(self, attribute_name, workload_type,
                        namespaces=[]):
         """ Returns list of workload
@@ -316,32 +669,27 @@ class OpenshiftExtendedClient(object):
             namespace: Namespace of the workload, optional
             workload_names: Names of the workloads, optional
         """
-        items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
-            # update all the workloads to our custom entity
-            _workload = Workload(
-                name=_item.metadata.name,
-                namespace=_item.metadata.namespace,
-                workload_type=workload_type,
-                istio_sidecar=self._contains_sidecar(_item),
-                labels=self._get_workload_labels(_item),
-                workload_status=self._get_workload_status(_item))
-            items.append(_workload)
-        return items
+        return list(self._workload_iter(attribute_name, workload_type, namespaces=namespaces))
+
+    def _workload_iter(self, attribute_name, workload_type, namespaces=[]):
+        """ Yields workloads of one type as list pages arrive, arguments of _workload_list """
+        for _item in self._iter_raw_items(attribute_name, namespaces=namespaces,
+                                          metadata=workload_type == 'Pod'):
+            yield self._get_workload(_item, workload_type)
+
+    def _get_workload(self, item, workload_type):
+        """ Returns Workload entity of workload resource item """
+        return Workload(
+            name=item.metadata.name,
+            namespace=item.metadata.namespace,
+            workload_type=workload_type,
+            istio_sidecar=self._contains_sidecar(item),
+            labels=self._get_workload_labels(item),
+            workload_status=self._get_workload_status(item))
 
     def _get_workload_status(self, item):
-        if item.status.availableReplicas:
+        # metadata only items have no status
+        if item.status and item.status.availableReplicas:
             _workload_status = DeploymentStatus(
                 name=item.metadata.name,
                 replicas=item.status.replicas,
@@ -413,21 +761,22 @@ class OpenshiftExtendedClient(object):
         return result
 
     def _get_app_name(self, workload):
-        return workload.labels['app'] if 'app' in workload.labels else re.sub(
+        return workload.labels['app'] if 'app' in workload.labels else _strip_name(
             APP_NAME_REGEX,
-            '',
             workload.name)
 
-    def _get_workload_name(self, workload):
-        return re.sub(
-            WORKLOAD_NAME_REGEX,
-            '',
-            workload.name)
+    def _get_ownerless_workload_name(self, workload_type, name):
+        """ Returns name of workload without ownerReferences as listed by workload_list,
+        ReplicaSets, Pods and Jobs fall back to names without generated suffix
+        """
+        if workload_type in [WorkloadType.REPLICA_SET.text, WorkloadType.POD.text,
+                             WorkloadType.JOB.text]:
+            return _strip_name(WORKLOAD_NAME_REGEX, name)
+        return name
 
     def _get_service_app(self, name, labels):
-        return labels['app'] if 'app' in labels else re.sub(
+        return labels['app'] if 'app' in labels else _strip_name(
             APP_NAME_REGEX,
-            '',
             name)
 
     def istio_config_list(self, namespaces=[], config_names=[]):
@@ -448,25 +797,8 @@ class OpenshiftExtendedClient(object):
             namespace: Namespace of the resource, optional
             resource_names: Names of the r, optional
         """
-        resource_type = re.sub(': .*', '', resource_type)
-        items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
-            _config = IstioConfig(name=_item.metadata.name,
-                                  namespace=_item.metadata.namespace,
-                                  object_type=_item.kind)
-            # append this item to the final list
-            items.append(_config)
+        items = list(self._resource_iter(attribute_name, resource_type,
+                                         namespaces=namespaces))
         # filter by resource name
         if len(resource_names) > 0:
             filtered_list = []
@@ -475,18 +807,66 @@ class OpenshiftExtendedClient(object):
             return set(filtered_list)
         return items
 
-    def get_workload_pods(self, namespace, workload_name):
-        _raw_items = []
-        _filtered_items = []
-        _response = getattr(self, WORKLOAD_TYPES['Pod']).get(namespace=namespace)
-        if hasattr(_response, 'items'):
-            _raw_items.extend(_response.items)
-        for _item in _raw_items:
-            if self._get_workload_name(_item.metadata) == workload_name:
-                _filtered_items.append(WorkloadPod(
-                    name=_item.metadata.name,
-                    podIP=_item.status.podIP))
-        return _filtered_items
+    def _resource_iter(self, attribute_name, resource_type, namespaces=[]):
+        """ Yields istio configs as list pages arrive, arguments of _resource_list """
+        _kind = getattr(self, attribute_name).kind
+        for _item in self._iter_raw_items(attribute_name, namespaces=namespaces, metadata=True):
+            yield IstioConfig(name=_item.metadata.name,
+                              namespace=_item.metadata.namespace,
+                              object_type=_kind)
+
+    def get_workload_pods(self, namespace, workload_name, pod_index=None):
+        """ Returns pods of workload
+        Args:
+            namespace: Namespace of the workload
+            workload_name: Workload name
+            pod_index: result of _get_pod_index of namespace, listed when it is None
+        """
+        if pod_index is None:
+            pod_index = self._get_pod_index(namespace)
+        return [WorkloadPod(name=_item.metadata.name, podIP=_item.status.podIP)
+                for _item in pod_index.get(workload_name, [])]
+
+    def _get_pod_index(self, namespace):
+        """ Returns pods of namespace keyed by name of their workload.
+        Workload is the controller in ownerReferences of the pod, or the controller of its
+        ReplicaSet, ReplicationController or Job when they have one, of any kind as in
+        workload_list.
+        Pods and owners without owner are workloads themselves, named as in workload_list.
+        """
+        _owner_types = ['ReplicaSet', 'ReplicationController', 'Job']
+        _attribute_names = [WORKLOAD_TYPES[_type] for _type in ['Pod'] + _owner_types]
+        _raw_items = self._get_raw_items(_attribute_names, namespaces=[namespace])
+        # uid of pod owner -> name of its workload
+        _owner_names = {}
+        for _owner_type in _owner_types:
+            for _item in _raw_items[WORKLOAD_TYPES[_owner_type]]:
+                _controller = self._get_controller(_item.metadata)
+                if _controller is not None:
+                    _owner_names[_item.metadata.uid] = _controller.name
+                else:
+                    _owner_names[_item.metadata.uid] = self._get_ownerless_workload_name(
+                        _owner_type, _item.metadata.name)
+        index = {}
+        for _item in _raw_items[WORKLOAD_TYPES['Pod']]:
+            _controller = self._get_controller(_item.metadata)
+            if _controller is None:
+                _workload_name = self._get_ownerless_workload_name(WorkloadType.POD.text,
+                                                                   _item.metadata.name)
+            else:
+                _workload_name = _owner_names.get(_controller.uid, _controller.name)
+            index.setdefault(_workload_name, []).append(_item)
+        return index
+
+    def _get_controller(self, metadata):
+        """ Returns controller owner reference of metadata, the first one if none is
+        marked as controller, None if there are no owner references
+        """
+        _references = metadata.ownerReferences or []
+        for _reference in _references:
+            if _reference.controller:
+                return _reference
+        return _references[0] if len(_references) > 0 else None
 
     def application_details(self, namespace, application_name):
         """ Returns the details of Application
@@ -550,8 +930,7 @@ class OpenshiftExtendedClient(object):
             ip=_response.spec.clusterIP,
             endpoints=([] if skip_workloads else self._get_service_endpoints(
                 namespace,
-                self._get_service_app(_response.metadata.name,
-                                      _labels))),
+                _response.metadata.name)),
             ports=_ports.strip(),
             labels=_labels,
             selectors=dict(_response.spec.selector if _response.spec.selector else {}),
@@ -575,26 +954,30 @@ class OpenshiftExtendedClient(object):
         """
         result = []
         _workloads_list = self.workload_list(namespaces=[namespace])
+        _pod_index = self._get_pod_index(namespace)
         for _workload_item in _workloads_list:
             if dict_contains(_workload_item.labels, ['app:{}'.format(app_label)]):
                 result.append(self.workload_details(namespace,
                                                     _workload_item.name,
-                                                    _workload_item.workload_type))
+                                                    _workload_item.workload_type,
+                                                    pod_index=_pod_index))
         return result
 
-    def _get_service_endpoints(self, namespace, app_label):
-        """ Returns the list of workload pod's IPs for particular service by application label
+    def _get_service_endpoints(self, namespace, service_name):
+        """ Returns the list of pod IPs in Endpoints of service, ready or not
         Args:
             namespace: Namespace where service is located
-            app_label: app label value
+            service_name: Name of service
         """
         endpoints = []
-        _workloads = self.workload_list(namespaces=[namespace])
-        for _workload in _workloads:
-            if dict_contains(_workload.labels, ['app:{}'.format(app_label)]):
-                _pods = self.get_workload_pods(namespace, _workload.name)
-                for _pod in _pods:
-                    endpoints.append(_pod.podIP)
+        try:
+            _response = self._endpoints.get(namespace=namespace, name=service_name)
+        except NotFoundError:
+            return endpoints
+        for _subset in _response.subsets or []:
+            for _address in list(_subset.addresses or []) + \
+                    list(_subset.notReadyAddresses or []):
+                endpoints.append(_address.ip)
         return endpoints
 
     def get_service_configs(self, namespace, service_name):
@@ -603,41 +986,81 @@ class OpenshiftExtendedClient(object):
             namespace: Namespace where service is located
             service_name: Name of service
         """
+        return self._get_host_configs(self._get_config_host_index([namespace]),
+                                      namespace, service_name)
+
+    def _get_config_host_index(self, namespaces=[]):
+        """ Returns VirtualServices and DestinationRules keyed by (namespace, service name)
+        of their hosts, built from list responses only.
+        Wildcard hosts are keyed by '*' in place of the service name, or of both.
+        Args:
+            namespaces: can be zero or any number of namespaces
+        """
+        _attribute_names = [CONFIG_TYPES[IstioConfigObjectType.VIRTUAL_SERVICE.text],
+                            CONFIG_TYPES[IstioConfigObjectType.DESTINATION_RULE.text]]
+        _raw_items = self._get_raw_items(_attribute_names, namespaces=namespaces)
+        index = {}
+        for _attribute_name in _attribute_names:
+            for _item in _raw_items[_attribute_name]:
+                _config = IstioConfig(name=_item.metadata.name,
+                                      namespace=_item.metadata.namespace,
+                                      object_type=_item.kind)
+                _keys = set([self._get_host_key(_host, _item.metadata.namespace)
+                             for _host in self._get_config_hosts(_item.spec)])
+                for _key in _keys:
+                    index.setdefault(_key, []).append(_config)
+        return index
+
+    def _get_host_configs(self, host_index, namespace, service_name):
+        """ Returns configs of host_index which hosts match the service """
         istio_configs = []
-        _all_vs_list = self._resource_list(
-            attribute_name=CONFIG_TYPES[IstioConfigObjectType.VIRTUAL_SERVICE.text],
-            resource_type=CONFIG_TYPES[IstioConfigObjectType.VIRTUAL_SERVICE.text],
-            namespaces=[namespace])
-        for _vs_item in _all_vs_list:
-            if self._is_host_in_config(namespace, service_name, to_linear_string(
-                self.istio_config_details(
-                    namespace=namespace,
-                    object_name=_vs_item.name,
-                    object_type=IstioConfigObjectType.VIRTUAL_SERVICE.text).text)):
-                istio_configs.append(_vs_item)
-        _all_dr_list = self._resource_list(
-            attribute_name=CONFIG_TYPES[IstioConfigObjectType.DESTINATION_RULE.text],
-            resource_type=CONFIG_TYPES[IstioConfigObjectType.DESTINATION_RULE.text],
-            namespaces=[namespace])
-        for _dr_item in _all_dr_list:
-            if self._is_host_in_config(namespace, service_name, to_linear_string(
-                self.istio_config_details(
-                    namespace=namespace,
-                    object_name=_dr_item.name,
-                    object_type=IstioConfigObjectType.DESTINATION_RULE.text).text)):
-                istio_configs.append(_dr_item)
+        for _key in [(namespace, service_name), (namespace, '*'), ('*', '*')]:
+            for _config in host_index.get(_key, []):
+                if _config not in istio_configs:
+                    istio_configs.append(_config)
         return istio_configs
 
-    def _is_host_in_config(self, namespace, service_name, config):
-        return 'host {} '.format(service_name) in config or \
-            'host {}.{}.svc.cluster.local '.format(service_name, namespace) in config
+    def _get_config_hosts(self, spec):
+        """ Returns values of all 'host' fields of config spec """
+        hosts = []
+        if isinstance(spec, (list, tuple)):
+            for _value in spec:
+                hosts.extend(self._get_config_hosts(_value))
+        elif spec is not None and not isinstance(spec, str) and hasattr(spec, 'items'):
+            for _key, _value in spec.items():
+                if _key == 'host' and isinstance(_value, str):
+                    hosts.append(_value)
+                else:
+                    hosts.extend(self._get_config_hosts(_value))
+        return hosts
 
-    def workload_details(self, namespace, workload_name, workload_type):
+    def _get_host_key(self, host, namespace):
+        """ Returns (namespace, service name) of host, short names are resolved in
+        namespace of the config
+        Args:
+            host: 'name', 'name.ns', 'name.ns.svc', 'name.ns.svc.cluster.local',
+                '*.ns.svc.cluster.local' or '*'
+            namespace: namespace of the config
+        """
+        _parts = host.lower().split('.')
+        if _parts[-2:] == ['cluster', 'local']:
+            _parts = _parts[:-2]
+        if _parts[-1:] == ['svc']:
+            _parts = _parts[:-1]
+        if len(_parts) == 1:
+            return ('*', '*') if _parts[0] == '*' else (namespace, _parts[0])
+        if len(_parts) == 2:
+            return _parts[1], _parts[0]
+        # external hosts are not services of the mesh
+        return None, host
+
+    def workload_details(self, namespace, workload_name, workload_type, pod_index=None):
         """ Returns the details of Workload
         Args:
             namespace: Namespace of the service
             workload_name: Workload name
             workload_type: Type of workload
+            pod_index: result of _get_pod_index of namespace, optional
         """
         _response = getattr(self,
                             WORKLOAD_TYPES[workload_type]).get(
@@ -652,7 +1075,7 @@ class OpenshiftExtendedClient(object):
             istio_sidecar=None,
             labels=dict(_response.metadata.labels if _response.metadata.labels
                         else _response.spec.selector.matchLabels),
-            pods=self.get_workload_pods(namespace, workload_name),
+            pods=self.get_workload_pods(namespace, workload_name, pod_index=pod_index),
             health=None,
             workload_status=self._get_workload_status(_response))
         _workload.set_istio_configs(istio_configs=self.get_workload_configs(namespace, _workload))
@@ -698,19 +1121,266 @@ class OpenshiftExtendedClient(object):
 
     def delete_istio_config(self, name, namespace, kind, api_version):
         logger.debug('Deleting istio config: {}, from namespace: {}'.format(name, namespace))
+        _resource = self._istio_config(kind=kind, api_version=api_version)
         try:
-            self._istio_config(kind=kind, api_version=api_version).delete(name=name,
-                                                                          namespace=namespace)
+            _resource.delete(name=name, namespace=namespace)
         except NotFoundError:
             pass
+        self._wait_for_write(_resource, namespace, name, exists=False)
 
     def create_istio_config(self, body, namespace, kind, api_version):
         logger.debug('Creating istio config: {}, from namespace: {}'.
                      format(body['metadata']['name'], namespace))
-        resp = self._istio_config(kind=kind, api_version=api_version).create(body=body,
-                                                                             namespace=namespace)
+        _resource = self._istio_config(kind=kind, api_version=api_version)
+        resp = _resource.create(body=body, namespace=namespace)
+        self._wait_for_write(_resource, namespace, body['metadata']['name'], exists=True)
         return resp
 
+    def apply_yaml(self, yaml_file, namespace=None):
+        """ Applies all objects of multi document yaml_file, returns list of ObjectResult
+        Args:
+            yaml_file: path of yaml file
+            namespace: namespace of objects without one, as oc apply -n
+        """
+        return self.apply_objects(get_yaml_objects(yaml_file), namespace=namespace)
+
+    def delete_yaml(self, yaml_file, namespace=None):
+        """ Deletes all objects of multi document yaml_file, returns list of ObjectResult
+        Args:
+            yaml_file: path of yaml file
+            namespace: namespace of objects without one, as oc delete -n
+        """
+        return self.delete_objects(get_yaml_objects(yaml_file), namespace=namespace)
+
+    def apply_objects(self, objects, namespace=None):
+        """ Applies objects concurrently with server side apply """
+        return self._map(lambda _object: self._apply_object(_object, namespace), objects)
+
+    def delete_objects(self, objects, namespace=None):
+        """ Deletes objects concurrently, missing objects are reported as not found """
+        return self._map(lambda _object: self._delete_object(_object, namespace), objects)
+
+    def _apply_object(self, body, namespace):
+        _kind, _name = body['kind'], body['metadata']['name']
+        _namespace = body['metadata'].get('namespace') or namespace
+        logger.debug('Applying {}: {}, to namespace: {}'.format(_kind, _name, _namespace))
+        try:
+            self._resource(kind=_kind, api_version=body['apiVersion']).server_side_apply(
+                body=body, namespace=_namespace, field_manager='kiali-qe',
+                force_conflicts=True)
+        except DynamicApiError as e:
+            return ObjectResult(_kind, _name, _namespace, 'apply', error=e.summary())
+        except (ResourceNotFoundError, ValueError) as e:
+            # unknown kind, or namespaced object without namespace
+            return ObjectResult(_kind, _name, _namespace, 'apply', error=str(e))
+        return ObjectResult(_kind, _name, _namespace, 'apply', api_version=body['apiVersion'])
+
+    def _delete_object(self, body, namespace):
+        _kind, _name = body['kind'], body['metadata']['name']
+        _namespace = body['metadata'].get('namespace') or namespace
+        logger.debug('Deleting {}: {}, from namespace: {}'.format(_kind, _name, _namespace))
+        try:
+            self._resource(kind=_kind, api_version=body['apiVersion']).delete(
+                name=_name, namespace=_namespace)
+        except NotFoundError:
+            return ObjectResult(_kind, _name, _namespace, 'delete', error='not found')
+        except DynamicApiError as e:
+            return ObjectResult(_kind, _name, _namespace, 'delete', error=e.summary())
+        except (ResourceNotFoundError, ValueError) as e:
+            return ObjectResult(_kind, _name, _namespace, 'delete', error=str(e))
+        return ObjectResult(_kind, _name, _namespace, 'delete', api_version=body['apiVersion'])
+
+    def wait_for_items(self, resource, condition, namespace=None, name=None,
+                       label_selector=None, timeout=None):
+        """Waits until condition of the listed items holds, watching their changes
+        instead of polling. Returns True when it holds, False on timeout.
+        Args:
+            resource: API resource of the items
+            condition: function of the list of current items
+            namespace: Namespace of the items, all namespaces when None
+            name: name of the only item, optional
+            label_selector: label selector of the items, optional
+            timeout: seconds, default is wait_timeout
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            # nothing changes in replayed cluster
+            return True
+        _field_selector = 'metadata.name={}'.format(name) if name else None
+        _deadline = time.time() + (timeout or self.wait_timeout)
+        while True:
+            _response = resource.get(namespace=namespace, field_selector=_field_selector,
+                                     label_selector=label_selector)
+            _items = OrderedDict(((_item.metadata.namespace, _item.metadata.name), _item)
+                                 for _item in _response.items or [])
+            if condition(list(_items.values())):
+                return True
+            try:
+                for _event in resource.watch(namespace=namespace, name=name,
+                                             label_selector=label_selector,
+                                             resource_version=_response.metadata.resourceVersion,
+                                             timeout=max(int(_deadline - time.time()), 1)):
+                    if _event['type'] == 'ERROR':
+                        break
+                    _item = _event['object']
+                    _key = (_item.metadata.namespace, _item.metadata.name)
+                    if _event['type'] == 'DELETED':
+                        _items.pop(_key, None)
+                    elif _event['type'] in ('ADDED', 'MODIFIED'):
+                        _items[_key] = _item
+                    if condition(list(_items.values())):
+                        return True
+                    if time.time() >= _deadline:
+                        break
+            except (ApiException, DynamicApiError) as e:
+                # resourceVersion is too old, list again
+                logger.debug('Watch of {} failed: {}'.format(resource.kind, e))
+            if time.time() >= _deadline:
+                logger.warning('Condition of {} {} in {} is not met in {}s'.format(
+                    resource.kind, name or label_selector, namespace,
+                    timeout or self.wait_timeout))
+                return False
+
+    def wait_for_objects(self, results, timeout=None):
+        """Waits for applied objects, until rollout of workloads completes and other
+        objects observe their generation, and for deleted objects until they are gone,
+        as oc delete does. Failed results are skipped.
+        Args:
+            results: list of ObjectResult of apply_objects or delete_objects
+        """
+        def _wait(_result):
+            _resource = self._resource(kind=_result.kind, api_version=_result.api_version)
+            if _result.action == 'delete':
+                return self.wait_for_items(
+                    _resource, lambda _items: len(_items) == 0,
+                    namespace=_result.namespace, name=_result.name, timeout=timeout)
+            _condition = self._is_rolled_out if _result.kind in ROLLOUT_TYPES \
+                else self._is_observed
+            return self.wait_for_items(
+                _resource,
+                lambda _items: len(_items) == 1 and _condition(_items[0]),
+                namespace=_result.namespace, name=_result.name, timeout=timeout)
+        return all(self._map(_wait, [_result for _result in results if _result.ok]))
+
+    def wait_for_rollout(self, namespace, workload_name, workload_type='Deployment',
+                         timeout=None):
+        """ Waits until all replicas of workload are updated and available """
+        return self.wait_for_items(
+            getattr(self, WORKLOAD_TYPES[workload_type]),
+            lambda _items: len(_items) == 1 and self._is_rolled_out(_items[0]),
+            namespace=namespace, name=workload_name, timeout=timeout)
+
+    def wait_for_idle(self, namespace, service_name, timeout=None):
+        """ Waits until no pods selected by service are left, as after oc idle """
+        _selector = dict(self._service.get(namespace=namespace, name=service_name)
+                         .spec.selector or {})
+        return self.wait_for_items(
+            getattr(self, WORKLOAD_TYPES['Pod']),
+            lambda _items: len(_items) == 0,
+            namespace=namespace,
+            label_selector=','.join(['{}={}'.format(_key, _value)
+                                     for _key, _value in _selector.items()]),
+            timeout=timeout)
+
+    def wait_for_auto_injection(self, namespace, auto_injection, workload_name=None,
+                                workload_type='Deployment', timeout=None):
+        """Waits until auto injection of namespace, or of workload when its name is given,
+        is set, and until the workload is rolled out with it.
+        Args:
+            auto_injection: istio-injection label of namespace, 'enabled', 'disabled',
+                or sidecar.istio.io/inject annotation of workload, 'true', 'false',
+                None when removed
+        """
+        if workload_name is None:
+            return self.wait_for_items(
+                self._namespace,
+                lambda _items: len(_items) == 1 and dict(
+                    _items[0].metadata.labels or {}).get('istio-injection') == auto_injection,
+                name=namespace, timeout=timeout)
+
+        def _is_injection_rolled_out(_item):
+            try:
+                _annotations = dict(_item.spec.template.metadata.annotations or {})
+            except (AttributeError, TypeError):
+                _annotations = {}
+            return _annotations.get('sidecar.istio.io/inject') == auto_injection and \
+                self._is_rolled_out(_item)
+        return self.wait_for_items(
+            getattr(self, WORKLOAD_TYPES[workload_type]),
+            lambda _items: len(_items) == 1 and _is_injection_rolled_out(_items[0]),
+            namespace=namespace, name=workload_name, timeout=timeout)
+
+    def _is_rolled_out(self, item):
+        """ Returns True when all replicas of workload are updated and available """
+        _status = item.status
+        if not _status or (_status.observedGeneration or 0) < (item.metadata.generation or 0):
+            return False
+        if item.kind == 'DaemonSet':
+            return (_status.updatedNumberScheduled or 0) >= \
+                (_status.desiredNumberScheduled or 0) and \
+                (_status.numberAvailable or 0) >= (_status.desiredNumberScheduled or 0)
+        _replicas = item.spec.replicas if item.spec.replicas is not None else 1
+        _available = _status.availableReplicas if _status.availableReplicas is not None \
+            else _status.readyReplicas
+        # old replicas are terminated too
+        return (_status.updatedReplicas or 0) >= _replicas and \
+            (_available or 0) >= _replicas and \
+            (_status.replicas or 0) == _replicas
+
+    def _is_observed(self, item):
+        """ Returns True when status of object, if it has one, observed its generation """
+        if not item.status or item.status.observedGeneration is None:
+            return True
+        return int(item.status.observedGeneration) >= (item.metadata.generation or 0)
+
+    def _wait_for_write(self, resource, namespace, name, exists):
+        """Waits until the created object observes its generation, or the deleted object
+        is gone, in the cluster and in the informer of resource if there is one
+        """
+        def _is_written(_items):
+            if exists:
+                return len(_items) == 1 and self._is_observed(_items[0])
+            return len(_items) == 0
+        self.wait_for_items(resource, _is_written, namespace=namespace, name=name)
+        self._wait_for_informer(resource, namespace, name, exists)
+
+    def _wait_for_informer(self, resource, namespace, name, exists):
+        """ Waits until the write is seen by the informer of resource, if there is one """
+        _informer = self._get_informer(resource, create=False)
+        if _informer is not None and not _informer.wait_for(
+                namespace, name, exists=exists, timeout=self.informer_sync_timeout):
+            logger.warning('{} {} in {} is not {} in informer in {}s'.format(
+                resource.kind, name, namespace, 'added' if exists else 'deleted',
+                self.informer_sync_timeout))
+
     def is_auto_mtls(self):
-        return 'enableAutoMtls: true' in self._configmap.get(name='istio',
-                                                             namespace=ISTIO_SYSTEM).data.mesh
+        return self.mesh_config.enable_auto_mtls
+
+    @property
+    def mesh_config(self):
+        """Returns MeshConfig of the istio ConfigMap, parsed again only when its
+        resourceVersion changes. The ConfigMap is watched when informers are enabled,
+        otherwise it is fetched on every call. Raises NotFoundError when it does not exist.
+        """
+        _item = None
+        if self.informers:
+            _resource = self._configmap
+            with self._resources_lock:
+                if self._mesh_config_informer is None:
+                    self._mesh_config_informer = Informer(
+                        _resource, namespace=ISTIO_SYSTEM,
+                        field_selector='metadata.name=istio')
+            _informer = self._mesh_config_informer.start()
+            if not _informer.wait_for_sync(self.informer_sync_timeout):
+                raise TimeoutError('Mesh config is not synced in {}s'.format(
+                    self.informer_sync_timeout))
+            _item = _informer.get(ISTIO_SYSTEM, 'istio')
+        if _item is None:
+            # raises NotFoundError when the ConfigMap is missing
+            _item = self._configmap.get(name='istio', namespace=ISTIO_SYSTEM)
+        _resource_version = _item.metadata.resourceVersion
+        _mesh_config = self._mesh_config
+        if _mesh_config is None or _mesh_config.resource_version != _resource_version:
+            _mesh = yaml.safe_load(_item.data.mesh or '') if _item.data else None
+            _mesh_config = MeshConfig(_mesh or {}, _resource_version)
+            self._mesh_config = _mesh_config
+        return _mesh_config
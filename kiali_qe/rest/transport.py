@@ -0,0 +1,109 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats(object):
+    """ Thread safe counters of HTTP requests and opened connections """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self.handshake_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self, handshake_seconds):
+        with self._lock:
+            self.connections_opened += 1
+            self.handshake_seconds += handshake_seconds
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': max(self.requests - self.connections_opened, 0),
+                'handshake_seconds': round(self.handshake_seconds, 6),
+                'handshake_seconds_avg': round(
+                    self.handshake_seconds / self.connections_opened, 6)
+                if self.connections_opened else 0.0}
+
+
+def _timed_connection_class(base_class, stats):
+    """ Returns subclass of urllib3 connection class which records connect time in stats """
+
+    def connect(self):
+        _start = time.monotonic()
+        base_class.connect(self)
+        stats.add_connection(time.monotonic() - _start)
+
+    return type('Timed' + base_class.__name__, (base_class,), {'connect': connect})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter which records opened connections and their TCP and TLS handshake time """
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        _http_pool = type('TimedHTTPConnectionPool', (HTTPConnectionPool,), {
+            'ConnectionCls': _timed_connection_class(HTTPConnection, self.stats)})
+        _https_pool = type('TimedHTTPSConnectionPool', (HTTPSConnectionPool,), {
+            'ConnectionCls': _timed_connection_class(HTTPSConnection, self.stats)})
+        # copy, the default dictionary is shared by all pool managers
+        self.poolmanager.pool_classes_by_scheme = {'http': _http_pool, 'https': _https_pool}
+
+
+class PooledTransport(object):
+    """
+    Keep-alive HTTP transport with one shared session and a sized connection pool,
+    used instead of the new session per request of kiali-client api connector.
+
+    Args:
+        connector: kiali-client api connector, provides url, auth, cookies and verify
+        pool_size: maximum number of kept alive connections per host
+        connect_timeout: seconds to wait for connection
+        read_timeout: seconds to wait for response
+        max_retries: number of retries of failed connections
+    """
+
+    def __init__(self, connector, pool_size=10, connect_timeout=None, read_timeout=None,
+                 max_retries=0):
+        self.connector = connector
+        self.timeout = (connect_timeout, read_timeout)
+        self.stats = ConnectionStats()
+        self.session = requests.Session()
+        self.session.auth = connector.auth
+        if connector.cookies is not None:
+            self.session.cookies = connector.cookies
+        self.session.headers.update({'Content-Type': 'application/json',
+                                     'Connection': 'keep-alive'})
+        _adapter = PooledHTTPAdapter(stats=self.stats,
+                                     pool_maxsize=pool_size,
+                                     pool_block=False,
+                                     max_retries=max_retries)
+        self.session.mount('https://', _adapter)
+        self.session.mount('http://', _adapter)
+
+    def request(self, url, http_method='GET', params=None, data=None):
+        self.stats.add_request()
+        return self.session.request(method=http_method,
+                                    url=self.connector.retrieve_url(url),
+                                    params=params,
+                                    data=data,
+                                    verify=self.connector.verify,
+                                    timeout=self.timeout)
+
+    def close(self):
+        self.session.close()
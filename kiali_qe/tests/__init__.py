@@ -98,6 +98,13 @@ class AbstractListPageTest(object):
         self.openshift_client = openshift_client
         self.page = page
 
+    def _wait_for_auto_injection(self, namespace, auto_injection, workload_name=None):
+        """ Waits until auto injection changed in UI is set in the cluster """
+        # skip_oc replaces OpenShift client with Kiali client, which has no cluster access
+        if hasattr(self.openshift_client, 'wait_for_auto_injection'):
+            self.openshift_client.wait_for_auto_injection(
+                namespace, auto_injection, workload_name=workload_name)
+
     def _namespaces_ui(self):
         return self.page.namespace.items
 
@@ -762,6 +769,7 @@ class OverviewPageTest(AbstractListPageTest):
             self.page.content.select_action(
                 namespace,
                 OverviewInjectionLinks.ENABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'enabled')
             self.page.page_refresh()
             overviews_ui = self.page.content.list_items
             overview_ui = overviews_ui[0]
@@ -783,6 +791,7 @@ class OverviewPageTest(AbstractListPageTest):
             self.page.content.select_action(
                 namespace,
                 OverviewInjectionLinks.DISABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'disabled')
             self.page.page_refresh()
             overviews_ui = self.page.content.list_items
             overview_ui = overviews_ui[0]
@@ -802,12 +811,14 @@ class OverviewPageTest(AbstractListPageTest):
             self.page.content.select_action(
                 namespace,
                 OverviewInjectionLinks.ENABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'enabled')
         elif self.page.content.overview_action_present(namespace,
                                                        OverviewInjectionLinks.
                                                        REMOVE_AUTO_INJECTION.text):
             self.page.content.select_action(
                 namespace,
                 OverviewInjectionLinks.REMOVE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, None)
             self.page.page_refresh()
             overviews_ui = self.page.content.list_items
             overview_ui = overviews_ui[0]
@@ -826,6 +837,7 @@ class OverviewPageTest(AbstractListPageTest):
             self.page.content.select_action(
                 namespace,
                 OverviewInjectionLinks.ENABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'enabled')
 
     def test_create_update_delete_traffic_policies(self, namespace):
         # load the page first
@@ -1472,6 +1484,7 @@ class WorkloadsPageTest(AbstractListPageTest):
 
         if self.page.actions.is_disable_auto_injection_visible():
             self.page.actions.select(OverviewInjectionLinks.DISABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'false', workload_name=name)
             self.page.page_refresh()
             assert self.page.content._details_missing_sidecar()
             assert self.page.actions.is_enable_auto_injection_visible()
@@ -1479,6 +1492,7 @@ class WorkloadsPageTest(AbstractListPageTest):
             assert not self.page.actions.is_disable_auto_injection_visible()
         elif self.page.actions.is_remove_auto_injection_visible():
             self.page.actions.select(OverviewInjectionLinks.REMOVE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, None, workload_name=name)
             self.page.page_refresh()
             assert self.page.content._details_missing_sidecar()
             assert self.page.actions.is_enable_auto_injection_visible()
@@ -1486,6 +1500,7 @@ class WorkloadsPageTest(AbstractListPageTest):
             assert not self.page.actions.is_disable_auto_injection_visible()
         elif self.page.actions.is_enable_auto_injection_visible():
             self.page.actions.select(OverviewInjectionLinks.ENABLE_AUTO_INJECTION.text)
+            self._wait_for_auto_injection(namespace, 'true', workload_name=name)
             self.page.page_refresh()
             assert self.page.content._details_missing_sidecar()
             assert not self.page.actions.is_enable_auto_injection_visible()
@@ -2434,11 +2449,13 @@ class ValidationsTest(object):
         self._istio_config_delete(yaml_file, namespace=namespace)
 
         oc_apply(yaml_file=yaml_file,
-                 namespace=namespace)
+                 namespace=namespace,
+                 openshift_client=self.openshift_client)
 
     def _istio_config_delete(self, yaml_file, namespace):
         oc_delete(yaml_file=yaml_file,
-                  namespace=namespace)
+                  namespace=namespace,
+                  openshift_client=self.openshift_client)
 
     def test_istio_objects(self, scenario, namespace=None,
                            config_validation_objects=[],
@@ -16,6 +16,7 @@ def pytest_configure(config):
 pytest_plugins = (
     'kiali_qe.fixtures.browser',
     'kiali_qe.fixtures.log',
+    'kiali_qe.fixtures.metrics',
     'kiali_qe.fixtures.rest_client',
     'kiali_qe.fixtures.zalenium',
     'kiali_qe.fixtures.checkers'
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from kiali_qe.fake.kiali_server import FakeKialiServer
+from kiali_qe.fake.kubernetes_server import FakeKubernetesServer
+from kiali_qe.fake.mesh import SyntheticMesh, _metadata, _pod_object, _workload_object
+from kiali_qe.rest.kiali_api import KialiExtendedClient
+from kiali_qe.rest.metrics import metrics
+from kiali_qe.rest.openshift_api import WORKLOAD_TYPES, OpenshiftExtendedClient
+
+'''
+Kiali and OpenShift clients run against the local fake servers of one generated mesh,
+no cluster is needed. Lists of both clients have to match, within a bound of requests and time.
+'''
+
+NAMESPACES = 20
+WORKLOADS = 10
+# seconds of one list of the whole fake mesh, generous for slow CI machines
+LIST_TIMEOUT = 30
+
+
+@pytest.fixture(scope='module')
+def fake_mesh():
+    return SyntheticMesh(namespaces=NAMESPACES, workloads=WORKLOADS)
+
+
+@pytest.fixture(scope='module')
+def fake_kiali_client(fake_mesh):
+    with FakeKialiServer(fake_mesh) as _server:
+        yield KialiExtendedClient(hostname=_server.hostname,
+                                  scheme='http',
+                                  auth_type='no-auth',
+                                  swagger_address=_server.swagger_address)
+
+
+@pytest.fixture(scope='module')
+def fake_openshift_client(fake_mesh, tmpdir_factory):
+    with FakeKubernetesServer(fake_mesh) as _server:
+        _kubeconfig = _server.write_kubeconfig(
+            tmpdir_factory.mktemp('fake').join('kubeconfig').strpath)
+        yield OpenshiftExtendedClient(kubeconfig=_kubeconfig, cluster_wide_threshold=1)
+
+
+@pytest.mark.p_ro_top_safe
+def test_fake_workload_list(fake_mesh, fake_kiali_client, fake_openshift_client):
+    _kiali_keys, _kiali_calls = _get_list(fake_kiali_client, 'workload_list', fake_mesh)
+    _openshift_keys, _openshift_calls = _get_list(fake_openshift_client, 'workload_list',
+                                                  fake_mesh)
+    assert len(_kiali_keys) == NAMESPACES * WORKLOADS
+    assert _kiali_keys == _openshift_keys
+    # workloadList and namespaceHealth per namespace, istio-system included
+    assert _kiali_calls <= 2 * len(fake_mesh.namespaces())
+    # one cluster wide list per workload kind
+    assert _openshift_calls <= len(WORKLOAD_TYPES)
+
+
+@pytest.mark.p_ro_top_safe
+def test_fake_service_list(fake_mesh, fake_kiali_client, fake_openshift_client):
+    _kiali_keys, _ = _get_list(fake_kiali_client, 'service_list', fake_mesh)
+    _openshift_keys, _ = _get_list(fake_openshift_client, 'service_list', fake_mesh)
+    assert len(_kiali_keys) > 0
+    assert _kiali_keys == _openshift_keys
+
+
+@pytest.mark.p_ro_top_safe
+def test_fake_istio_config_list(fake_mesh, fake_kiali_client, fake_openshift_client):
+    _kiali_keys, _ = _get_list(fake_kiali_client, 'istio_config_list', fake_mesh)
+    _openshift_keys, _ = _get_list(fake_openshift_client, 'istio_config_list', fake_mesh)
+    assert len(_kiali_keys) > 0
+    assert _kiali_keys == _openshift_keys
+
+
+@pytest.mark.p_ro_top_safe
+def test_fake_workload_of_unlisted_controller(tmpdir):
+    _mesh = SyntheticMesh(namespaces=1, workloads=1)
+    # Argo Rollout is not a listed workload kind, it owns a ReplicaSet and a Pod directly
+    _rollout = {'apiVersion': 'argoproj.io/v1alpha1', 'kind': 'Rollout',
+                'metadata': _metadata('reviews-rollout', 'mesh-0')}
+    _labels = {'app': 'reviews'}
+    _replicaset = _mesh.add(_workload_object('ReplicaSet', 'apps/v1', 'mesh-0',
+                                             'reviews-rollout-7d9f8c6b5', _labels, 1, 1,
+                                             owner=_rollout))
+    _mesh.add(_pod_object('mesh-0', 'reviews-rollout-7d9f8c6b5-x2k4p', _labels, '10.0.9.1',
+                          True, ready=True, owner=_replicaset))
+    _mesh.add(_pod_object('mesh-0', 'reviews-rollout-canary-5bc4d', _labels, '10.0.9.2',
+                          True, ready=True, owner=_rollout))
+    with FakeKubernetesServer(_mesh) as _server:
+        _client = OpenshiftExtendedClient(
+            kubeconfig=_server.write_kubeconfig(tmpdir.join('kubeconfig').strpath))
+        _workloads = [_workload for _workload in _client.workload_list(namespaces=['mesh-0'])
+                      if _workload.name.startswith('reviews')]
+        assert [(_workload.name, _workload.workload_type) for _workload in _workloads] == \
+            [('reviews-rollout', 'Rollout')]
+        assert set([_pod.name for _pod in _client.get_workload_pods(
+            'mesh-0', 'reviews-rollout')]) == set(['reviews-rollout-7d9f8c6b5-x2k4p',
+                                                   'reviews-rollout-canary-5bc4d'])
+
+
+def _get_list(client, method_name, mesh):
+    """ Returns item keys of the list of all namespaces of mesh and number of its requests """
+    metrics.reset()
+    _start = time.monotonic()
+    _items = getattr(client, method_name)(namespaces=mesh.namespaces())
+    assert time.monotonic() - _start < LIST_TIMEOUT
+    _calls = sum([_endpoint['calls'] for _endpoint in metrics.to_dict().values()])
+    return _get_keys(_items), _calls
+
+
+def _get_keys(items):
+    return set([(_item.name, _item.namespace, getattr(_item, 'workload_type',
+                                                      getattr(_item, 'object_type', None)))
+                for _item in items])
@@ -43,7 +43,7 @@ def test_type_options(kiali_client, openshift_client, browser):
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_app_compact_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.APPS,
@@ -62,7 +62,7 @@ def test_all_services_compact_overviews(kiali_client, openshift_client, browser)
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_workloads_compact_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.WORKLOADS,
@@ -72,7 +72,7 @@ def test_all_workloads_compact_overviews(kiali_client, openshift_client, browser
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_app_expand_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.APPS,
@@ -91,7 +91,7 @@ def test_all_services_expand_overviews(kiali_client, openshift_client, browser):
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_workloads_expand_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.WORKLOADS,
@@ -101,7 +101,7 @@ def test_all_workloads_expand_overviews(kiali_client, openshift_client, browser)
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_app_list_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.APPS,
@@ -120,7 +120,7 @@ def test_all_services_list_overviews(kiali_client, openshift_client, browser):
 @pytest.mark.p_ro_top
 @pytest.mark.p_ro_group6
 def test_all_workloads_list_overviews(kiali_client, openshift_client, browser):
-    _idle_bookinfo()
+    _idle_bookinfo(openshift_client)
     tests = OverviewPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
     tests.assert_all_items(filters=[], overview_type=OverviewPageType.WORKLOADS,
@@ -231,5 +231,5 @@ def test_filter_overviews_by_mtlsstatus_disabled(kiali_client, openshift_client,
         {"name": OverviewPageFilter.MTLS_STATUS.text, "value": OverviewMTSLStatus.DISABLED.text}])
 
 
-def _idle_bookinfo():
-    oc_idle('mysqldb', 'bookinfo')
+def _idle_bookinfo(openshift_client):
+    oc_idle('mysqldb', 'bookinfo', openshift_client=openshift_client)
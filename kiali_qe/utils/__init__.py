@@ -28,6 +28,20 @@ def get_yaml(path, yaml_file):
         return yaml.safe_load(yaml_data)
 
 
+def get_yaml_objects(yaml_file):
+    """ Returns objects of all documents of yaml_file, items of List documents included """
+    objects = []
+    with open(yaml_file, 'r') as yaml_data:
+        for _document in yaml.safe_load_all(yaml_data):
+            if not _document:
+                continue
+            if _document.get('kind', '').endswith('List') and 'items' in _document:
+                objects.extend(_document['items'])
+            else:
+                objects.append(_document)
+    return objects
+
+
 def get_yaml_path(path, yaml_file):
     return os.path.join(path, yaml_file)
 
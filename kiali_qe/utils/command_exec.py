@@ -1,7 +1,15 @@
 import os
 
 
-def oc_apply(yaml_file, namespace):
+def oc_apply(yaml_file, namespace, openshift_client=None):
+    """ Applies yaml_file, in process when openshift_client is given, else with oc CLI.
+    In process apply waits until workloads are rolled out and configs are observed.
+    Returns True when all objects are created or configured.
+    """
+    if _is_openshift_client(openshift_client):
+        _results = openshift_client.apply_yaml(yaml_file, namespace=namespace)
+        openshift_client.wait_for_objects(_results)
+        return _all_ok(_results)
     add_command_text = "oc apply " + (
         " -n " + namespace if namespace else ""
         ) + " -f " + yaml_file
@@ -10,7 +18,15 @@ def oc_apply(yaml_file, namespace):
         or add_command_result.__contains__("configured")
 
 
-def oc_delete(yaml_file, namespace):
+def oc_delete(yaml_file, namespace, openshift_client=None):
+    """ Deletes yaml_file, in process when openshift_client is given, else with oc CLI.
+    In process delete waits until the objects are gone, as oc delete does.
+    Returns True when all objects are deleted.
+    """
+    if _is_openshift_client(openshift_client):
+        _results = openshift_client.delete_yaml(yaml_file, namespace=namespace)
+        openshift_client.wait_for_objects(_results)
+        return _all_ok(_results)
     delete_command_text = "oc delete " + (
         " -n " + namespace if namespace else ""
         ) + " -f " + yaml_file
@@ -18,6 +34,18 @@ def oc_delete(yaml_file, namespace):
     return delete_command_result.__contains__("deleted")
 
 
-def oc_idle(service_name, namespace):
+def oc_idle(service_name, namespace, openshift_client=None):
+    """ Idles service, waits until its pods are gone when openshift_client is given """
     idle_command_text = "oc idle {} -n {}".format(service_name, namespace)
     os.popen(idle_command_text).read()
+    if _is_openshift_client(openshift_client):
+        openshift_client.wait_for_idle(namespace, service_name)
+
+
+def _is_openshift_client(openshift_client):
+    # skip_oc replaces OpenShift client with Kiali client, which has no cluster access
+    return openshift_client is not None and hasattr(openshift_client, 'apply_yaml')
+
+
+def _all_ok(results):
+    return all([_result.ok for _result in results])
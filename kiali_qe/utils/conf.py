@@ -6,10 +6,16 @@ from kiali_qe.utils.path import conf_path
 # overide with environment variables
 _env_override_list = {
         'kiali.hostname': 'KIALI_HOSTNAME',
+        'kiali.scheme': 'KIALI_SCHEME',
         'kiali.username': 'KIALI_USERNAME',
         'kiali.password': 'KIALI_PASSWORD',
         'kiali.auth_type': 'KIALI_AUTH_TYPE',
         'kiali.token': 'KIALI_TOKEN',
+        'kiali.swagger_address': 'KIALI_SWAGGER_ADDRESS',
+        'kiali.workers': 'KIALI_WORKERS',
+        'openshift.workers': 'OPENSHIFT_WORKERS',
+        'openshift.page_size': 'OPENSHIFT_PAGE_SIZE',
+        'cassette.mode': 'KIALI_CASSETTE_MODE',
         'selenium.web_driver': 'SELENIUM_WEB_DRIVER',
         'selenium.capabilities.platform': 'SELENIUM_PLATFORM',
         'selenium.capabilities.browser': 'SELENIUM_BROWESR',